@@ -0,0 +1,45 @@
+"""
+Measures the overhead of the `ivy.Array` wrapper: the time taken to wrap a native
+array, the per-instance memory footprint, and a chain of elementwise operations
+which creates a new `ivy.Array` for every intermediate result.
+
+Usage: python -m benchmarks.bench_array [backend] [num_calls]
+"""
+
+# global
+import sys
+import timeit
+import tracemalloc
+
+# local
+import ivy
+
+
+def _chain(x, num_ops):
+    for _ in range(num_ops):
+        x = x * 1.0001 + 0.0001
+    return x
+
+
+def main(backend_str="numpy", num_calls=10000):
+    ivy.set_backend(backend_str)
+    native = ivy.native_array([0.1, 0.2, 0.3])
+    construct_time = timeit.timeit(lambda: ivy.Array(native), number=num_calls)
+    print(
+        "backend: {}, construction: {:.2f} us".format(
+            backend_str, construct_time / num_calls * 1e6
+        )
+    )
+    tracemalloc.start()
+    arrays = [ivy.Array(native) for _ in range(num_calls)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("memory per instance: {:.1f} bytes".format(size / len(arrays)))
+    x = ivy.array([0.1, 0.2, 0.3])
+    chain_time = timeit.timeit(lambda: _chain(x, 1000), number=10)
+    print("1000 op elementwise chain: {:.2f} ms".format(chain_time / 10 * 1e3))
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(v) for v in sys.argv[2:3]])
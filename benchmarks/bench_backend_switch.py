@@ -0,0 +1,39 @@
+"""
+Measures the latency of switching between backends with `ivy.set_backend` and
+`ivy.unset_backend`, for the first (uncached) and for subsequent switches.
+
+Usage: python -m benchmarks.bench_backend_switch [backend,backend,...] [num_switches]
+"""
+
+# global
+import sys
+import time
+
+# local
+import ivy
+
+
+def main(backend_strs="numpy", num_switches=1000):
+    backend_strs = backend_strs.split(",")
+    for backend_str in backend_strs:
+        start = time.perf_counter()
+        ivy.set_backend(backend_str)
+        ivy.unset_backend()
+        print(
+            "{:<12} first switch: {:>10.2f} ms".format(
+                backend_str, (time.perf_counter() - start) * 1e3
+            )
+        )
+    start = time.perf_counter()
+    for i in range(num_switches):
+        ivy.set_backend(backend_strs[i % len(backend_strs)])
+        ivy.unset_backend()
+    print(
+        "cached switch (set + unset): {:>10.2f} us".format(
+            (time.perf_counter() - start) / num_switches * 1e6
+        )
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(v) for v in sys.argv[2:3]])
@@ -0,0 +1,61 @@
+"""
+Measures the traversal overhead of `ivy.Container` on a container with many small
+leaves, resembling the parameters of a deep network. Each of the timed methods
+repeatedly walks the same, unchanged structure, which is served from the cached
+container structure after the first call. Finally, an elementwise update of every
+leaf is compared against the same update applied once to a flat buffer backing the
+leaves.
+
+Usage: python -m benchmarks.bench_container [backend] [num_layers]
+"""
+
+# global
+import sys
+import timeit
+
+# local
+import ivy
+
+
+def main(backend_str="numpy", num_layers=200):
+    ivy.set_backend(backend_str)
+    leaf = ivy.array([1.0])
+    cont = ivy.Container(
+        {
+            "layer{}".format(i): {
+                "sub{}".format(j): {"w": leaf, "b": leaf} for j in range(5)
+            }
+            for i in range(num_layers)
+        }
+    )
+    other = cont.cont_copy()
+    flat = cont.cont_to_flat_list()
+    print("backend: {}, num leaves: {}".format(backend_str, len(flat)))
+    for name, fn in [
+        ("cont_to_flat_list", lambda: cont.cont_to_flat_list()),
+        ("cont_all_key_chains", lambda: cont.cont_all_key_chains()),
+        ("cont_from_flat_list", lambda: cont.cont_from_flat_list(list(flat))),
+        ("cont_map", lambda: cont.cont_map(lambda x, _: x)),
+        (
+            "cont_multi_map",
+            lambda: ivy.Container.cont_multi_map(lambda xs, _: xs[0], [cont, cont]),
+        ),
+        (
+            "cont_identical_structure",
+            lambda: ivy.Container.cont_identical_structure([cont, other]),
+        ),
+    ]:
+        elapsed = timeit.timeit(fn, number=10) / 10
+        print("{}: {:.3f} ms".format(name, elapsed * 1e3))
+    buffer = cont.cont_to_flat_buffer(inplace=True)
+    for name, fn in [
+        ("per-leaf update", lambda: cont.cont_map(lambda x, _: x * 0.99)),
+        ("flat buffer update", lambda: buffer * 0.99),
+    ]:
+        elapsed = timeit.timeit(fn, number=10) / 10
+        print("{}: {:.3f} ms".format(name, elapsed * 1e3))
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(v) for v in sys.argv[2:3]])
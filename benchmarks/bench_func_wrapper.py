@@ -0,0 +1,77 @@
+"""
+Compares the per-call overhead of the fused dispatcher generated by
+`ivy.func_wrapper._fused_dispatcher` against the stacked decorator chain.
+
+Usage: python -m benchmarks.bench_func_wrapper [backend] [num_calls]
+"""
+
+# global
+import sys
+import timeit
+
+# local
+import ivy
+from ivy.func_wrapper import (
+    FN_DECORATORS,
+    _FUSABLE_DECORATORS,
+    _fused_dispatcher,
+    _stack_decorators,
+)
+
+
+def _wrappers(fn_name, backend):
+    original = ivy.backend_handler.ivy_original_dict[fn_name]
+    backend_fn = backend.__dict__[fn_name]
+    decorators = [
+        attr
+        for attr in FN_DECORATORS
+        if hasattr(original, attr) and not hasattr(backend_fn, attr)
+    ]
+    assert all(attr in _FUSABLE_DECORATORS for attr in decorators)
+    return (
+        _stack_decorators(backend_fn, decorators),
+        _fused_dispatcher(backend_fn, decorators),
+    )
+
+
+def main(backend_str="numpy", num_calls=100000):
+    ivy.set_backend(backend_str)
+    backend = ivy.current_backend()
+    x = ivy.array([1.0, 2.0, 3.0])
+    y = ivy.array([4.0, 5.0, 6.0])
+    native = ivy.to_native(x)
+    # function name: (args, extra keyword arguments for the raw backend kernel)
+    cases = {
+        "add": ((x, y), {}),
+        "abs": ((x,), {}),
+        "sum": ((x,), {}),
+        "zeros_like": ((x,), {"dtype": native.dtype, "device": ivy.dev(native)}),
+    }
+    print("backend: {}, calls: {}".format(backend_str, num_calls))
+    print(
+        "{:<12}{:>14}{:>14}{:>14}{:>10}".format(
+            "function", "kernel (us)", "stacked (us)", "fused (us)", "speedup"
+        )
+    )
+    for fn_name, (args, kernel_kwargs) in cases.items():
+        stacked, fused = _wrappers(fn_name, backend)
+        native_args = [native if ivy.is_ivy_array(a) else a for a in args]
+        kernel_fn = backend.__dict__[fn_name]
+        times = [
+            timeit.timeit(lambda: f(*a, **kw), number=num_calls) / num_calls * 1e6
+            for f, a, kw in [
+                (kernel_fn, native_args, kernel_kwargs),
+                (stacked, args, {}),
+                (fused, args, {}),
+            ]
+        ]
+        print(
+            "{:<12}{:>14.2f}{:>14.2f}{:>14.2f}{:>9.2f}x".format(
+                fn_name, *times, times[1] / times[2]
+            )
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(v) for v in sys.argv[2:3]])
@@ -0,0 +1,76 @@
+"""
+Measures the cost of the container check performed by `handle_nestable` across the
+elementwise functions in `ivy/functional/ivy/elementwise.py`, comparing the full
+`ivy.nested_any` traversal with the fast `_nest_has_container` check, alongside the
+total per-call time of each function.
+
+Usage: python -m benchmarks.bench_nestable [backend] [num_calls]
+"""
+
+# global
+import contextlib
+import inspect
+import io
+import sys
+import timeit
+import warnings
+
+# local
+import ivy
+from ivy.func_wrapper import _nest_has_container
+from ivy.functional.ivy import elementwise
+
+
+def _nested_any_check(args, kwargs):
+    return ivy.nested_any(
+        args, ivy.is_ivy_container, check_nests=True
+    ) or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+
+
+def _fast_check(args, kwargs):
+    return _nest_has_container(args) or _nest_has_container(kwargs)
+
+
+def main(backend_str="numpy", num_calls=1000):
+    # invalid values for some functions are irrelevant for timing
+    warnings.simplefilter("ignore")
+    ivy.set_backend(backend_str)
+    x = ivy.array([0.1, 0.2, 0.3])
+    totals = [0.0, 0.0, 0.0]
+    num_fns = 0
+    for fn_name, fn in inspect.getmembers(elementwise, inspect.isfunction):
+        if not hasattr(fn, "handle_nestable") or fn_name.startswith("_"):
+            continue
+        num_positional = len(
+            [
+                p
+                for p in inspect.signature(fn).parameters.values()
+                if p.kind == p.POSITIONAL_ONLY
+            ]
+        )
+        args = (x,) * num_positional
+        # skip the functions which do not support float inputs
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                ivy.__dict__[fn_name](*args)
+        except Exception:
+            continue
+        times = [
+            timeit.timeit(lambda: f(*a), number=num_calls) / num_calls * 1e6
+            for f, a in [
+                (ivy.__dict__[fn_name], args),
+                (_nested_any_check, (args, {})),
+                (_fast_check, (args, {})),
+            ]
+        ]
+        totals = [t + v for t, v in zip(totals, times)]
+        num_fns += 1
+    print("backend: {}, functions: {}".format(backend_str, num_fns))
+    print("mean call time:           {:>8.2f} us".format(totals[0] / num_fns))
+    print("mean nested_any check:    {:>8.2f} us".format(totals[1] / num_fns))
+    print("mean fast container check:{:>8.2f} us".format(totals[2] / num_fns))
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(v) for v in sys.argv[2:3]])
@@ -0,0 +1,47 @@
+"""
+Evaluates the polynomial 3x^3 + 2x^2 + x + 1 with Horner's method on many small
+arrays, once through the `ivy.Array` operators (which take the backend fast path)
+and once through the fully wrapped ivy functions `ivy.multiply` and `ivy.add`. The
+coefficients are arrays, so that the timings are not dominated by the conversion of
+python scalars during type promotion.
+
+Usage: python -m benchmarks.bench_operators [backend] [num_arrays]
+"""
+
+# global
+import sys
+import time
+
+# local
+import ivy
+
+
+def _poly_operators(x, c):
+    return ((c[3] * x + c[2]) * x + c[1]) * x + c[0]
+
+
+def _poly_functions(x, c):
+    ret = ivy.add(ivy.multiply(c[3], x), c[2])
+    ret = ivy.add(ivy.multiply(ret, x), c[1])
+    return ivy.add(ivy.multiply(ret, x), c[0])
+
+
+def main(backend_str="numpy", num_arrays=100000):
+    ivy.set_backend(backend_str)
+    arrays = [ivy.random_uniform(shape=(4,)) for _ in range(num_arrays)]
+    coeffs = [ivy.full((4,), v, dtype=arrays[0].dtype) for v in (1.0, 1.0, 2.0, 3.0)]
+    for name, poly in [("operators", _poly_operators), ("functions", _poly_functions)]:
+        start = time.perf_counter()
+        for x in arrays:
+            poly(x, coeffs)
+        elapsed = time.perf_counter() - start
+        print(
+            "backend: {}, {}: {:.3f} s total, {:.2f} us per op".format(
+                backend_str, name, elapsed, elapsed / (num_arrays * 6) * 1e6
+            )
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(v) for v in sys.argv[2:3]])
@@ -676,6 +676,7 @@ from .backend_handler import (
     backend_stack,
     choose_random_backend,
     clear_backend_stack,
+    using_backend,
 )
 from .func_wrapper import *
 from . import assertions, backend_handler, func_wrapper, exceptions
@@ -1059,3 +1060,7 @@ def unset_nan_policy():
     global nan_policy_stack
     if nan_policy_stack:
         nan_policy_stack.pop(-1)
+
+
+# the namespace is only complete now, after any backend set from IVY_BACKEND above
+backend_handler._ivy_dict_modified()
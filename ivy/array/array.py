@@ -31,6 +31,26 @@ from .utility import ArrayWithUtility
 from .experimental import *
 
 
+_NO_FAST_PATH = object()
+
+
+def _fast_path_arg(x, array):
+    """Returns the native form of operand `x` of `array` for the operator fast path."""
+    if x is array._data or type(x) in (int, float, bool):
+        return x
+    if type(x) is Array and x.backend == array.backend:
+        return x._data
+    return _NO_FAST_PATH
+
+
+def _array_from_numpy(data, backend):
+    """Rebuilds an array of `backend` pickled as the numpy array `data`, sharing the
+    memory of `data` whenever the backend allows it."""
+    ret = Array.__new__(Array)
+    ret._init(ivy.as_backend(data, backend)[0], backend=backend)
+    return ret
+
+
 class Array(
     ArrayWithActivations,
     ArrayWithCreation,
@@ -72,69 +92,49 @@ class Array(
     ArrayWithStatisticalExperimental,
     ArrayWithUtilityExperimental,
 ):
+    __slots__ = (
+        "_data",
+        "_shape",
+        "_size",
+        "_dtype",
+        "_device",
+        "_post_repr",
+        "backend",
+        "__weakref__",
+    )
+
+    _pre_repr = "ivy."
+
     def __init__(self, data):
-        ArrayWithActivations.__init__(self)
-        ArrayWithCreation.__init__(self)
-        ArrayWithDataTypes.__init__(self)
-        ArrayWithDevice.__init__(self)
-        ArrayWithElementwise.__init__(self)
-        ArrayWithGeneral.__init__(self)
-        ArrayWithGradients.__init__(self)
-        ArrayWithImage.__init__(self)
-        ArrayWithLayers.__init__(self)
-        ArrayWithLinearAlgebra.__init__(self)
-        ArrayWithLosses.__init__(self)
-        ArrayWithManipulation.__init__(self)
-        ArrayWithNorms.__init__(self)
-        ArrayWithRandom.__init__(self)
-        ArrayWithSearching.__init__(self)
-        ArrayWithSet.__init__(self)
-        ArrayWithSorting.__init__(self)
-        ArrayWithStatistical.__init__(self)
-        ArrayWithUtility.__init__(self)
-        ArrayWithActivationsExperimental.__init__(self),
-        ArrayWithConversionsExperimental.__init__(self),
-        ArrayWithCreationExperimental.__init__(self),
-        ArrayWithData_typeExperimental.__init__(self),
-        ArrayWithDeviceExperimental.__init__(self),
-        ArrayWithElementWiseExperimental.__init__(self),
-        ArrayWithGeneralExperimental.__init__(self),
-        ArrayWithGradientsExperimental.__init__(self),
-        ArrayWithImageExperimental.__init__(self),
-        ArrayWithLayersExperimental.__init__(self),
-        ArrayWithLinearAlgebraExperimental.__init__(self),
-        ArrayWithLossesExperimental.__init__(self),
-        ArrayWithManipulationExperimental.__init__(self),
-        ArrayWithNormsExperimental.__init__(self),
-        ArrayWithRandomExperimental.__init__(self),
-        ArrayWithSearchingExperimental.__init__(self),
-        ArrayWithSetExperimental.__init__(self),
-        ArrayWithSortingExperimental.__init__(self),
-        ArrayWithStatisticalExperimental.__init__(self),
-        ArrayWithUtilityExperimental.__init__(self),
         self._init(data)
 
-    def _init(self, data):
+    def _init(self, data, *, backend=None):
+        # `backend` is the name of the backend of a native `data`, for wrapping
+        # arrays of a backend other than the current one
         if ivy.is_ivy_array(data):
             self._data = data.data
         else:
+            is_native_array = (
+                ivy.is_native_array
+                if backend is None
+                else ivy.get_backend(backend).is_native_array
+            )
             ivy.assertions.check_true(
-                ivy.is_native_array(data), "data must be native array"
+                is_native_array(data), "data must be native array"
             )
             self._data = data
         self._shape = self._data.shape
-        self._size = (
-            functools.reduce(mul, self._data.shape) if len(self._data.shape) > 0 else 0
-        )
-        self._dtype = ivy.dtype(self._data)
-        self._device = ivy.dev(self._data)
-        self._dev_str = ivy.as_ivy_dev(self._device)
-        self._pre_repr = "ivy."
-        if "gpu" in self._dev_str:
-            self._post_repr = ", dev={})".format(self._dev_str)
-        else:
-            self._post_repr = ")"
-        self.backend = ivy.current_backend_str()
+        # the remaining metadata is only computed when first requested
+        self._size = None
+        self._dtype = None
+        self._device = None
+        self._post_repr = None
+        self.backend = ivy.current_backend_str() if backend is None else backend
+
+    def _backend_module(self):
+        # the metadata is computed lazily, possibly after the backend was changed,
+        # so it is computed by the backend which created the array
+        return ivy.get_backend(self.backend) if self.backend else ivy.current_backend()
 
     # Properties #
     # ---------- #
@@ -147,11 +147,15 @@ class Array(
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements"""
+        if self._dtype is None:
+            self._dtype = self._backend_module().dtype(self._data)
         return self._dtype
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
+        if self._device is None:
+            self._device = self._backend_module().dev(self._data)
         return self._device
 
     @property
@@ -183,6 +187,10 @@ class Array(
     @property
     def size(self) -> Optional[int]:
         """Number of elements in the array."""
+        if self._size is None:
+            self._size = (
+                functools.reduce(mul, self._shape) if len(self._shape) > 0 else 0
+            )
         return self._size
 
     @property
@@ -239,11 +247,15 @@ class Array(
     def __repr__(self):
         sig_fig = ivy.array_significant_figures()
         dec_vals = ivy.array_decimal_values()
-        backend = (
-            ivy.get_backend(self.backend) if self.backend else ivy.current_backend()
-        )
+        backend = self._backend_module()
         arr_np = backend.to_numpy(self._data)
-        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self._size > 0 else np.array(arr_np)
+        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self.size > 0 else np.array(arr_np)
+        if self._post_repr is None:
+            dev_str = backend.as_ivy_dev(self.device)
+            if "gpu" in dev_str:
+                self._post_repr = ", dev={})".format(dev_str)
+            else:
+                self._post_repr = ")"
         with np.printoptions(precision=dec_vals):
             return (
                 self._pre_repr
@@ -269,7 +281,7 @@ class Array(
             self._data.__setitem__(query, val)
         except (AttributeError, TypeError):
             self._data = ivy.scatter_nd(query, val, reduction="replace", out=self)._data
-            self._dtype = ivy.dtype(self._data)
+            self._dtype = None
 
     def __contains__(self, key):
         return self._data.__contains__(key)
@@ -286,23 +298,57 @@ class Array(
 
         return data_dict
 
+    def __reduce_ex__(self, protocol):
+        # with pickle protocol 5, arrays on the cpu are pickled as numpy arrays, whose
+        # buffers can be passed out-of-band, and which are wrapped again without
+        # copying when unpickled
+        if protocol < 5 or not self.backend or ivy.as_ivy_dev(self.device) != "cpu":
+            return super().__reduce_ex__(protocol)
+        return _array_from_numpy, (ivy.as_backend(self._data, "numpy")[0], self.backend)
+
     def __setstate__(self, state):
         # we can construct other details of ivy.Array
         # just by re-creating the ivy.Array using the native array
 
-        # get the required backend
-        ivy.set_backend(state["backend"]) if state["backend"] is not None and len(
-            state["backend"]
-        ) > 0 else ivy.current_backend(state["data"])
-        ivy_array = ivy.array(state["data"])
-        ivy.unset_backend()
-
-        self.__dict__ = ivy_array.__dict__
+        # the array is wrapped for the backend which created it, without changing
+        # the global backend
+        self._init(state["data"], backend=state["backend"] or None)
 
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
         # backend.to_device(self, device)
 
+    def _binary_op(self, fn_name, x1, x2):
+        """
+        Calls the backend implementation of `fn_name` directly when both operands
+        are ivy arrays of the current backend (or python scalars), skipping the
+        wrapping of the ivy function. Falls back to the fully wrapped ivy function
+        in all other cases, so that containers and mixed backends are handled
+        exactly as before. Errors raised by the backend are not retried, and are
+        re-raised as the same ivy exceptions the wrapped function would raise.
+        """
+        # arrays created without any backend set never take the fast path
+        backend = ivy.current_backend() if self.backend else None
+        if (
+            backend is not None
+            and backend.backend == self.backend
+            and ivy.get_array_mode()
+        ):
+            fn = backend.__dict__.get(fn_name)
+            arg1, arg2 = _fast_path_arg(x1, self), _fast_path_arg(x2, self)
+            if (
+                fn is not None
+                and arg1 is not _NO_FAST_PATH
+                and arg2 is not _NO_FAST_PATH
+            ):
+                try:
+                    return Array(fn(arg1, arg2))
+                except (IndexError, ValueError, AttributeError) as e:
+                    raise ivy.exceptions.IvyError(fn_name, str(e))
+                except Exception as e:
+                    raise ivy.exceptions.IvyBackendException(fn_name, str(e))
+        return ivy.__dict__[fn_name](x1, x2)
+
     def __pos__(self):
         return ivy.positive(self._data)
 
@@ -344,13 +390,13 @@ class Array(
         ivy.array([ 1.69678056,  8.59876156, 37.82660675])
 
         """
-        return ivy.pow(self._data, power)
+        return self._binary_op("pow", self._data, power)
 
     def __rpow__(self, power):
-        return ivy.pow(power, self._data)
+        return self._binary_op("pow", power, self._data)
 
     def __ipow__(self, power):
-        return ivy.pow(self._data, power)
+        return self._binary_op("pow", self._data, power)
 
     def __add__(self, other):
         """
@@ -380,7 +426,7 @@ class Array(
         >>> print(z)
         ivy.array([5, 7, 9])
         """
-        return ivy.add(self._data, other)
+        return self._binary_op("add", self._data, other)
 
     def __radd__(self, other):
         """
@@ -410,10 +456,10 @@ class Array(
         >>> print(z)
         ivy.array([5, 6, 7])
         """
-        return ivy.add(other, self._data)
+        return self._binary_op("add", other, self._data)
 
     def __iadd__(self, other):
-        return ivy.add(self._data, other)
+        return self._binary_op("add", self._data, other)
 
     def __sub__(self, other):
         """
@@ -445,7 +491,7 @@ class Array(
         >>> print(z)
         ivy.array([-3, -3, -3])
         """
-        return ivy.subtract(self._data, other)
+        return self._binary_op("subtract", self._data, other)
 
     def __rsub__(self, other):
         """
@@ -475,28 +521,28 @@ class Array(
         >>> print(z)
         ivy.array([-3, -4, -5])
         """
-        return ivy.subtract(other, self._data)
+        return self._binary_op("subtract", other, self._data)
 
     def __isub__(self, other):
-        return ivy.subtract(self._data, other)
+        return self._binary_op("subtract", self._data, other)
 
     def __mul__(self, other):
-        return ivy.multiply(self._data, other)
+        return self._binary_op("multiply", self._data, other)
 
     def __rmul__(self, other):
-        return ivy.multiply(other, self._data)
+        return self._binary_op("multiply", other, self._data)
 
     def __imul__(self, other):
-        return ivy.multiply(self._data, other)
+        return self._binary_op("multiply", self._data, other)
 
     def __mod__(self, other):
-        return ivy.remainder(self._data, other)
+        return self._binary_op("remainder", self._data, other)
 
     def __rmod__(self, other):
-        return ivy.remainder(other, self._data)
+        return self._binary_op("remainder", other, self._data)
 
     def __imod__(self, other):
-        return ivy.remainder(self._data, other)
+        return self._binary_op("remainder", self._data, other)
 
     def __divmod__(self, other):
         return tuple([ivy.divide(self._data, other), ivy.remainder(self._data, other)])
@@ -532,31 +578,31 @@ class Array(
         >>> print(z)
         ivy.array([0.25      , 0.40000001, 0.5       ])
         """
-        return ivy.divide(self._data, other)
+        return self._binary_op("divide", self._data, other)
 
     def __rtruediv__(self, other):
-        return ivy.divide(other, self._data)
+        return self._binary_op("divide", other, self._data)
 
     def __itruediv__(self, other):
-        return ivy.divide(self._data, other)
+        return self._binary_op("divide", self._data, other)
 
     def __floordiv__(self, other):
-        return ivy.floor_divide(self._data, other)
+        return self._binary_op("floor_divide", self._data, other)
 
     def __rfloordiv__(self, other):
-        return ivy.floor_divide(other, self._data)
+        return self._binary_op("floor_divide", other, self._data)
 
     def __ifloordiv__(self, other):
-        return ivy.floor_divide(self._data, other)
+        return self._binary_op("floor_divide", self._data, other)
 
     def __matmul__(self, other):
-        return ivy.matmul(self._data, other)
+        return self._binary_op("matmul", self._data, other)
 
     def __rmatmul__(self, other):
-        return ivy.matmul(other, self._data)
+        return self._binary_op("matmul", other, self._data)
 
     def __imatmul__(self, other):
-        return ivy.matmul(self._data, other)
+        return self._binary_op("matmul", self._data, other)
 
     def __abs__(self):
         """
@@ -643,7 +689,7 @@ class Array(
         >>> print(z)
         ivy.array([ False, True, False])
         """
-        return ivy.less(self._data, other)
+        return self._binary_op("less", self._data, other)
 
     def __le__(self, other):
         """
@@ -673,7 +719,7 @@ class Array(
         >>> print(z)
         ivy.array([ False, True, True])
         """
-        return ivy.less_equal(self._data, other)
+        return self._binary_op("less_equal", self._data, other)
 
     def __eq__(self, other):
         """
@@ -711,7 +757,7 @@ class Array(
         >>> print(y)
         ivy.array([False, False, False, False])
         """
-        return ivy.equal(self._data, other)
+        return self._binary_op("equal", self._data, other)
 
     def __ne__(self, other):
         """
@@ -749,7 +795,7 @@ class Array(
         >>> print(y)
         ivy.array([True, True, True, True])
         """
-        return ivy.not_equal(self._data, other)
+        return self._binary_op("not_equal", self._data, other)
 
     def __gt__(self, other):
         """
@@ -796,7 +842,7 @@ class Array(
                           [False, False, False]])
         }
         """
-        return ivy.greater(self._data, other)
+        return self._binary_op("greater", self._data, other)
 
     def __ge__(self, other):
         """
@@ -843,25 +889,25 @@ class Array(
                           [False, False, False]])
         }
         """
-        return ivy.greater_equal(self._data, other)
+        return self._binary_op("greater_equal", self._data, other)
 
     def __and__(self, other):
-        return ivy.bitwise_and(self._data, other)
+        return self._binary_op("bitwise_and", self._data, other)
 
     def __rand__(self, other):
-        return ivy.bitwise_and(other, self._data)
+        return self._binary_op("bitwise_and", other, self._data)
 
     def __iand__(self, other):
-        return ivy.bitwise_and(self._data, other)
+        return self._binary_op("bitwise_and", self._data, other)
 
     def __or__(self, other):
-        return ivy.bitwise_or(self._data, other)
+        return self._binary_op("bitwise_or", self._data, other)
 
     def __ror__(self, other):
-        return ivy.bitwise_or(other, self._data)
+        return self._binary_op("bitwise_or", other, self._data)
 
     def __ior__(self, other):
-        return ivy.bitwise_or(self._data, other)
+        return self._binary_op("bitwise_or", self._data, other)
 
     def __invert__(self):
         return ivy.bitwise_invert(self._data)
@@ -907,22 +953,22 @@ class Array(
         >>> print(z)
         {a: ivy.array([-79, 24])}
         """
-        return ivy.bitwise_xor(self._data, other)
+        return self._binary_op("bitwise_xor", self._data, other)
 
     def __rxor__(self, other):
-        return ivy.bitwise_xor(other, self._data)
+        return self._binary_op("bitwise_xor", other, self._data)
 
     def __ixor__(self, other):
-        return ivy.bitwise_xor(self._data, other)
+        return self._binary_op("bitwise_xor", self._data, other)
 
     def __lshift__(self, other):
-        return ivy.bitwise_left_shift(self._data, other)
+        return self._binary_op("bitwise_left_shift", self._data, other)
 
     def __rlshift__(self, other):
-        return ivy.bitwise_left_shift(other, self._data)
+        return self._binary_op("bitwise_left_shift", other, self._data)
 
     def __ilshift__(self, other):
-        return ivy.bitwise_left_shift(self._data, other)
+        return self._binary_op("bitwise_left_shift", self._data, other)
 
     def __rshift__(self, other):
         """
@@ -955,7 +1001,7 @@ class Array(
         >>> print(y)
         ivy.array([2, 1, 1])
         """
-        return ivy.bitwise_right_shift(self._data, other)
+        return self._binary_op("bitwise_right_shift", self._data, other)
 
     def __rrshift__(self, other):
         """
@@ -986,10 +1032,10 @@ class Array(
         >>> print(y)
         ivy.array([32, 16,  8])
         """
-        return ivy.bitwise_right_shift(other, self._data)
+        return self._binary_op("bitwise_right_shift", other, self._data)
 
     def __irshift__(self, other):
-        return ivy.bitwise_right_shift(self._data, other)
+        return self._binary_op("bitwise_right_shift", self._data, other)
 
     def __deepcopy__(self, memodict={}):
         try:
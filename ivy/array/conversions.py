@@ -62,7 +62,8 @@ def to_ivy(
         the input in its native framework form in the case of ivy.Array or instances.
     """
     if nested:
-        return ivy.nested_map(x, _to_ivy, include_derived, shallow=False)
+        leaves, tree_def = ivy.tree_flatten(x, include_derived=include_derived)
+        return ivy.tree_unflatten(tree_def, [_to_ivy(leaf) for leaf in leaves])
     return _to_ivy(x)
 
 
@@ -91,9 +92,8 @@ def args_to_ivy(
         instances.
 
     """
-    native_args = ivy.nested_map(args, _to_ivy, include_derived, shallow=False)
-    native_kwargs = ivy.nested_map(kwargs, _to_ivy, include_derived, shallow=False)
-    return native_args, native_kwargs
+    leaves, tree_def = ivy.tree_flatten((args, kwargs), include_derived=include_derived)
+    return ivy.tree_unflatten(tree_def, [_to_ivy(leaf) for leaf in leaves])
 
 
 def to_native(
@@ -127,11 +127,9 @@ def to_native(
         the input in its native framework form in the case of ivy.Array instances.
     """
     if nested:
-        return ivy.nested_map(
-            x,
-            lambda x: _to_native(x, inplace=cont_inplace),
-            include_derived,
-            shallow=False,
+        leaves, tree_def = ivy.tree_flatten(x, include_derived=include_derived)
+        return ivy.tree_unflatten(
+            tree_def, [_to_native(leaf, inplace=cont_inplace) for leaf in leaves]
         )
     return _to_native(x, inplace=cont_inplace)
 
@@ -165,16 +163,8 @@ def args_to_native(
         native form.
 
     """
-    native_args = ivy.nested_map(
-        args,
-        lambda x: _to_native(x, inplace=cont_inplace),
-        include_derived,
-        shallow=False,
+    # args and kwargs are flattened together, in a single traversal
+    leaves, tree_def = ivy.tree_flatten((args, kwargs), include_derived=include_derived)
+    return ivy.tree_unflatten(
+        tree_def, [_to_native(leaf, inplace=cont_inplace) for leaf in leaves]
     )
-    native_kwargs = ivy.nested_map(
-        kwargs,
-        lambda x: _to_native(x, inplace=cont_inplace),
-        include_derived,
-        shallow=False,
-    )
-    return native_args, native_kwargs
@@ -12,6 +12,8 @@ import ivy
 
 
 class ArrayWithCreation(abc.ABC):
+    __slots__ = ()
+
     def asarray(
         self: ivy.Array,
         /,
@@ -345,6 +347,32 @@ class ArrayWithCreation(abc.ABC):
         """
         return ivy.from_dlpack(self._data, out=out)
 
+    def to_dlpack(self: ivy.Array, /):
+        """
+        ivy.Array instance method variant of ivy.to_dlpack. This method simply wraps
+        the function, and so the docstring for ivy.to_dlpack also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array.
+
+        Returns
+        -------
+        ret
+            a DLPack capsule referencing the data of ``self``.
+
+        Examples
+        --------
+        >>> x = ivy.array([1., 2., 3.])
+        >>> capsule = x.to_dlpack()
+        >>> print(type(capsule).__name__)
+        PyCapsule
+
+        """
+        return ivy.to_dlpack(self._data)
+
     # Extra #
     # ----- #
 
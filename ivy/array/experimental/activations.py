@@ -4,6 +4,8 @@ import ivy
 
 
 class ArrayWithActivationsExperimental(abc.ABC):
+    __slots__ = ()
+
     def logit(self, /, *, eps=None, out=None):
         """
         ivy.Array instance method variant of ivy.logit. This method
@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithData_typeExperimental(abc.ABC):
-    pass
+    __slots__ = ()
@@ -5,6 +5,8 @@ import ivy
 
 
 class ArrayWithNormsExperimental(abc.ABC):
+    __slots__ = ()
+
     def l2_normalize(self, axis=None, out=None):
         """Normalizes the array to have unit L2 norm.
 
@@ -3,4 +3,4 @@ import abc
 
 
 class ArrayWithSearchingExperimental(abc.ABC):
-    pass
+    __slots__ = ()
@@ -5,4 +5,4 @@ import abc
 
 
 class ArrayWithImage(abc.ABC):
-    pass
+    __slots__ = ()
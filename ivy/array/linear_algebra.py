@@ -9,6 +9,8 @@ inf = float("inf")
 
 
 class ArrayWithLinearAlgebra(abc.ABC):
+    __slots__ = ()
+
     def matmul(
         self: ivy.Array,
         x2: Union[ivy.Array, ivy.NativeArray],
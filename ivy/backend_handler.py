@@ -1,6 +1,7 @@
 # global
 import ivy
 import importlib
+import contextvars
 import numpy as np
 from ivy import verbosity
 from typing import Optional
@@ -12,6 +13,17 @@ backend_stack = []
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
+# backends set for the current thread or asyncio task with `ivy.using_backend`
+_backend_context = contextvars.ContextVar("backend_context", default=())
+# number of `ivy.using_backend` contexts entered in any thread or task, during which
+# the global backend cannot be changed
+_using_backend_count = 0
+# fully wrapped ivy namespaces, keyed by (backend module name, backend version)
+_backend_namespaces = dict()
+# incremented whenever the ivy namespace is modified other than by swapping the
+# backend, and the value when `ivy_original_dict` was last captured
+_ivy_dict_version = 0
+_original_dict_version = None
 
 
 class ContextManager:
@@ -25,6 +37,67 @@ class ContextManager:
         unset_backend()
 
 
+class using_backend:
+    """
+    Context manager which sets `backend` as the backend of the current thread or
+    asyncio task only, without modifying the global ivy namespace.
+
+    Functions are resolved through ivy's backend-agnostic implementations, which
+    dispatch to the backend returned by `ivy.current_backend`, so the context can
+    only be entered when no different global backend has been set with
+    `ivy.set_backend`, and the global backend cannot be set or unset while any
+    such context is active.
+
+    Examples
+    --------
+    >>> with ivy.using_backend("numpy"):
+    ...     x = ivy.native_array([1])
+    >>> print(type(x))
+    <class 'numpy.ndarray'>
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._token = None
+
+    def __enter__(self):
+        backend = self.backend
+        ivy.assertions.check_false(
+            isinstance(backend, str) and backend not in _backend_dict,
+            "backend must be one from {}".format(list(_backend_dict.keys())),
+        )
+        if isinstance(backend, str):
+            backend = importlib.import_module(_backend_dict[backend])
+        global _using_backend_count
+        with ivy.locks["backend_setter"]:
+            ivy.assertions.check_true(
+                not backend_stack or backend_stack[-1] is backend,
+                "cannot use backend {} while the global backend is {}".format(
+                    backend.current_backend_str(),
+                    backend_stack[-1].current_backend_str() if backend_stack else None,
+                ),
+            )
+            get_backend(backend)
+            _using_backend_count += 1
+        self._token = _backend_context.set(_backend_context.get() + (backend,))
+        return backend
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _using_backend_count
+        _backend_context.reset(self._token)
+        self._token = None
+        with ivy.locks["backend_setter"]:
+            _using_backend_count -= 1
+
+
+def _check_no_using_backend(action):
+    ivy.assertions.check_false(
+        _using_backend_count,
+        "cannot {} the global backend while {} ivy.using_backend contexts are "
+        "active".format(action, _using_backend_count),
+    )
+
+
 _array_types = dict()
 _array_types["numpy"] = "ivy.functional.backends.numpy"
 _array_types["jax.interpreters.xla"] = "ivy.functional.backends.jax"
@@ -166,9 +239,78 @@ def set_backend_to_specific_version(backend):
                 backend.__dict__[orig_name].__name__ = orig_name
 
 
+def _ivy_dict_modified():
+    """
+    Records that the ivy namespace has been modified, so that `ivy_original_dict`
+    is re-captured, and the cached backend namespaces rebuilt, when the next backend
+    is set. Must be called wherever ivy attributes are assigned.
+    """
+    global _ivy_dict_version
+    _ivy_dict_version += 1
+
+
+def _update_original_dict():
+    """
+    Re-captures `ivy_original_dict` from the ivy namespace, clearing the cached
+    backend namespaces if the ivy namespace has been modified since they were built.
+    """
+    global ivy_original_dict, _original_dict_version
+    if _original_dict_version != _ivy_dict_version:
+        ivy_original_dict = ivy.__dict__.copy()
+        _original_dict_version = _ivy_dict_version
+        _backend_namespaces.clear()
+
+
+def _backend_namespace(backend):
+    """
+    Returns the fully wrapped ivy namespace for `backend`, together with the keys
+    which must be removed from the ivy namespace as they are invalid for the
+    backend. The namespace is built once per (backend, version) and then cached.
+
+    Parameters
+    ----------
+    backend
+        the backend module for which to build the namespace.
+
+    Returns
+    -------
+    ret
+        a tuple of the namespace dict and the list of invalid keys.
+    """
+    key = (backend.__name__, backend.backend_version["version"])
+    if key in _backend_namespaces:
+        return _backend_namespaces[key]
+    set_backend_to_specific_version(backend)
+    namespace = dict()
+    invalid = list()
+    for k, v in ivy_original_dict.items():
+        compositional = k not in backend.__dict__
+        if k not in backend.__dict__:
+            if k in backend.invalid_dtypes:
+                invalid.append(k)
+                continue
+            backend.__dict__[k] = v
+        namespace[k] = _wrap_function(
+            key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
+        )
+    _backend_namespaces[key] = (namespace, invalid)
+    return namespace, invalid
+
+
+def _set_namespace(backend):
+    """Swaps the ivy namespace to that of `backend`, or to ivy's if it is None."""
+    if backend is None:
+        ivy.__dict__.update(ivy_original_dict)
+        return
+    namespace, invalid = _backend_namespace(backend)
+    ivy.__dict__.update(namespace)
+    for k in invalid:
+        ivy.__dict__.pop(k, None)
+
+
 def current_backend(*args, **kwargs):
     """Returns the current backend. Priorities:
-    global_backend > argument's backend.
+    context backend > global_backend > argument's backend.
 
     Parameters
     ----------
@@ -200,6 +342,10 @@ def current_backend(*args, **kwargs):
     <module 'ivy.functional.backends.jax' from '/ivy/ivy/functional/backends/jax/__init__.py'>   # noqa
     """
     global implicit_backend
+    # a backend set for the current thread or task with using_backend takes priority
+    context_backends = _backend_context.get()
+    if context_backends:
+        return context_backends[-1]
     # if a global backend has been set with set_backend then this will be returned
     if backend_stack:
         f = backend_stack[-1]
@@ -242,9 +388,13 @@ def set_backend(backend: str):
         "backend must be one from {}".format(list(_backend_dict.keys())),
     )
     ivy.locks["backend_setter"].acquire()
-    global ivy_original_dict
+    try:
+        _check_no_using_backend("set")
+    except ivy.exceptions.IvyException:
+        ivy.locks["backend_setter"].release()
+        raise
     if not backend_stack:
-        ivy_original_dict = ivy.__dict__.copy()
+        _update_original_dict()
     if isinstance(backend, str):
         temp_stack = list()
         while backend_stack:
@@ -257,17 +407,7 @@ def set_backend(backend: str):
     elif backend.current_backend_str() == "jax":
         ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
     backend_stack.append(backend)
-    set_backend_to_specific_version(backend)
-    for k, v in ivy_original_dict.items():
-        compositional = k not in backend.__dict__
-        if k not in backend.__dict__:
-            if k in backend.invalid_dtypes and k in ivy.__dict__:
-                del ivy.__dict__[k]
-                continue
-            backend.__dict__[k] = v
-        ivy.__dict__[k] = _wrap_function(
-            key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
-        )
+    _set_namespace(backend)
 
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
@@ -331,9 +471,8 @@ def get_backend(backend: Optional[str] = None):
     # ToDo: change this so that it doesn't depend at all on the global ivy. Currently
     #  all backend-agnostic implementations returned in this module will still
     #  use the global ivy backend.
-    global ivy_original_dict
     if not backend_stack:
-        ivy_original_dict = ivy.__dict__.copy()
+        _update_original_dict()
     # current global backend is retrieved if backend isn't specified,
     # otherwise `backend` argument will be used
     if backend is None:
@@ -382,6 +521,7 @@ def unset_backend():
     backend = None
     # if the backend stack is empty, nothing is done and we just return `None`
     if backend_stack:
+        _check_no_using_backend("unset")
         backend = backend_stack.pop(-1)  # remove last backend from the stack
         if backend.current_backend_str() == "numpy":
             ivy.unset_default_device()
@@ -395,16 +535,9 @@ def unset_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
+        # swap in the cached namespace of the new backend, or ivy's namespace if
+        # there is no backend left on the stack
+        _set_namespace(backend_stack[-1] if backend_stack else None)
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     return backend
@@ -20,6 +20,14 @@ except ModuleNotFoundError:
     h5py = None
 import pickle
 import random
+import contextvars
+import queue
+import threading
+import time
+import weakref
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from multiprocessing import resource_tracker, shared_memory
 from operator import mul
 from functools import reduce
 from typing import Union, Tuple
@@ -47,8 +55,782 @@ def _repr(x):
         return str(x)
 
 
+# name of the group holding the row permutations of virtually shuffled hdf5 files,
+# and of the attribute referencing the permutation of each shuffled dataset
+_hdf5_permutation_key = "__ivy_permutation__"
+
+
+def _hdf5_permutation(dataset):
+    ref = dataset.attrs.get(_hdf5_permutation_key)
+    return None if ref is None else dataset.file[ref]
+
+
+def _hdf5_read_indices(dataset, indices):
+    """Read the rows at the (unordered) ``indices`` of an h5py dataset."""
+    indices = np.asarray(indices, dtype=np.int64)
+    if not indices.ndim:
+        return dataset[int(indices)]
+    order = np.argsort(indices)
+    ret = np.empty((len(indices),) + dataset.shape[1:], dtype=dataset.dtype)
+    if len(indices):
+        ret[order] = dataset[indices[order]]
+    return ret
+
+
+def _hdf5_read_rows(dataset, rows):
+    """Read the rows ``rows`` (an int or a range) of an h5py dataset into a numpy
+    array, reading contiguous selections directly into a preallocated buffer. The
+    rows of virtually shuffled datasets are read through their permutation.
+    """
+    permutation = _hdf5_permutation(dataset)
+    if permutation is not None:
+        return _hdf5_read_indices(dataset, _hdf5_read_rows(permutation, rows))
+    if isinstance(rows, int):
+        return dataset[rows]
+    if rows.step < 0:
+        return _hdf5_read_rows(dataset, rows[::-1])[::-1]
+    buffer = np.empty((len(rows),) + dataset.shape[1:], dtype=dataset.dtype)
+    if len(rows):
+        dataset.read_direct(
+            buffer, source_sel=np.s_[rows.start : rows.stop : rows.step]
+        )
+    return buffer
+
+
+class _HDF5Proxy:
+    """Leaf of a container lazily loaded from an hdf5 file. Only the rows selected
+    when indexing the proxy are read from disk, and the full dataset is only read
+    when the proxy is converted to an array.
+    """
+
+    __slots__ = ("_dataset", "_rows", "_ivyh")
+
+    def __init__(self, dataset, rows=None, ivyh=None):
+        self._dataset = dataset
+        self._rows = ivy.default(rows, range(dataset.shape[0]))
+        self._ivyh = ivyh
+
+    @property
+    def shape(self):
+        return (len(self._rows),) + self._dataset.shape[1:]
+
+    @property
+    def ndim(self):
+        return self._dataset.ndim
+
+    @property
+    def dtype(self):
+        return ivy.as_ivy_dtype(self._dataset.dtype.name)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __array__(self, dtype=None):
+        return np.asarray(_hdf5_read_rows(self._dataset, self._rows), dtype=dtype)
+
+    def __getitem__(self, query):
+        query = query if isinstance(query, tuple) else (query,)
+        if not query or not isinstance(query[0], (int, slice)):
+            return self.to_ivy()[query]
+        ret = _hdf5_read_rows(self._dataset, self._rows[query[0]])
+        ret = ivy.default(self._ivyh, ivy).asarray(ret)
+        return ret[query[1:]] if len(query) > 1 else ret
+
+    def __repr__(self):
+        return "HDF5Proxy(name={}, shape={}, dtype={})".format(
+            self._dataset.name, self.shape, self.dtype
+        )
+
+    def to_ivy(self):
+        """Read the data of the proxy from disk into an ivy array."""
+        return ivy.default(self._ivyh, ivy).asarray(self.__array__())
+
+
+# default amount of data shuffled at a time by ContainerBase.shuffle_h5_file
+_hdf5_shuffle_chunk_bytes = 2**26
+
+
+def _hdf5_permute_rows(dataset, indices, chunk_size):
+    """Reorder the rows of an h5py dataset on disk, such that row ``i`` becomes the
+    row previously at ``indices[i]``, holding at most ``chunk_size`` rows in memory.
+
+    The rows are first copied in contiguous blocks to a staging dataset, grouped by
+    the block of the output they belong to, and each output block is then assembled
+    in memory and written back contiguously. Both passes only read and write
+    contiguous runs of rows, unlike random row access through h5py.
+    """
+    num_rows = len(indices)
+    destinations = np.empty(num_rows, dtype=np.int64)
+    destinations[indices] = np.arange(num_rows)
+    # rows in the staging dataset are ordered by output block, and by source row
+    # within each block
+    staging_order = np.argsort(destinations // chunk_size, kind="stable")
+    staging_positions = np.empty(num_rows, dtype=np.int64)
+    staging_positions[staging_order] = np.arange(num_rows)
+    group = dataset.parent
+    staging_key = dataset.name.split("/")[-1] + "__ivy_staging__"
+    staging = group.create_dataset(
+        staging_key, shape=dataset.shape, dtype=dataset.dtype, chunks=dataset.chunks
+    )
+    for start in range(0, num_rows, chunk_size):
+        rows = dataset[start : start + chunk_size]
+        positions = staging_positions[start : start + chunk_size]
+        order = np.argsort(positions, kind="stable")
+        positions, rows = positions[order], rows[order]
+        runs = np.flatnonzero(np.diff(positions) != 1) + 1
+        for run_positions, run_rows in zip(
+            np.split(positions, runs), np.split(rows, runs)
+        ):
+            staging[run_positions[0] : run_positions[0] + len(run_positions)] = run_rows
+    for start in range(0, num_rows, chunk_size):
+        rows = staging[start : start + chunk_size]
+        block = np.empty_like(rows)
+        block[destinations[staging_order[start : start + chunk_size]] - start] = rows
+        dataset[start : start + chunk_size] = block
+    del group[staging_key]
+
+
+def _hdf5_shuffle(h5_obj, seed_value, chunk_size, virtual, cache, root=None):
+    """Shuffle all datasets below ``h5_obj`` along axis 0. Datasets with the same
+    number of rows and the same existing virtual permutation are shuffled with the
+    same permutation, which is generated in the same way as
+    ``random.shuffle(dataset)`` with the random seed ``seed_value``.
+    """
+    root = ivy.default(root, h5_obj)
+    for key, value in list(h5_obj.items()):
+        if key == _hdf5_permutation_key:
+            continue
+        if isinstance(value, h5py.Group):
+            _hdf5_shuffle(value, seed_value, chunk_size, virtual, cache, root)
+            continue
+        if not isinstance(value, h5py.Dataset):
+            raise ivy.exceptions.IvyException(
+                "Item found inside h5_obj which was neither a Group nor a Dataset."
+            )
+        if not value.ndim:
+            continue
+        num_rows = value.shape[0]
+        permutation = _hdf5_permutation(value)
+        cache_key = (num_rows, None if permutation is None else permutation.name)
+        if cache_key not in cache:
+            indices = list(range(num_rows))
+            random.seed(seed_value)
+            random.shuffle(indices)
+            indices = np.asarray(indices, dtype=np.int64)
+            if permutation is not None:
+                # compose with the permutation the dataset is currently read through
+                indices = permutation[:][indices]
+            if virtual:
+                permutations = root.require_group(_hdf5_permutation_key)
+                indices = permutations.create_dataset(
+                    str(len(permutations)), data=indices
+                )
+            cache[cache_key] = indices
+        indices = cache[cache_key]
+        if virtual:
+            value.attrs[_hdf5_permutation_key] = indices.ref
+            continue
+        if permutation is not None:
+            del value.attrs[_hdf5_permutation_key]
+        row_size = reduce(mul, value.shape[1:], 1) * value.dtype.itemsize
+        _hdf5_permute_rows(
+            value,
+            indices,
+            ivy.default(chunk_size, max(1, _hdf5_shuffle_chunk_bytes // row_size)),
+        )
+
+
+# name, shape and dtype of a numpy array passed through shared memory
+_SharedArray = namedtuple("_SharedArray", ["name", "shape", "dtype"])
+
+
+def _nest_to_shared_memory(x, names):
+    if isinstance(x, dict):
+        return {k: _nest_to_shared_memory(v, names) for k, v in x.items()}
+    if isinstance(x, (list, tuple)):
+        return type(x)([_nest_to_shared_memory(v, names) for v in x])
+    if not isinstance(x, np.ndarray) or not x.nbytes:
+        return x
+    shm = shared_memory.SharedMemory(create=True, size=x.nbytes)
+    names.append(shm.name)
+    np.ndarray(x.shape, dtype=x.dtype, buffer=shm.buf)[...] = x
+    shm.close()
+    return _SharedArray(shm.name, x.shape, x.dtype.str)
+
+
+def _to_shared_memory(x):
+    """Copy the numpy arrays in the nest ``x`` to new shared memory blocks, replacing
+    them with the names, shapes and dtypes of the blocks. The blocks are unlinked by
+    the process which reads them back with :func:`_from_shared_memory`.
+    """
+    names = list()
+    try:
+        return _nest_to_shared_memory(x, names)
+    except BaseException:
+        _unlink_shared_memory([_SharedArray(name, (), "") for name in names])
+        raise
+
+
+def _nest_from_shared_memory(x):
+    if isinstance(x, dict):
+        return {k: _nest_from_shared_memory(v) for k, v in x.items()}
+    if isinstance(x, (list, tuple)) and not isinstance(x, _SharedArray):
+        return type(x)([_nest_from_shared_memory(v) for v in x])
+    if not isinstance(x, _SharedArray):
+        return x
+    shm = shared_memory.SharedMemory(name=x.name)
+    try:
+        return np.ndarray(x.shape, dtype=x.dtype, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _from_shared_memory(x):
+    try:
+        return _nest_from_shared_memory(x)
+    except BaseException:
+        # the blocks which were not read yet are released all the same
+        _unlink_shared_memory(x)
+        raise
+
+
+def _unlink_shared_memory(x):
+    """Unlink the shared memory blocks in the nest ``x`` without reading them."""
+    if isinstance(x, dict):
+        x = list(x.values())
+    if isinstance(x, (list, tuple)) and not isinstance(x, _SharedArray):
+        for v in x:
+            _unlink_shared_memory(v)
+        return
+    if not isinstance(x, _SharedArray):
+        return
+    try:
+        shm = shared_memory.SharedMemory(name=x.name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+# name of the shared memory block holding the out-of-band buffers of a container
+# pickled with protocol 5, together with the in-band pickle and the buffer positions
+_SharedContainer = namedtuple(
+    "_SharedContainer", ["name", "payload", "offsets", "sizes"]
+)
+
+
+class _AttachedSharedMemory(shared_memory.SharedMemory):
+    """Shared memory block whose mapping outlives the block object for as long as
+    arrays viewing it exist, the memory then being unmapped once these are released.
+    """
+
+    def __del__(self):
+        try:
+            self.close()
+        except BufferError:
+            pass
+
+
+def _queue_worker(worker_fn, tasks, results):
+    while True:
+        idx = tasks.get()
+        if idx is None:
+            return
+        try:
+            results.put((idx, _to_shared_memory(worker_fn(idx))))
+        except Exception as e:
+            results.put((idx, ivy.exceptions.IvyException(repr(e))))
+
+
+def _stop_queue_workers(tasks, results, workers, received):
+    for _ in workers:
+        tasks.put(None)
+    for worker in workers:
+        worker.join(timeout=5)
+        if worker.is_alive():
+            worker.terminate()
+            worker.join()
+    # the blocks of items which were produced but never requested are released
+    while True:
+        try:
+            received.update([results.get(timeout=0.1)])
+        except (queue.Empty, EOFError, OSError):
+            break
+    for ret in received.values():
+        _unlink_shared_memory(ret)
+    received.clear()
+
+
+class _WorkerQueues:
+    """Sequence of queue-like objects to back a container with, where the item ``i``
+    is produced by ``worker_fn(i)`` in one of ``num_workers`` worker processes. An
+    item is only produced once it is first requested from its queue, and the arrays
+    it contains are passed back through shared memory rather than being pickled.
+    """
+
+    def __init__(self, worker_fn, num_items, num_workers=1, context=None):
+        multiprocessing = ivy.multiprocessing(context)
+        # the workers must share the resource tracker of this process, which
+        # unregisters the shared memory blocks when they are unlinked here
+        resource_tracker.ensure_running()
+        self._num_items = num_items
+        self._tasks = multiprocessing.Queue()
+        self._results = multiprocessing.Queue()
+        self._workers = [
+            multiprocessing.Process(
+                target=_queue_worker,
+                args=(worker_fn, self._tasks, self._results),
+                daemon=True,
+            )
+            for _ in range(num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self._requested = set()
+        self._received = dict()
+        self._receiving = False
+        self._condition = threading.Condition()
+        self._finalizer = weakref.finalize(
+            self,
+            _stop_queue_workers,
+            self._tasks,
+            self._results,
+            self._workers,
+            self._received,
+        )
+
+    def __len__(self):
+        return self._num_items
+
+    def __getitem__(self, idx):
+        if not 0 <= idx < self._num_items:
+            raise IndexError("queue index {} out of range".format(idx))
+        return _WorkerQueue(self, idx)
+
+    def get(self, idx, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            if idx not in self._requested:
+                self._requested.add(idx)
+                self._tasks.put(idx)
+            # items may arrive in any order, and are stored until they are requested,
+            # with a single thread receiving them at a time and notifying the others
+            while idx not in self._received:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                if self._receiving:
+                    self._condition.wait(remaining)
+                    continue
+                self._receiving = True
+                self._condition.release()
+                try:
+                    received_idx, ret = self._results.get(timeout=remaining)
+                finally:
+                    self._condition.acquire()
+                    self._receiving = False
+                    self._condition.notify_all()
+                self._received[received_idx] = ret
+            ret = self._received.pop(idx)
+        if isinstance(ret, Exception):
+            raise ret
+        return _from_shared_memory(ret)
+
+    def close(self):
+        """Stop the worker processes, and release the items which were produced but
+        not requested."""
+        self._finalizer()
+
+
+class _WorkerQueue:
+    __slots__ = ("_queues", "_idx")
+
+    def __init__(self, queues, idx):
+        self._queues = queues
+        self._idx = idx
+
+    def get(self, timeout=None):
+        return self._queues.get(self._idx, timeout=timeout)
+
+
+def _prefetch_queue_item(queue_to_fetch, timeout=None):
+    future = Future()
+
+    def _fetch():
+        try:
+            future.set_result(queue_to_fetch.get(timeout=timeout))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=_fetch, daemon=True).start()
+    return future
+
+
+# magic number and alignment of the arrays of ivy's binary container format, used
+# by ContainerBase.cont_to_disk_as_binary and ContainerBase.cont_from_disk_as_binary
+_binary_magic = b"IVYCONT1"
+_binary_alignment = 64
+
+
+def _binary_align(offset):
+    return -(-offset // _binary_alignment) * _binary_alignment
+
+
+# leaves with fewer elements than this are always mapped in the calling thread, as
+# the thread pool overhead would exceed the time spent in the backend kernel
+_cont_parallel_min_leaf_size = 2**14
+
+
+def _cont_leaf_size(value):
+    if isinstance(value, (list, tuple)):
+        return max([_cont_leaf_size(v) for v in value], default=0)
+    shape = getattr(value, "shape", None)
+    if shape is None:
+        return 0
+    try:
+        return reduce(mul, shape, 1)
+    except TypeError:
+        return 0
+
+
+def _cont_apply_leaves(func, values, key_chains, num_workers=None):
+    """Return ``[func(value, key_chain) ...]`` for the given leaves, in order. If
+    ``num_workers`` is greater than one, leaves with at least
+    ``_cont_parallel_min_leaf_size`` elements are dispatched to a thread pool, which
+    runs concurrently for backends whose kernels release the GIL.
+    """
+    if num_workers is None or num_workers <= 1:
+        return [func(value, kc) for value, kc in zip(values, key_chains)]
+    large = [
+        i
+        for i, value in enumerate(values)
+        if _cont_leaf_size(value) >= _cont_parallel_min_leaf_size
+    ]
+    if len(large) < 2:
+        return [func(value, kc) for value, kc in zip(values, key_chains)]
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        # each task runs in a copy of the current context, so that backends set
+        # with ivy.using_backend are also used by the worker threads
+        futures = {
+            i: executor.submit(
+                contextvars.copy_context().run, func, values[i], key_chains[i]
+            )
+            for i in large
+        }
+        ret = [
+            None if i in futures else func(value, kc)
+            for i, (value, kc) in enumerate(zip(values, key_chains))
+        ]
+        for i, future in futures.items():
+            ret[i] = future.result()
+    return ret
+
+
+class _KeyChainIndex:
+    """A set of key chains, indexed so that the exact and prefix queries made while
+    traversing a container take time independent of the number of key chains.
+    """
+
+    __slots__ = ("_key_chains", "_lengths", "_prefixes")
+
+    def __init__(self, key_chains):
+        self._key_chains = set(key_chains)
+        self._lengths = sorted(set([len(kc) for kc in self._key_chains]))
+        self._prefixes = set(
+            [kc[:i] for kc in self._key_chains for i in range(len(kc) + 1)]
+        )
+
+    def __contains__(self, key_chain):
+        return key_chain in self._key_chains
+
+    def __iter__(self):
+        return iter(self._key_chains)
+
+    def startswith_any(self, key_chain):
+        """Whether ``key_chain`` starts with any of the key chains."""
+        for length in self._lengths:
+            if length > len(key_chain):
+                return False
+            if key_chain[:length] in self._key_chains:
+                return True
+        return False
+
+    def is_prefix(self, key_chain):
+        """Whether any of the key chains starts with ``key_chain``."""
+        return key_chain in self._prefixes
+
+
+def _key_chains_to_trie(key_chains):
+    """Return the key chains as a prefix tree of nested dicts, with ``True`` marking
+    the end of a key chain. A key chain ending above another one takes precedence,
+    as the whole sub-tree below it is selected.
+    """
+    trie = dict()
+    for key_chain in key_chains:
+        node = trie
+        keys = re.split("[/.]", key_chain)
+        for key in keys[:-1]:
+            child = node.setdefault(key, dict())
+            if child is True:
+                break
+            node = child
+        else:
+            node[keys[-1]] = True
+    return trie
+
+
+def _found_in_key_chains(this_key_chain, key_chains):
+    """Whether ``this_key_chain`` starts with any of ``key_chains``."""
+    if key_chains is None:
+        return False
+    if isinstance(key_chains, _KeyChainIndex):
+        return key_chains.startswith_any(this_key_chain)
+    for key_chain in key_chains:
+        if this_key_chain.startswith(key_chain):
+            return True
+    return False
+
+
+def _sub_tree_unapplied(this_key_chain, key_chains, to_apply):
+    """Whether a function mapped to the leaves which start with any of
+    ``key_chains`` (or to all others if ``to_apply`` is False), is applied to none of
+    the leaves below ``this_key_chain``.
+    """
+    if not isinstance(key_chains, _KeyChainIndex):
+        return False
+    if key_chains.startswith_any(this_key_chain):
+        return not to_apply
+    if to_apply:
+        return not key_chains.is_prefix(this_key_chain)
+    return False
+
+
+_cont_templates = dict()
+
+
+def _cont_template(config):
+    """Return the instance attributes of an empty container with config ``config``,
+    which containers with the same config are created from without running
+    ``__init__``. Templates are cached by the config values whenever these are
+    hashable.
+    """
+    try:
+        key = tuple(
+            (k, tuple(v.items()) if isinstance(v, dict) else v)
+            for k, v in config.items()
+        )
+        template = _cont_templates.get(key)
+    except TypeError:
+        key, template = None, None
+    if template is None:
+        template = dict(ivy.Container(**config).__dict__)
+        if key is not None:
+            _cont_templates[key] = template
+    return template
+
+
+def _cont_from_template(template):
+    cont = dict.__new__(ivy.Container)
+    cont.__dict__.update(template)
+    cont.__dict__["_config_in"] = dict(template["_config_in"])
+    cont.__dict__["_config"] = dict(template["_config"])
+    return cont
+
+
+def _cont_leaf_signature(value):
+    if ivy.is_array(value):
+        # the native shape avoids constructing an ivy.Shape for each leaf
+        data = value.data if isinstance(value, ivy.Array) else value
+        return type(value), tuple(data.shape), str(value.dtype)
+    return type(value), None, None
+
+
+def _cont_identical_structures(containers):
+    """Return the structures of the containers if these all have the same
+    structural signature, otherwise ``None``.
+    """
+    if not all(isinstance(cont, ivy.Container) for cont in containers):
+        return None
+    structures = [cont._cont_get_structure() for cont in containers]
+    signature0 = structures[0].signature()
+    for structure in structures[1:]:
+        if structure.signature() != signature0:
+            return None
+    return structures
+
+
+def _cont_build_node(cont, key_chain, key_chains, slots, versions):
+    keys = tuple(cont.keys())
+    children = list()
+    cont_ref = weakref.ref(cont)
+    for key in keys:
+        value = dict.__getitem__(cont, key)
+        this_key_chain = key if key_chain == "" else (key_chain + "/" + key)
+        if isinstance(value, ivy.Container):
+            children.append(
+                _cont_build_node(value, this_key_chain, key_chains, slots, versions)
+            )
+        else:
+            children.append(None)
+            key_chains.append(this_key_chain)
+            slots.append((cont_ref, key))
+    versions.append((cont_ref, cont._cont_version))
+    try:
+        is_sorted = list(keys) == sorted(keys)
+    except TypeError:
+        is_sorted = False
+    return keys, tuple(children), _cont_template(cont._config), is_sorted
+
+
+def _cont_unflatten_node(
+    node, values, template, dict_types, prune_empty, slots, versions
+):
+    keys, children, node_template, is_sorted = node
+    level_template = node_template if template is None else template
+    nest_types = dict_types + level_template["_types_to_iteratively_nest"]
+    plain = not level_template["_rebuild_child_containers"]
+    exact = True
+    cont = _cont_from_template(level_template)
+    cont_ref = weakref.ref(cont)
+    items = list()
+    new_children = list()
+    for key, child in zip(keys, children):
+        if child is None:
+            value = next(values)
+            if isinstance(value, nest_types):
+                plain = False
+            slots.append((cont_ref, key))
+        else:
+            value, child, child_exact = _cont_unflatten_node(
+                child, values, template, dict_types, prune_empty, slots, versions
+            )
+            exact = exact and child_exact
+            if prune_empty and not value:
+                exact = False
+                continue
+        items.append((key, value))
+        new_children.append(child)
+    if not plain:
+        return ivy.Container(dict(items), **level_template["_config"]), None, False
+    if level_template["_alphabetical_keys"] and not is_sorted:
+        exact = False
+        items.sort(key=lambda item: item[0])
+    dict.update(cont, items)
+    versions.append((cont_ref, cont._cont_version))
+    keys = tuple(item[0] for item in items)
+    return cont, (keys, tuple(new_children), level_template, is_sorted), exact
+
+
+class _ContainerStructure:
+    """The nested structure of a container: the key chains of its leaves in
+    iteration order, the (sub-container, key) slot holding each leaf, and the keys
+    and config of each level.
+
+    It is cached on the container by ``ContainerBase._cont_get_structure``, and is
+    valid for as long as the structure versions of the sub-containers it was built
+    from are unchanged. These are incremented whenever keys are added or removed,
+    sub-containers are replaced, or the config is updated.
+
+    The signature of the leaves is cached alongside, and is recomputed whenever any
+    leaf has been replaced since, as tracked by the leaf versions of the
+    sub-containers.
+
+    The sub-containers are referenced weakly, as they are kept alive by the
+    container, so that caching the structure does not create reference cycles.
+    """
+
+    __slots__ = (
+        "key_chains",
+        "slots",
+        "_root",
+        "_versions",
+        "_signature",
+        "_leaf_versions",
+    )
+
+    def __init__(self, cont):
+        key_chains, self.slots, self._versions = list(), list(), list()
+        self._root = _cont_build_node(cont, "", key_chains, self.slots, self._versions)
+        self.key_chains = tuple(key_chains)
+        self._signature = None
+        self._leaf_versions = None
+
+    def is_valid(self):
+        for cont_ref, version in self._versions:
+            cont = cont_ref()
+            if cont is None or cont._cont_version != version:
+                return False
+        return True
+
+    def leaves(self):
+        return [dict.__getitem__(cont_ref(), key) for cont_ref, key in self.slots]
+
+    def signature(self):
+        """Return the structural signature of the container, as a tuple of its hash,
+        the key chains, and the type, shape and dtype of each leaf. The hash comes
+        first, so that comparing different signatures usually stops there.
+        """
+        leaf_versions = [
+            cont_ref()._cont_leaf_version for cont_ref, _ in self._versions
+        ]
+        if self._signature is None or leaf_versions != self._leaf_versions:
+            leaf_signatures = tuple([_cont_leaf_signature(v) for v in self.leaves()])
+            self._signature = (
+                hash((self.key_chains, leaf_signatures)),
+                self.key_chains,
+                leaf_signatures,
+            )
+            self._leaf_versions = leaf_versions
+        return self._signature
+
+    def unflatten(self, values, config=None, prune_empty=False):
+        """Create a new container with this structure, and with the leaves replaced
+        by ``values``.
+
+        The result is identical to building each level with
+        ``ivy.Container(dict_in, **config)``, which is only done for levels where
+        the new values need converting into sub-containers. If the result has the
+        same structure, its own structure is cached on it directly.
+
+        Parameters
+        ----------
+        values
+            the new leaves, in the order of ``key_chains``.
+        config
+            the config for all levels of the new container. Default is ``None``, in
+            which case each level keeps the config of the corresponding level here.
+        prune_empty
+            whether to drop sub-containers which end up without any leaves.
+
+        """
+        dict_types = tuple([dict] + ivy.container_types())
+        template = None if config is None else _cont_template(config)
+        slots, versions = list(), list()
+        ret, root, exact = _cont_unflatten_node(
+            self._root, iter(values), template, dict_types, prune_empty, slots, versions
+        )
+        if exact:
+            structure = object.__new__(_ContainerStructure)
+            structure.key_chains = self.key_chains
+            structure.slots = slots
+            structure._root = root
+            structure._versions = versions
+            structure._signature = None
+            structure._leaf_versions = None
+            ret._cont_structure = structure
+        return ret
+
+
 # noinspection PyMissingConstructor
 class ContainerBase(dict, abc.ABC):
+    # the structure version, incremented whenever the structure of this level of the
+    # container changes, the leaf version, incremented whenever a leaf of this level
+    # is replaced, and the cached _ContainerStructure of the container
+    _cont_version = 0
+    _cont_leaf_version = 0
+    _cont_structure = None
+
     def __init__(
         self,
         dict_in=None,
@@ -66,6 +848,8 @@ class ContainerBase(dict, abc.ABC):
         rebuild_child_containers=False,
         types_to_iteratively_nest=None,
         alphabetical_keys=True,
+        queue_prefetch=0,
+        queue_cache_size=None,
         **kwargs,
     ):
         """Initialize container object from input dict representation.
@@ -115,6 +899,14 @@ class ContainerBase(dict, abc.ABC):
         alphabetical_keys
             Whether to sort the container keys alphabetically, or preserve the dict
             order. Default is ``True``.
+        queue_prefetch
+            The number of subsequent queues to start loading containers from in the
+            background whenever a container is loaded from one of the queues.
+            Default is ``0``.
+        queue_cache_size
+            The maximum number of containers loaded from the queues to keep, beyond
+            which the earliest loaded containers are evicted. Default is ``None``,
+            in which case all loaded containers are kept.
         kwargs
             keyword arguments for dict creation. Default is ``None``.
 
@@ -125,11 +917,14 @@ class ContainerBase(dict, abc.ABC):
             if isinstance(self._container_combine_method, str):
                 self._container_combine_method = {
                     "list_join": self.cont_list_join,
-                    "concat": lambda conts: self.concat(conts, 0),
+                    "concat": lambda conts: self.static_concat(conts, axis=0),
                 }[self._container_combine_method]
             self._loaded_containers_from_queues = dict()
             self._queue_load_sizes_cum = np.cumsum(queue_load_sizes)
             self._queue_timeout = ivy.default(queue_timeout, ivy.get_queue_timeout())
+            self._queue_prefetch = queue_prefetch
+            self._queue_cache_size = queue_cache_size
+            self._queue_futures = dict()
         if dict_in is None:
             if kwargs:
                 dict_in = dict(**kwargs)
@@ -542,6 +1337,16 @@ class ContainerBase(dict, abc.ABC):
                         idxs_added += idxs_to_add_list
                 return ivy.Container(diff_dict, **config)
 
+        # containers with identical structural signatures have no key or shape diffs
+        if not detect_value_diffs:
+            structures = _cont_identical_structures(containers)
+            if structures is not None:
+                if mode == "diff_only":
+                    return ivy.Container(**config)
+                return structures[0].unflatten(
+                    structures[0].leaves(), config=config, prune_empty=True
+                )
+
         # otherwise, check that the keys are aligned between each container, and apply
         # this method recursively
         return_dict = dict()
@@ -652,6 +1457,7 @@ class ContainerBase(dict, abc.ABC):
         config=None,
         map_nests=False,
         assert_identical=False,
+        num_workers=None,
     ):
         """Apply function to all array values from a collection of containers.
 
@@ -678,12 +1484,45 @@ class ContainerBase(dict, abc.ABC):
             Default is ``False``.
         assert_identical
             Whether to assert that the input containers are identical or not.
+        num_workers
+            Number of threads to apply the function to large leaves with, when
+            mapping over all leaves of containers with identical structures. Leaves
+            are always mapped sequentially if ``None`` or ``1``. Default is ``None``.
 
         Returns
         -------
             Container
 
         """
+        if (
+            key_chains is None
+            and key_chain == ""
+            and containers
+            and all(isinstance(cont, ivy.Container) for cont in containers)
+        ):
+            # containers with the same leaves are mapped over their cached
+            # structures directly
+            structures = [cont._cont_get_structure() for cont in containers]
+            structure0 = structures[0]
+            if all(s.key_chains == structure0.key_chains for s in structures[1:]):
+                leaves = [s.leaves() for s in structures]
+                if not map_nests or not any(
+                    isinstance(value, (list, tuple))
+                    for cont_leaves in leaves
+                    for value in cont_leaves
+                ):
+                    return structure0.unflatten(
+                        _cont_apply_leaves(
+                            lambda values, kc: func(list(values), kc),
+                            list(zip(*leaves)),
+                            structure0.key_chains,
+                            num_workers,
+                        ),
+                        config=ivy.default(config, containers[0].cont_config),
+                        prune_empty=True,
+                    )
+        if isinstance(key_chains, (list, tuple, set, frozenset)):
+            key_chains = _KeyChainIndex(key_chains)
         # retrieve all keys and the first container if it exists
         keys = set([])
         container0 = None
@@ -714,15 +1553,6 @@ class ContainerBase(dict, abc.ABC):
             if len(values) >= 1:
                 this_key_chain = key if key_chain == "" else (key_chain + "/" + key)
                 is_container = [ivy.is_ivy_container(x) for x in values]
-
-                def _found_in_key_chains(this_key_chain, key_chains):
-                    if key_chains is None:
-                        return False
-                    for key_chain in key_chains:
-                        if this_key_chain.startswith(key_chain):
-                            return True
-                    return False
-
                 if not assert_identical and not all(is_container) and any(is_container):
                     found = _found_in_key_chains(this_key_chain, key_chains)
                     if key_chains is not None:
@@ -734,6 +1564,15 @@ class ContainerBase(dict, abc.ABC):
                     return_dict[key] = func(values, this_key_chain)
                 else:
                     if isinstance(value0, ivy.Container):
+                        if (
+                            prune_unapplied
+                            and key_chains is not None
+                            and not map_nests
+                            and _sub_tree_unapplied(
+                                this_key_chain, key_chains, to_apply
+                            )
+                        ):
+                            continue
                         ret = ivy.Container.cont_multi_map(
                             func,
                             values,
@@ -836,6 +1675,22 @@ class ContainerBase(dict, abc.ABC):
         Boolean
 
         """
+        if not partial and key_chain == "":
+            # containers with identical structural signatures only need their
+            # array leaves comparing
+            structures = _cont_identical_structures(containers)
+            if structures is not None:
+                if not same_arrays and not arrays_equal:
+                    return True
+                for values in zip(*[s.leaves() for s in structures]):
+                    if not ivy.is_array(values[0]):
+                        continue
+                    if same_arrays:
+                        if not all(value is values[0] for value in values):
+                            return False
+                    elif not ivy.all_equal(*values):
+                        return False
+                return True
         if partial:
             common_key_chains = ivy.Container.cont_common_key_chains(containers)
             if not common_key_chains:
@@ -1087,7 +1942,11 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
     ):
         """Load container object from disk, as an h5py file, at the specified hdf5
         filepath.
@@ -1104,6 +1963,12 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to return a container of proxies to the hdf5 datasets rather than
+            of arrays. The data of a proxy is only read from disk when it is indexed,
+            for example when slicing the container, or when calling its ``to_ivy``
+            method. The hdf5 file is kept open for as long as the proxies exist.
+            Default is ``False``.
 
         Returns
         -------
@@ -1115,26 +1980,99 @@ class ContainerBase(dict, abc.ABC):
             message="You must install python package h5py in order to load hdf5 \
             files from disk into a container.",
         )
-        container_dict = dict()
         if type(h5_obj_or_filepath) is str:
             h5_obj = h5py.File(h5_obj_or_filepath, "r")
         else:
             h5_obj = h5_obj_or_filepath
+        container_dict = dict()
         items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
         for key, value in items:
+            if key == _hdf5_permutation_key:
+                continue
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh, lazy
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj])
+                rows = (
+                    range(*slice_obj.indices(value.shape[0]))
+                    if isinstance(slice_obj, slice) and value.ndim
+                    else None
                 )
+                if lazy and rows is not None:
+                    container_dict[key] = _HDF5Proxy(value, rows, ivyh)
+                elif rows is not None:
+                    container_dict[key] = ivy.default(ivyh, ivy).asarray(
+                        _hdf5_read_rows(value, rows)
+                    )
+                else:
+                    container_dict[key] = ivy.default(ivyh, ivy).asarray(
+                        value[slice_obj]
+                    )
             else:
                 raise ivy.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
-        return ivy.Container(container_dict, ivyh=ivyh)
+        if type(h5_obj_or_filepath) is str and not lazy:
+            h5_obj.close()
+        return ivy.Container(
+            container_dict, alphabetical_keys=alphabetical_keys, ivyh=ivyh
+        )
+
+    @staticmethod
+    def cont_from_worker_fn(
+        worker_fn,
+        queue_load_sizes,
+        num_workers=1,
+        queue_prefetch=1,
+        queue_cache_size=2,
+        context=None,
+        **kwargs,
+    ):
+        """Create a queue-backed container, whose queues are filled by worker
+        processes.
+
+        The container loaded from queue ``i`` is the dict returned by
+        ``worker_fn(i)`` in one of the worker processes. Each item is only produced
+        once it is first requested, either by slicing the container or by
+        prefetching, and the numpy arrays it contains are passed back to the
+        container through shared memory.
+
+        Parameters
+        ----------
+        worker_fn
+            Function returning a (nested) dict of numpy arrays for a queue index,
+            which must be picklable for the ``spawn`` and ``forkserver`` contexts.
+        queue_load_sizes
+            Size of leading dimension of the containers returned by each queue.
+        num_workers
+            Number of worker processes. Default is ``1``.
+        queue_prefetch
+            The number of subsequent queues to load in the background whenever the
+            container is sliced. Default is ``1``.
+        queue_cache_size
+            The maximum number of containers loaded from the queues to keep.
+            Default is ``2``.
+        context
+            The multiprocessing context to start the workers with, either fork,
+            forkserver or spawn. Default is ``None``.
+        kwargs
+            Further keyword arguments for the container constructor.
+
+        Returns
+        -------
+            Container backed by the worker queues.
+
+        """
+        return ivy.Container(
+            queues=_WorkerQueues(
+                worker_fn, len(queue_load_sizes), num_workers, context
+            ),
+            queue_load_sizes=queue_load_sizes,
+            queue_prefetch=queue_prefetch,
+            queue_cache_size=queue_cache_size,
+            **kwargs,
+        )
 
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
@@ -1180,6 +2118,107 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath) as json_data_file:
             return ivy.Container(json.load(json_data_file), ivyh=ivyh)
 
+    @staticmethod
+    def cont_from_disk_as_binary(binary_filepath, mmap=True, ivyh=None):
+        """Load container object from disk at the specified filepath, saved in ivy's
+        binary container format by :meth:`cont_to_disk_as_binary`.
+
+        Parameters
+        ----------
+        binary_filepath
+            Filepath where the container object is saved to disk.
+        mmap
+            Whether to memory map the file, in which case the arrays of the container
+            are copy-on-write views of the file, and are only read from disk when
+            accessed. Otherwise the whole file is read into memory at once. Default
+            is ``True``.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+
+        """
+        with open(binary_filepath, "rb") as binary_file:
+            if binary_file.read(len(_binary_magic)) != _binary_magic:
+                raise ivy.exceptions.IvyException(
+                    "{} is not an ivy binary container file".format(binary_filepath)
+                )
+            header_size = int(np.frombuffer(binary_file.read(8), dtype="<u8")[0])
+            header = json.loads(binary_file.read(header_size))
+        data_offset = _binary_align(len(_binary_magic) + 8 + header_size)
+        if not header["data_size"]:
+            data = np.empty((0,), dtype=np.uint8)
+        elif mmap:
+            data = np.memmap(
+                binary_filepath,
+                dtype=np.uint8,
+                mode="c",
+                offset=data_offset,
+                shape=(header["data_size"],),
+            )
+        else:
+            data = np.fromfile(
+                binary_filepath,
+                dtype=np.uint8,
+                count=header["data_size"],
+                offset=data_offset,
+            )
+        container_dict = dict()
+        for entry in header["leaves"]:
+            keys = entry["key_chain"].split("/")
+            sub_dict = container_dict
+            for key in keys[:-1]:
+                sub_dict = sub_dict.setdefault(key, dict())
+            if "value" in entry:
+                value = entry["value"]
+            elif "dtype" in entry:
+                dtype = np.dtype(entry["dtype"])
+                start = entry["offset"]
+                stop = start + reduce(mul, entry["shape"], 1) * dtype.itemsize
+                value = ivy.default(ivyh, ivy).asarray(
+                    data[start:stop].view(dtype).reshape(entry["shape"]), copy=False
+                )
+            else:
+                value = dict()
+            sub_dict[keys[-1]] = value
+        return ivy.Container(container_dict, ivyh=ivyh)
+
+    @staticmethod
+    def cont_from_shared_memory(handle, unlink=True):
+        """Load a container sent through shared memory with
+        :meth:`cont_to_shared_memory`. The arrays of the returned container are views
+        of the shared memory, wherever the backends of the arrays allow it.
+
+        Parameters
+        ----------
+        handle
+            The handle returned by :meth:`cont_to_shared_memory`.
+        unlink
+            Whether to unlink the shared memory block, such that it is freed once the
+            arrays viewing it are released. Should only be ``False`` if the container
+            is loaded from the same handle more than once. Default is ``True``.
+
+        Returns
+        -------
+            Container viewing the shared memory.
+
+        """
+        shm = _AttachedSharedMemory(name=handle.name)
+        try:
+            return pickle.loads(
+                handle.payload,
+                buffers=[
+                    shm.buf[offset : offset + size]
+                    for offset, size in zip(handle.offsets, handle.sizes)
+                ],
+            )
+        finally:
+            if unlink:
+                shm.unlink()
+
     @staticmethod
     def h5_file_size(h5_obj_or_filepath):
         """Get file size of h5 file contents.
@@ -1207,6 +2246,8 @@ class ContainerBase(dict, abc.ABC):
         size = 0
         batch_size = 0
         for key, value in h5_obj.items():
+            if key == _hdf5_permutation_key:
+                continue
             if isinstance(value, h5py.Group):
                 size_to_add, batch_size = ivy.Container.h5_file_size(value)
                 size += size_to_add
@@ -1221,16 +2262,32 @@ class ContainerBase(dict, abc.ABC):
         return size, batch_size
 
     @staticmethod
-    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0):
+    def shuffle_h5_file(
+        h5_obj_or_filepath, seed_value=0, chunk_size=None, virtual=False
+    ):
         """Shuffle entries in all datasets of h5 file, such that they are still aligned
         along axis 0.
 
+        A single permutation is generated for all datasets, and applied block-wise,
+        such that only ``chunk_size`` rows of a dataset are held in memory at a time.
+        Rows are only read and written in contiguous runs, using a temporary staging
+        dataset of the same size as the shuffled dataset. Note that hdf5 files do not
+        shrink when datasets are deleted, so the file grows by the size of the
+        largest dataset, unless it is repacked.
+
         Parameters
         ----------
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         seed_value
             random seed to use for array shuffling (Default value = 0)
+        chunk_size
+            Number of rows to shuffle at a time. Default is ``None``, in which case
+            blocks of roughly 64MB are used.
+        virtual
+            Whether to only store the permutation in the file, without moving any
+            rows on disk. The permutation is then applied when the datasets are
+            loaded with :meth:`cont_from_disk_as_hdf5`. Default is ``False``.
 
         """
         ivy.assertions.check_exists(
@@ -1244,18 +2301,7 @@ class ContainerBase(dict, abc.ABC):
             h5_obj = h5py.File(h5_obj_or_filepath, "a")
         else:
             h5_obj = h5_obj_or_filepath
-
-        for key, value in h5_obj.items():
-            if isinstance(value, h5py.Group):
-                ivy.Container.shuffle_h5_file(value, seed_value)
-            elif isinstance(value, h5py.Dataset):
-                random.seed(seed_value)
-                # noinspection PyTypeChecker
-                random.shuffle(value)
-            else:
-                raise ivy.exceptions.IvyException(
-                    "Item found inside h5_obj which was neither a Group nor a Dataset."
-                )
+        _hdf5_shuffle(h5_obj, seed_value, chunk_size, virtual, dict())
         if isinstance(h5_obj, h5py.File):
             h5_obj.close()
 
@@ -1435,6 +2481,13 @@ class ContainerBase(dict, abc.ABC):
             out=out,
         )
 
+    def _cont_get_structure(self):
+        structure = self._cont_structure
+        if structure is None or not structure.is_valid():
+            structure = _ContainerStructure(self)
+            self._cont_structure = structure
+        return structure
+
     def _cont_get_shape(self):
 
         if not len(self.keys()):
@@ -1485,13 +2538,31 @@ class ContainerBase(dict, abc.ABC):
         return None
 
     def _cont_at_key_chains_input_as_seq(self, key_chains, ignore_key_errors=False):
-        return_cont = ivy.Container(dict(), **self._config)
-        for kc in key_chains:
-            val = self.cont_at_key_chain(kc, ignore_key_errors=ignore_key_errors)
-            if ignore_key_errors and not ivy.exists(val):
+        return self._cont_at_key_chains_input_as_trie(
+            _key_chains_to_trie(key_chains), ignore_key_errors=ignore_key_errors
+        )
+
+    def _cont_at_key_chains_input_as_trie(self, trie, ignore_key_errors=False):
+        return_dict = dict()
+        for k, v in trie.items():
+            try:
+                val = self[k]
+                if v is not True:
+                    if not isinstance(val, ivy.Container):
+                        raise KeyError(k)
+                    val = val._cont_at_key_chains_input_as_trie(
+                        v, ignore_key_errors=ignore_key_errors
+                    )
+            except KeyError as e:
+                if ignore_key_errors:
+                    continue
+                raise ivy.exceptions.IvyException(repr(e))
+            if ignore_key_errors and (
+                not ivy.exists(val) or (v is not True and len(val) == 0)
+            ):
                 continue
-            return_cont.cont_set_at_key_chain(kc, val, inplace=True)
-        return return_cont
+            return_dict[k] = val
+        return ivy.Container(return_dict, **self._config)
 
     def _cont_at_key_chains_input_as_dict(
         self, key_chains, current_chain="", ignore_key_errors=False
@@ -1516,10 +2587,26 @@ class ContainerBase(dict, abc.ABC):
         return ivy.Container(return_dict, **self._config)
 
     def _cont_prune_key_chains_input_as_seq(self, key_chains):
-        return_cont = self.cont_copy()
-        for kc in key_chains:
-            return_cont = return_cont.cont_prune_key_chain(kc)
-        return return_cont
+        return self._cont_prune_key_chains_input_as_trie(
+            _key_chains_to_trie(key_chains)
+        )
+
+    def _cont_prune_key_chains_input_as_trie(self, trie):
+        out_dict = dict()
+        for key, value in self.items():
+            sub_trie = trie.get(key)
+            if sub_trie is True:
+                continue
+            if isinstance(value, ivy.Container):
+                if sub_trie is None:
+                    new_val = value.cont_to_dict()
+                else:
+                    new_val = value._cont_prune_key_chains_input_as_trie(sub_trie)
+                if len(new_val) > 0:
+                    out_dict[key] = new_val
+            else:
+                out_dict[key] = value
+        return ivy.Container(out_dict, **self._config)
 
     def _cont_prune_key_chains_input_as_dict(self, key_chains, return_cont=None):
         if return_cont is None:
@@ -1572,6 +2659,7 @@ class ContainerBase(dict, abc.ABC):
                 self.__setattr__(att_name, v)
 
         self._config = new_config
+        self._cont_version += 1
 
     def cont_inplace_update(
         self, dict_in: Union[ivy.Container, dict], **config
@@ -1981,6 +3069,8 @@ class ContainerBase(dict, abc.ABC):
                 h5_obj[key][
                     starting_index : starting_index + amount_to_write
                 ] = value_as_np[0:amount_to_write]
+        if type(h5_obj_or_filepath) is str:
+            h5_obj.close()
 
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """Save container object to disk, as an pickled file, at the specified filepath.
@@ -2024,6 +3114,100 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath, "w+") as json_data_file:
             json.dump(self.cont_to_jsonable().cont_to_dict(), json_data_file, indent=4)
 
+    def cont_to_disk_as_binary(self, binary_filepath):
+        """Save container object to disk, in ivy's binary container format, at the
+        specified filepath.
+
+        The file starts with a json header listing the key chain, dtype, shape and
+        offset of each array, followed by the raw data of the arrays, each aligned to
+        64 bytes, such that the file can be memory mapped by
+        :meth:`cont_from_disk_as_binary`. Leaves which are not arrays are stored in
+        the header, and must be json-able.
+
+        Parameters
+        ----------
+        binary_filepath
+            Filepath for where to save the container to disk.
+
+        """
+        arrays = list()
+        leaves = list()
+        data_size = 0
+        for key_chain, value in self.cont_to_iterator(include_empty=True):
+            if isinstance(value, ivy.Container):
+                leaves.append({"key_chain": key_chain})
+            elif ivy.is_array(value) or isinstance(value, np.ndarray):
+                value = np.asarray(self._cont_ivy.to_numpy(value), order="C")
+                if value.dtype.hasobject:
+                    raise ivy.exceptions.IvyException(
+                        "array at {} has dtype object, which cannot be saved in the "
+                        "binary container format".format(key_chain)
+                    )
+                data_size = _binary_align(data_size)
+                leaves.append(
+                    {
+                        "key_chain": key_chain,
+                        "dtype": value.dtype.str,
+                        "shape": list(value.shape),
+                        "offset": data_size,
+                    }
+                )
+                arrays.append(value)
+                data_size += value.nbytes
+            elif _is_jsonable(value):
+                leaves.append({"key_chain": key_chain, "value": value})
+            else:
+                raise ivy.exceptions.IvyException(
+                    "leaf at {} is neither an array nor json-able, and cannot be saved "
+                    "in the binary container format".format(key_chain)
+                )
+        header = json.dumps({"leaves": leaves, "data_size": data_size}).encode()
+        with open(binary_filepath, "wb") as binary_file:
+            binary_file.write(_binary_magic)
+            binary_file.write(np.array(len(header), dtype="<u8").tobytes())
+            binary_file.write(header)
+            data_offset = _binary_align(binary_file.tell())
+            binary_file.write(bytes(data_offset - binary_file.tell()))
+            for entry, value in zip(
+                [entry for entry in leaves if "dtype" in entry], arrays
+            ):
+                binary_file.write(
+                    bytes(data_offset + entry["offset"] - binary_file.tell())
+                )
+                binary_file.write(value.reshape(-1).view(np.uint8))
+
+    def cont_to_shared_memory(self):
+        """Copy the arrays of the container to a shared memory block, to send the
+        container to other processes without pickling the array data.
+
+        The container is pickled with protocol 5, with the buffers of the arrays
+        passed out-of-band and copied to the shared memory block, such that only the
+        returned handle needs to be sent to the receiving process, which loads the
+        container with :meth:`cont_from_shared_memory`.
+
+        Returns
+        -------
+        ret
+            Picklable handle of the shared memory block.
+
+        """
+        buffers = list()
+        payload = pickle.dumps(self, protocol=5, buffer_callback=buffers.append)
+        buffers = [buffer.raw() for buffer in buffers]
+        offsets = list()
+        size = 0
+        for buffer in buffers:
+            size = _binary_align(size)
+            offsets.append(size)
+            size += buffer.nbytes
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for offset, buffer in zip(offsets, buffers):
+            shm.buf[offset : offset + buffer.nbytes] = buffer
+        shm.close()
+        return _SharedContainer(
+            shm.name, payload, offsets, [buffer.nbytes for buffer in buffers]
+        )
+
     def cont_to_nested_list(self):
         return_list = list()
         for key, value in self.items():
@@ -2162,7 +3346,7 @@ class ContainerBase(dict, abc.ABC):
             Container as flat list.
 
         """
-        return list([item for key, item in self.cont_to_iterator()])
+        return self._cont_get_structure().leaves()
 
     def cont_from_flat_list(self, flat_list):
         """Return new container object with the same hierarchy, but with values replaced
@@ -2178,6 +3362,12 @@ class ContainerBase(dict, abc.ABC):
             Container.
 
         """
+        structure = self._cont_get_structure()
+        num_leaves = len(structure.key_chains)
+        if isinstance(flat_list, list) and len(flat_list) >= num_leaves:
+            values = flat_list[:num_leaves]
+            del flat_list[:num_leaves]
+            return structure.unflatten(values)
         new_dict = dict()
         for key, value in self.items():
             if isinstance(value, ivy.Container):
@@ -2187,6 +3377,145 @@ class ContainerBase(dict, abc.ABC):
             new_dict[key] = new_value
         return ivy.Container(new_dict, **self._config)
 
+    def cont_to_flat_buffer(self, /, *, dtype=None, inplace=False):
+        """Pack all array leaves of the container into a single contiguous 1-D
+        array, in the order given by :meth:`cont_to_flat_list`.
+
+        Parameters
+        ----------
+        dtype
+            data type of the buffer. All leaves are cast to this data type. Default is
+            ``None``, in which case the leaves are grouped by data type, with one
+            buffer for each data type.
+        inplace
+            Whether to replace the leaves of the container with reshaped views into
+            the returned buffer, such that in-place updates of the buffer are
+            reflected by the leaves and vice versa. Only supported for backends
+            which support in-place array updates. Default is ``False``.
+
+        Returns
+        -------
+        ret
+            1-D array containing the flattened leaves of the container, or a dict
+            mapping each data type to the 1-D array containing the flattened leaves
+            of that data type if the leaves do not all share the same data type.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([[3.]])})
+        >>> buffer = x.cont_to_flat_buffer(inplace=True)
+        >>> print(buffer)
+        ivy.array([1., 2., 3.])
+        >>> buffer = ivy.inplace_update(buffer, buffer * 2)
+        >>> print(x)
+        {
+            a: ivy.array([2., 4.]),
+            b: {
+                c: ivy.array([[6.]])
+            }
+        }
+        """
+        leaves = self.cont_to_flat_list()
+        if not all(ivy.is_array(leaf) for leaf in leaves):
+            raise ivy.exceptions.IvyException(
+                "all leaves of the container must be arrays to form a flat buffer"
+            )
+        if inplace and not ivy.inplace_arrays_supported():
+            raise ivy.exceptions.IvyException(
+                "the {} backend does not support in-place array updates, so the "
+                "leaves cannot be kept in sync with the buffer".format(
+                    ivy.current_backend_str()
+                )
+            )
+        if not leaves:
+            return ivy.zeros((0,), dtype=dtype)
+        if dtype is not None:
+            leaves = [ivy.astype(leaf, dtype) for leaf in leaves]
+        dtypes = [str(ivy.dtype(leaf)) for leaf in leaves]
+        buffer = {
+            group: ivy.concat(
+                [
+                    ivy.reshape(leaf, (-1,))
+                    for leaf, leaf_dtype in zip(leaves, dtypes)
+                    if leaf_dtype == group
+                ]
+            )
+            for group in dict.fromkeys(dtypes)
+        }
+        if len(buffer) == 1:
+            buffer = buffer[dtypes[0]]
+        if inplace:
+            views = iter(self.cont_from_flat_buffer(buffer).cont_to_flat_list())
+            self.cont_map(lambda _, __: next(views), inplace=True)
+        return buffer
+
+    def cont_from_flat_buffer(self, buffer):
+        """Return new container object with the same hierarchy, but with each leaf
+        replaced by the corresponding slice of a flat buffer, reshaped to the shape
+        of the leaf. This is the inverse of :meth:`cont_to_flat_buffer`.
+
+        For backends which support views (such as numpy and torch), the leaves of
+        the returned container are views into the buffer, so in-place updates of
+        the buffer are reflected by the leaves.
+
+        Parameters
+        ----------
+        buffer
+            1-D array with as many elements as the leaves of the container combined,
+            or a dict mapping each data type to the 1-D array with as many elements as
+            the leaves of that data type combined.
+
+        Returns
+        -------
+        ret
+            Container with leaves read from the buffer.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([[3.]])})
+        >>> y = x.cont_from_flat_buffer(ivy.array([4., 5., 6.]))
+        >>> print(y)
+        {
+            a: ivy.array([4., 5.]),
+            b: {
+                c: ivy.array([[6.]])
+            }
+        }
+        """
+        leaves = self.cont_to_flat_list()
+        sizes = [int(np.prod(leaf.shape)) for leaf in leaves]
+        if isinstance(buffer, dict):
+            buffers = buffer
+            dtypes = [str(ivy.dtype(leaf)) for leaf in leaves]
+        else:
+            buffers = {None: buffer}
+            dtypes = [None] * len(leaves)
+        for group in dict.fromkeys(dtypes):
+            if group not in buffers:
+                raise ivy.exceptions.IvyException(
+                    "no buffer is given for the leaves of data type {}".format(group)
+                )
+        for group, group_buffer in buffers.items():
+            size = sum([s for s, d in zip(sizes, dtypes) if d == group])
+            if size != group_buffer.shape[0]:
+                raise ivy.exceptions.IvyException(
+                    "buffer of size {} does not match the {} elements of the "
+                    "container{}".format(
+                        group_buffer.shape[0],
+                        size,
+                        "" if group is None else " of data type {}".format(group),
+                    )
+                )
+        views = list()
+        starts = dict.fromkeys(buffers, 0)
+        for leaf, size, group in zip(leaves, sizes, dtypes):
+            start = starts[group]
+            views.append(
+                ivy.reshape(buffers[group][start : start + size], tuple(leaf.shape))
+            )
+            starts[group] = start + size
+        return self.cont_from_flat_list(views)
+
     def cont_has_key(self, query_key):
         """Determine whether container object has specified key somewhere in the nested
         structure.
@@ -2558,8 +3887,27 @@ class ContainerBase(dict, abc.ABC):
             Default value = False)
 
         """
+        if not include_empty:
+            return list(self._cont_get_structure().key_chains)
         return [kc for kc, v in self.cont_to_iterator(include_empty=include_empty)]
 
+    def cont_structural_hash(self):
+        """Return a hash of the structure of the container, namely the key chains of
+        its leaves in order, together with the type, shape and dtype of each leaf.
+
+        The hash is cached, and is only recomputed after the structure of the
+        container has changed, or any of its leaves has been replaced. Leaves which
+        are updated in place with values of a different shape or dtype are not
+        detected.
+
+        Returns
+        -------
+        ret
+            The structural hash, equal for containers with identical structures.
+
+        """
+        return self._cont_get_structure().signature()[0]
+
     def cont_key_chains_containing(self, sub_str, include_empty=False):
         """
 
@@ -3110,6 +4458,7 @@ class ContainerBase(dict, abc.ABC):
         map_sequences=False,
         inplace=False,
         key_chain="",
+        num_workers=None,
     ):
         """Apply function to all array values of container.
 
@@ -3133,16 +4482,46 @@ class ContainerBase(dict, abc.ABC):
             Default is ``False``.
         key_chain
             Chain of keys for this dict entry (Default value = '')
+        num_workers
+            Number of threads to apply the function to large leaves with, when
+            mapping over all leaves. Leaves are always mapped sequentially if
+            ``None`` or ``1``. Default is ``None``.
 
         Returns
         -------
             New container following the function mapped to each sub-array.
 
         """
+        if key_chains is None and key_chain == "":
+            # map over the leaves of the cached structure directly
+            structure = self._cont_get_structure()
+            leaves = structure.leaves()
+            if not map_sequences or not any(
+                isinstance(value, (list, tuple)) for value in leaves
+            ):
+                new_leaves = _cont_apply_leaves(
+                    func, leaves, structure.key_chains, num_workers
+                )
+                if inplace:
+                    for (cont_ref, key), value in zip(structure.slots, new_leaves):
+                        cont_ref()[key] = value
+                    return self
+                return structure.unflatten(new_leaves, prune_empty=prune_unapplied)
+        if isinstance(key_chains, (list, tuple, set, frozenset)):
+            key_chains = _KeyChainIndex(key_chains)
         return_dict = self if inplace else dict()
         for key, value in self.items():
             this_key_chain = key if key_chain == "" else (key_chain + "/" + key)
             if isinstance(value, ivy.Container):
+                if (
+                    (prune_unapplied or inplace)
+                    and to_apply
+                    and not map_sequences
+                    and isinstance(key_chains, _KeyChainIndex)
+                    and not key_chains.is_prefix(this_key_chain + "/")
+                ):
+                    # none of the key chains are below this sub-container
+                    continue
                 ret = value.cont_map(
                     func,
                     key_chains,
@@ -3570,6 +4949,7 @@ class ContainerBase(dict, abc.ABC):
         if inplace:
             self._cont_ivy = ivy_backend
             self._config["ivyh"] = ivy_backend
+            self._cont_version += 1
             return self
         else:
             return ivy.Container(self, ivyh=ivy_backend)
@@ -3944,14 +5324,41 @@ class ContainerBase(dict, abc.ABC):
         conts = list()
         for i in queue_idxs:
             if i not in self._loaded_containers_from_queues:
-                cont = ivy.Container(
-                    self._queues[i].get(timeout=self._queue_timeout), **self._config
-                ).to_ivy()
+                if i in self._queue_futures:
+                    # failed prefetches are dropped, so the item is fetched again on
+                    # the next query
+                    future = self._queue_futures.pop(i)
+                    try:
+                        loaded = future.result(timeout=self._queue_timeout)
+                    except TimeoutError:
+                        self._queue_futures[i] = future
+                        raise queue.Empty
+                else:
+                    loaded = self._queues[i].get(timeout=self._queue_timeout)
+                cont = ivy.Container(loaded, **self._config).to_ivy()
                 self._loaded_containers_from_queues[i] = cont
             else:
                 cont = self._loaded_containers_from_queues[i]
             conts.append(cont)
         combined_cont = self._container_combine_method(conts)
+        if ivy.exists(self._queue_cache_size):
+            # evict the earliest loaded containers not needed by this query
+            for i in list(self._loaded_containers_from_queues):
+                if len(self._loaded_containers_from_queues) <= self._queue_cache_size:
+                    break
+                if i not in queue_idxs:
+                    del self._loaded_containers_from_queues[i]
+        last_idx = max(queue_idxs)
+        for i in range(
+            last_idx + 1, min(last_idx + 1 + self._queue_prefetch, len(self._queues))
+        ):
+            if (
+                i not in self._loaded_containers_from_queues
+                and i not in self._queue_futures
+            ):
+                self._queue_futures[i] = _prefetch_queue_item(
+                    self._queues[i], self._queue_timeout
+                )
         idx = list(queue_idxs)[0]
         offset = 0 if idx == 0 else self._queue_load_sizes_cum[idx - 1]
         if isinstance(query, int):
@@ -4028,8 +5435,41 @@ class ContainerBase(dict, abc.ABC):
         if isinstance(query, str) and ("/" in query or "." in query):
             return self.cont_set_at_key_chain(query, val, inplace=True)
         else:
+            # replacing a leaf with another leaf leaves the structure unchanged
+            if (
+                not dict.__contains__(self, query)
+                or isinstance(val, ivy.Container)
+                or isinstance(dict.__getitem__(self, query), ivy.Container)
+            ):
+                self._cont_version += 1
+            else:
+                self._cont_leaf_version += 1
             return dict.__setitem__(self, query, val)
 
+    def __delitem__(self, key):
+        self._cont_version += 1
+        return dict.__delitem__(self, key)
+
+    def clear(self):
+        self._cont_version += 1
+        return dict.clear(self)
+
+    def pop(self, *args):
+        self._cont_version += 1
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._cont_version += 1
+        return dict.popitem(self)
+
+    def setdefault(self, *args):
+        self._cont_version += 1
+        return dict.setdefault(self, *args)
+
+    def update(self, *args, **kwargs):
+        self._cont_version += 1
+        return dict.update(self, *args, **kwargs)
+
     def __contains__(self, key):
         if isinstance(key, str) and ("/" in key or "." in key):
             return self.cont_has_key_chain(key)
@@ -4040,6 +5480,7 @@ class ContainerBase(dict, abc.ABC):
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        state_dict.pop("_cont_structure", None)
         state_dict["_local_ivy"] = ivy.try_else_none(
             lambda: state_dict["_local_ivy"].current_backend_str()
         )
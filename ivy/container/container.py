@@ -108,6 +108,8 @@ class Container(
         rebuild_child_containers=False,
         types_to_iteratively_nest=None,
         alphabetical_keys=True,
+        queue_prefetch=0,
+        queue_cache_size=None,
         **kwargs
     ):
         ContainerBase.__init__(
@@ -127,6 +129,8 @@ class Container(
             rebuild_child_containers,
             types_to_iteratively_nest,
             alphabetical_keys,
+            queue_prefetch,
+            queue_cache_size,
             **kwargs
         )
 
@@ -943,6 +947,7 @@ class Container(
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        state_dict.pop("_cont_structure", None)
         state_dict["_local_ivy"] = (
             state_dict["_local_ivy"].current_backend_str()
             if state_dict["_local_ivy"] is not None
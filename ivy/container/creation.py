@@ -841,6 +841,110 @@ class ContainerWithCreation(ContainerBase):
             out=out,
         )
 
+    @staticmethod
+    def static_to_dlpack(
+        x: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        /,
+        key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
+        to_apply: bool = True,
+        prune_unapplied: bool = False,
+        map_sequences: bool = False,
+    ) -> ivy.Container:
+        """
+        ivy.Container static method variant of ivy.to_dlpack. This method simply
+        wraps the function, and so the docstring for ivy.to_dlpack also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        x
+            input container.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            a container with DLPack capsules referencing the data of the leaves of
+            ``x``.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b=ivy.array([3., 4.]))
+        >>> capsules = ivy.Container.static_to_dlpack(x)
+        >>> print(type(capsules.a).__name__)
+        PyCapsule
+
+        """
+        return ContainerBase.cont_multi_map_in_function(
+            "to_dlpack",
+            x,
+            key_chains=key_chains,
+            to_apply=to_apply,
+            prune_unapplied=prune_unapplied,
+            map_sequences=map_sequences,
+        )
+
+    def to_dlpack(
+        self: ivy.Container,
+        /,
+        key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
+        to_apply: bool = True,
+        prune_unapplied: bool = False,
+        map_sequences: bool = False,
+    ) -> ivy.Container:
+        """
+        ivy.Container instance method variant of ivy.to_dlpack. This method simply
+        wraps the function, and so the docstring for ivy.to_dlpack also applies to
+        this method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input container.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            a container with DLPack capsules referencing the data of the leaves of
+            ``self``.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b=ivy.array([3., 4.]))
+        >>> capsules = x.to_dlpack()
+        >>> print(type(capsules.b).__name__)
+        PyCapsule
+
+        """
+        return self.static_to_dlpack(
+            self,
+            key_chains,
+            to_apply,
+            prune_unapplied,
+            map_sequences,
+        )
+
     @staticmethod
     def static_native_array(
         x: Union[
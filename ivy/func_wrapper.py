@@ -29,20 +29,9 @@ FN_DECORATORS = [
 
 
 def _get_first_array(*args, **kwargs):
-    # ToDo: make this more efficient, with function ivy.nested_nth_index_where
-    arr = None
-    if args:
-        arr_idxs = ivy.nested_argwhere(args, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(args, arr_idxs[0])
-        else:
-            arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-            if arr_idxs:
-                arr = ivy.index_nest(kwargs, arr_idxs[0])
-    elif kwargs:
-        arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(kwargs, arr_idxs[0])
+    arr = ivy.nested_first_where(args, ivy.is_array) if args else None
+    if arr is None and kwargs:
+        arr = ivy.nested_first_where(kwargs, ivy.is_array)
     return arr
 
 
@@ -50,39 +39,67 @@ def _get_first_array(*args, **kwargs):
 # ---------------#
 
 
-def handle_array_like_without_promotion(fn: Callable) -> Callable:
-    @functools.wraps(fn)
-    def new_fn(*args, **kwargs):
-        args = list(args)
-        num_args = len(args)
-        try:
-            type_hints = inspect.signature(fn).parameters
-        except (TypeError, ValueError):
-            return fn(*args, **kwargs)
-        parameters = list(type_hints.keys())
-        annotations = [param.annotation for param in type_hints.values()]
+def _array_like_plan(fn):
+    """
+    Computes the positions and names of the arguments of `fn` which are annotated
+    as arrays, and so need converting to arrays when passed as array-likes. Computed
+    once when wrapping, to avoid inspecting the signature of `fn` on every call.
 
-        for i, (annotation, parameter, arg) in enumerate(
-            zip(annotations, parameters, args)
+    Parameters
+    ----------
+    fn
+        the function to compute the argument plan for.
+
+    Returns
+    -------
+    ret
+        the tuple of (position, name) pairs of the arguments to convert, where the
+        name is None for arguments which cannot be passed by keyword, or None if
+        the signature of `fn` cannot be inspected.
+    """
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return None
+    plan = list()
+    for i, (parameter, param) in enumerate(type_hints.items()):
+        annotation_str = str(param.annotation)
+        if (
+            ("rray" in annotation_str or "Tensor" in annotation_str)
+            and parameter != "out"
+            and all(
+                sq not in annotation_str
+                for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+            )
         ):
-            annotation_str = str(annotation)
-            if (
-                ("rray" in annotation_str or "Tensor" in annotation_str)
-                and parameter != "out"
-                and all(
-                    sq not in annotation_str
-                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
-                )
-            ):
+            keyword = param.kind in (
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                inspect.Parameter.KEYWORD_ONLY,
+            )
+            plan.append((i, parameter if keyword else None))
+    return tuple(plan)
 
-                if i < num_args:
-                    if not ivy.is_array(arg):
-                        args[i] = ivy.array(arg)
-                elif parameters in kwargs:
-                    kwarg = kwargs[parameter]
-                    if not ivy.is_array(arg):
-                        kwargs[parameter] = ivy.array(kwarg)
 
+def _array_like_to_ivy_arrays(plan, args, kwargs):
+    if not plan:
+        return args, kwargs
+    args = list(args)
+    num_args = len(args)
+    for i, name in plan:
+        if i < num_args:
+            if not ivy.is_array(args[i]):
+                args[i] = ivy.array(args[i])
+        elif name in kwargs and not ivy.is_array(kwargs[name]):
+            kwargs[name] = ivy.array(kwargs[name])
+    return args, kwargs
+
+
+def handle_array_like_without_promotion(fn: Callable) -> Callable:
+    plan = _array_like_plan(fn)
+
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        args, kwargs = _array_like_to_ivy_arrays(plan, args, kwargs)
         return fn(*args, **kwargs)
 
     new_fn.handle_array_like_without_promotion = True
@@ -279,6 +296,14 @@ def infer_dtype(fn: Callable) -> Callable:
     return new_fn
 
 
+def _to_float_array(x):
+    if not ivy.is_array(x) or not ivy.is_int_dtype(x.dtype):
+        return x
+    if ivy.is_ivy_array(x):
+        return ivy.asarray(x, dtype=ivy.default_float_dtype())
+    return ivy.native_array(x, dtype=ivy.default_float_dtype(as_native=True))
+
+
 def integer_arrays_to_float(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def new_fn(*args, **kwargs):
@@ -301,13 +326,6 @@ def integer_arrays_to_float(fn: Callable) -> Callable:
 
         """
 
-        def _to_float_array(x):
-            if not ivy.is_array(x) or not ivy.is_int_dtype(x.dtype):
-                return x
-            if ivy.is_ivy_array(x):
-                return ivy.asarray(x, dtype=ivy.default_float_dtype())
-            return ivy.native_array(x, dtype=ivy.default_float_dtype(as_native=True))
-
         args = ivy.nested_map(args, _to_float_array, to_mutable=True)
         kwargs = ivy.nested_map(kwargs, _to_float_array, to_mutable=True)
         return fn(*args, **kwargs)
@@ -357,6 +375,23 @@ def infer_device(fn: Callable) -> Callable:
 # ------------------------#
 
 
+def _write_to_out(out, ret, handled_in_backend):
+    if handled_in_backend:
+        if isinstance(ret, (tuple, list)):
+            for i in range(len(ret)):
+                out[i].data = ivy.to_native(ret[i])
+        else:
+            out.data = ivy.to_native(ret)
+        return out
+    if not ivy.is_array(ret) and not ivy.is_ivy_container(ret):
+        return ivy.nested_multi_map(
+            lambda x, _: ivy.inplace_update(x[0], ivy.astype(x[1], ivy.dtype(x[0]))),
+            [out, ret],
+        )
+    # return output matches the dtype of the out array to match numpy and torch
+    return ivy.inplace_update(out, ivy.astype(ret, ivy.dtype(out)))
+
+
 def handle_out_argument(fn: Callable) -> Callable:
     handle_out_in_backend = hasattr(fn, "support_native_out")
 
@@ -390,24 +425,10 @@ def handle_out_argument(fn: Callable) -> Callable:
             # compute return, with backend inplace update handled by
             # the backend function
             ret = fn(*args, out=native_out, **kwargs)
-            if isinstance(ret, (tuple, list)):
-                for i in range(len(ret)):
-                    out[i].data = ivy.to_native(ret[i])
-            else:
-                out.data = ivy.to_native(ret)
-            return out
-        # compute return, and then handle the inplace update explicitly
-
-        ret = fn(*args, **kwargs)
-        if not ivy.is_array(ret) and not ivy.is_ivy_container(ret):
-            return ivy.nested_multi_map(
-                lambda x, _: ivy.inplace_update(
-                    x[0], ivy.astype(x[1], ivy.dtype(x[0]))
-                ),
-                [out, ret],
-            )
-        return ivy.inplace_update(out, ivy.astype(ret, ivy.dtype(out)))
-        # return output matches the dtype of the out array to match numpy and torch
+        else:
+            # compute return, and then handle the inplace update explicitly
+            ret = fn(*args, **kwargs)
+        return _write_to_out(out, ret, handle_out_in_backend)
 
     new_fn.handle_out_argument = True
     return new_fn
@@ -417,8 +438,30 @@ def handle_out_argument(fn: Callable) -> Callable:
 # ------------------#
 
 
+def _nest_has_container(nest):
+    # equivalent to ivy.nested_any(nest, ivy.is_ivy_container, check_nests=True),
+    # but only recurses into list, tuple and dict arguments and stops at the first
+    # container found
+    for x in nest.values() if isinstance(nest, dict) else nest:
+        if isinstance(x, ivy.Container):
+            return True
+        if isinstance(x, (list, tuple, dict)) and _nest_has_container(x):
+            return True
+    return False
+
+
+def _container_fn(fn_name, fn):
+    if hasattr(ivy.Container, "static_" + fn_name):
+        return getattr(ivy.Container, "static_" + fn_name)
+    return lambda *args, **kwargs: ivy.Container.cont_multi_map_in_function(
+        fn, *args, **kwargs
+    )
+
+
 def handle_nestable(fn: Callable) -> Callable:
     fn_name = fn.__name__
+    # resolved on the first call with containers, once ivy.Container is complete
+    cont_fn = None
 
     @functools.wraps(fn)
     def new_fn(*args, **kwargs):
@@ -442,16 +485,12 @@ def handle_nestable(fn: Callable) -> Callable:
         # if any of the arguments or keyword arguments passed to the function contains
         # a container, get the container's version of the function and call it using
         # the passed arguments.
-        if hasattr(ivy.Container, "static_" + fn_name):
-            cont_fn = getattr(ivy.Container, "static_" + fn_name)
-        else:
-            cont_fn = lambda *args, **kwargs: ivy.Container.cont_multi_map_in_function(
-                fn, *args, **kwargs
-            )
+        nonlocal cont_fn
         if ivy.get_nestable_mode() and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+            _nest_has_container(args) or _nest_has_container(kwargs)
         ):
+            if cont_fn is None:
+                cont_fn = _container_fn(fn_name, fn)
             return cont_fn(*args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
@@ -462,6 +501,156 @@ def handle_nestable(fn: Callable) -> Callable:
     return new_fn
 
 
+# Fused Dispatch #
+# ---------------#
+
+# decorators which _fused_dispatcher knows how to apply in a single frame
+_FUSABLE_DECORATORS = (
+    "infer_device",
+    "infer_dtype",
+    "integer_arrays_to_float",
+    "outputs_to_ivy_arrays",
+    "outputs_to_native_arrays",
+    "inputs_to_native_arrays",
+    "inputs_to_ivy_arrays",
+    "handle_out_argument",
+    "handle_nestable",
+    "handle_exceptions",
+    "handle_nans",
+    "handle_array_like_without_promotion",
+)
+
+
+def _stack_decorators(fn: Callable, decorators) -> Callable:
+    """Wraps `fn` with each of `decorators` in turn, the first being the innermost."""
+    for attr in decorators:
+        fn = getattr(ivy, attr)(fn)
+    return fn
+
+
+def _fused_dispatcher(fn: Callable, decorators) -> Callable:
+    """
+    Creates a single wrapper for `fn` which performs the steps of all `decorators`,
+    with semantics identical to stacking them via `_stack_decorators`, but without
+    the intermediate python frames of each nested closure.
+
+    Parameters
+    ----------
+    fn
+        the function to wrap.
+    decorators
+        the names of the decorators to apply, in `FN_DECORATORS` order (innermost
+        first). Must all be contained in `_FUSABLE_DECORATORS`.
+
+    Returns
+    -------
+    ret
+        the fused wrapper of `fn`.
+    """
+    decorators = set(decorators)
+    fn_name = fn.__name__
+    array_like = "handle_array_like_without_promotion" in decorators
+    array_like_plan = _array_like_plan(fn) if array_like else None
+    nans = "handle_nans" in decorators
+    nestable = "handle_nestable" in decorators
+    out_arg = "handle_out_argument" in decorators
+    native_out = out_arg and hasattr(fn, "support_native_out")
+    ivy_inputs = "inputs_to_ivy_arrays" in decorators
+    native_inputs = "inputs_to_native_arrays" in decorators
+    native_outputs = "outputs_to_native_arrays" in decorators
+    ivy_outputs = "outputs_to_ivy_arrays" in decorators
+    int_to_float = "integer_arrays_to_float" in decorators
+    dtype_inference = "infer_dtype" in decorators
+    device_inference = "infer_device" in decorators
+    # an empty tuple in an except clause catches nothing
+    if "handle_exceptions" in decorators:
+        ivy_errors, backend_errors = (IndexError, ValueError, AttributeError), Exception
+    else:
+        ivy_errors, backend_errors = (), ()
+    # the container function, mapping the steps inside handle_nestable over the
+    # container leaves if the container has no static method for the function
+    cont_fn = None
+    if nestable:
+        cont_fn = _container_fn(
+            fn_name,
+            _fused_dispatcher(
+                fn,
+                [
+                    attr
+                    for attr in decorators
+                    if FN_DECORATORS.index(attr)
+                    < FN_DECORATORS.index("handle_nestable")
+                ],
+            ),
+        )
+
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        if array_like:
+            args, kwargs = _array_like_to_ivy_arrays(array_like_plan, args, kwargs)
+        if nans:
+            _check_nans(args, kwargs)
+        try:
+            if (
+                nestable
+                and ivy.get_nestable_mode()
+                and (_nest_has_container(args) or _nest_has_container(kwargs))
+            ):
+                return cont_fn(*args, **kwargs)
+            out = kwargs.pop("out", None) if out_arg else None
+            if out is not None and native_out:
+                kwargs["out"] = ivy.to_native(out)
+            if ivy_inputs:
+                has_out = "out" in kwargs
+                if has_out:
+                    ivy_out = kwargs["out"]
+                args, kwargs = ivy.args_to_ivy(
+                    *args, **kwargs, include_derived={tuple: True}
+                )
+                if has_out:
+                    kwargs["out"] = ivy_out
+            if native_inputs and ivy.get_array_mode():
+                has_out = "out" in kwargs
+                if has_out:
+                    native_out_arr = kwargs.pop("out")
+                args, kwargs = ivy.args_to_native(
+                    *args, **kwargs, include_derived={tuple: True}
+                )
+                if has_out:
+                    kwargs["out"] = native_out_arr
+            if int_to_float:
+                args = ivy.nested_map(args, _to_float_array, to_mutable=True)
+                kwargs = ivy.nested_map(kwargs, _to_float_array, to_mutable=True)
+            if dtype_inference:
+                dtype = kwargs.pop("dtype", None)
+                arr = None if ivy.exists(dtype) else _get_first_array(*args, **kwargs)
+                kwargs["dtype"] = ivy.default_dtype(
+                    dtype=dtype, item=arr, as_native=True
+                )
+            if device_inference:
+                device = kwargs.pop("device", None)
+                arr = None if ivy.exists(device) else _get_first_array(*args, **kwargs)
+                kwargs["device"] = ivy.default_device(device, item=arr, as_native=True)
+            ret = fn(*args, **kwargs)
+            if ivy_outputs and ivy.get_array_mode():
+                ret = ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
+            if native_outputs:
+                ret = ivy.to_native(ret, nested=True, include_derived={tuple: True})
+            if out is None:
+                return ret
+            return _write_to_out(out, ret, native_out)
+        except ivy_errors as e:
+            ivy.exceptions._print_traceback_history()
+            raise ivy.exceptions.IvyError(fn_name, str(e))
+        except backend_errors as e:
+            ivy.exceptions._print_traceback_history()
+            raise ivy.exceptions.IvyBackendException(fn_name, str(e))
+
+    for attr in decorators:
+        setattr(new_fn, attr, True)
+    return new_fn
+
+
 # Functions #
 
 
@@ -529,9 +718,15 @@ def _wrap_function(
             for attr in to_replace[compositional]:
                 setattr(original, attr, True)
 
-        for attr in FN_DECORATORS:
-            if hasattr(original, attr) and not hasattr(to_wrap, attr):
-                to_wrap = getattr(ivy, attr)(to_wrap)
+        decorators = [
+            attr
+            for attr in FN_DECORATORS
+            if hasattr(original, attr) and not hasattr(to_wrap, attr)
+        ]
+        if decorators and all(attr in _FUSABLE_DECORATORS for attr in decorators):
+            to_wrap = _fused_dispatcher(to_wrap, decorators)
+        else:
+            to_wrap = _stack_decorators(to_wrap, decorators)
     return to_wrap
 
 
@@ -665,6 +860,25 @@ def _nest_has_nans(x):
     return ivy.nested_any(x, _leaf_has_nans)
 
 
+def _check_nans(args, kwargs):
+    nan_policy = ivy.get_nan_policy()
+    # skip the check if the current nan policy is `nothing``
+    if nan_policy == "nothing":
+        return
+
+    # check all args and kwards for presence of nans
+    result = _nest_has_nans(args) or _nest_has_nans(kwargs)
+
+    if result:
+        # handle nans based on the selected policy
+        if nan_policy == "raise_exception":
+            raise ivy.exceptions.IvyException(
+                "Nans are not allowed in `raise_exception` policy."
+            )
+        elif nan_policy == "warns":
+            logging.warning("Nans are present in the input.")
+
+
 def handle_nans(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def new_fn(*args, **kwargs):
@@ -690,23 +904,7 @@ def handle_nans(fn: Callable) -> Callable:
             The return of the function, with handling of inputs based
             on the selected `nan_policy`.
         """
-        nan_policy = ivy.get_nan_policy()
-        # skip the check if the current nan policy is `nothing``
-        if nan_policy == "nothing":
-            return fn(*args, **kwargs)
-
-        # check all args and kwards for presence of nans
-        result = _nest_has_nans(args) or _nest_has_nans(kwargs)
-
-        if result:
-            # handle nans based on the selected policy
-            if nan_policy == "raise_exception":
-                raise ivy.exceptions.IvyException(
-                    "Nans are not allowed in `raise_exception` policy."
-                )
-            elif nan_policy == "warns":
-                logging.warning("Nans are present in the input.")
-
+        _check_nans(args, kwargs)
         return fn(*args, **kwargs)
 
     new_fn.handle_nans = True
@@ -122,10 +122,18 @@ def eye(
 
 
 def from_dlpack(x, /, *, out: Optional[JaxArray] = None) -> JaxArray:
-    capsule = jax.dlpack.to_dlpack(x)
+    if hasattr(x, "__dlpack__"):
+        # arrays of other frameworks supporting the DLPack protocol
+        capsule = x.__dlpack__()
+    else:
+        capsule = jax.dlpack.to_dlpack(x)
     return jax.dlpack.from_dlpack(capsule)
 
 
+def to_dlpack(x: JaxArray, /):
+    return jax.dlpack.to_dlpack(x)
+
+
 def full(
     shape: Union[ivy.NativeShape, Sequence[int]],
     fill_value: Union[int, float, bool],
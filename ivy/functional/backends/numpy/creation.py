@@ -116,6 +116,10 @@ def from_dlpack(x, /, *, out: Optional[np.ndarray] = None):
     return np.from_dlpack(x)
 
 
+def to_dlpack(x: np.ndarray, /):
+    return x.__dlpack__()
+
+
 def full(
     shape: Union[ivy.NativeShape, Sequence[int]],
     fill_value: Union[int, float, bool],
@@ -215,10 +215,18 @@ def from_dlpack(
     *,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
-    dlcapsule = tf.experimental.dlpack.to_dlpack(x)
+    if hasattr(x, "__dlpack__"):
+        # arrays of other frameworks supporting the DLPack protocol
+        dlcapsule = x.__dlpack__()
+    else:
+        dlcapsule = tf.experimental.dlpack.to_dlpack(x)
     return tf.experimental.dlpack.from_dlpack(dlcapsule)
 
 
+def to_dlpack(x: Union[tf.Tensor, tf.Variable], /):
+    return tf.experimental.dlpack.to_dlpack(x)
+
+
 def full(
     shape: Union[ivy.NativeShape, Sequence[int]],
     fill_value: Union[int, float, bool],
@@ -265,10 +265,16 @@ eye.support_native_out = True
 
 
 def from_dlpack(x, /, *, out: Optional[torch.Tensor] = None):
-    x = x.detach() if x.requires_grad else x
+    # x can also be an array of another framework supporting the DLPack protocol
+    x = x.detach() if getattr(x, "requires_grad", False) else x
     return torch.utils.dlpack.from_dlpack(x)
 
 
+def to_dlpack(x: torch.Tensor, /):
+    x = x.detach() if x.requires_grad else x
+    return torch.utils.dlpack.to_dlpack(x)
+
+
 def full(
     shape: Union[ivy.NativeShape, Sequence[int]],
     fill_value: Union[int, float, bool],
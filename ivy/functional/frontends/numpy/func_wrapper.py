@@ -17,12 +17,7 @@ def handle_numpy_dtype(fn: Callable) -> Callable:
             dtype = args[dtype_pos]
             kwargs = {
                 **dict(
-                    zip(
-                        list(inspect.signature(fn).parameters.keys())[
-                            dtype_pos + 1 : len(args)
-                        ],
-                        args[dtype_pos + 1 :],
-                    )
+                    zip(parameters[dtype_pos + 1 : len(args)], args[dtype_pos + 1 :])
                 ),
                 **kwargs,
             }
@@ -32,7 +27,8 @@ def handle_numpy_dtype(fn: Callable) -> Callable:
             args = args[:-1]
         return fn(*args, dtype=np_frontend.to_ivy_dtype(dtype), **kwargs)
 
-    dtype_pos = list(inspect.signature(fn).parameters).index("dtype")
+    parameters = list(inspect.signature(fn).parameters)
+    dtype_pos = parameters.index("dtype")
     new_fn.handle_numpy_dtype = True
     return new_fn
 
@@ -52,6 +48,19 @@ def _assert_args_and_fn(args, kwargs, dtype, fn):
     )
 
 
+def _array_idxs(nest):
+    # arrays are almost always passed as top-level arguments, in which case their
+    # indices can be read off directly without a full nested search
+    items = nest.items() if isinstance(nest, dict) else enumerate(nest)
+    idxs = list()
+    for k, v in items:
+        if isinstance(v, (list, tuple, dict)):
+            return ivy.nested_argwhere(nest, ivy.is_array)
+        if ivy.is_array(v):
+            idxs.append([k])
+    return idxs
+
+
 def handle_numpy_casting(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def new_fn(*args, casting="same_kind", dtype=None, **kwargs):
@@ -76,9 +85,9 @@ def handle_numpy_casting(fn: Callable) -> Callable:
             message="casting must be one of [no, equiv, safe, same_kind, unsafe]",
         )
         args = list(args)
-        args_idxs = ivy.nested_argwhere(args, ivy.is_array)
+        args_idxs = _array_idxs(args)
         args_to_check = ivy.multi_index_nest(args, args_idxs)
-        kwargs_idxs = ivy.nested_argwhere(kwargs, ivy.is_array)
+        kwargs_idxs = _array_idxs(kwargs)
         kwargs_idxs.remove(["out"]) if ["out"] in kwargs_idxs else kwargs_idxs
         kwargs_to_check = ivy.multi_index_nest(kwargs, kwargs_idxs)
         if (args_to_check or kwargs_to_check) and (
@@ -379,14 +388,7 @@ def handle_numpy_out(fn: Callable) -> Callable:
         if len(args) > (out_pos + 1):
             out = args[out_pos]
             kwargs = {
-                **dict(
-                    zip(
-                        list(inspect.signature(fn).parameters.keys())[
-                            out_pos + 1 : len(args)
-                        ],
-                        args[out_pos + 1 :],
-                    )
-                ),
+                **dict(zip(parameters[out_pos + 1 : len(args)], args[out_pos + 1 :])),
                 **kwargs,
             }
             args = args[:out_pos]
@@ -397,6 +399,7 @@ def handle_numpy_out(fn: Callable) -> Callable:
             return fn(*args, out=out.ivy_array, **kwargs)
         return fn(*args, out=out, **kwargs)
 
-    out_pos = list(inspect.signature(fn).parameters).index("out")
+    parameters = list(inspect.signature(fn).parameters)
+    out_pos = parameters.index("out")
     new_fn.handle_numpy_out = True
     return new_fn
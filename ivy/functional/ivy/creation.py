@@ -1469,6 +1469,36 @@ def from_dlpack(
     return current_backend(x).from_dlpack(x, out=out)
 
 
+@inputs_to_native_arrays
+@handle_nestable
+@handle_exceptions
+def to_dlpack(x: Union[ivy.Array, ivy.NativeArray], /):
+    """Exports the array as a DLPack capsule, which shares the memory of ``x``.
+
+    The capsule can be consumed exactly once, by ``from_dlpack`` of any framework
+    which supports the DLPack protocol on the device where ``x`` resides.
+
+    Parameters
+    ----------
+    x
+        input array.
+
+    Returns
+    -------
+    ret
+        a DLPack capsule referencing the data of ``x``.
+
+    Examples
+    --------
+    >>> x = ivy.array([1., 2., 3.])
+    >>> capsule = ivy.to_dlpack(x)
+    >>> print(type(capsule).__name__)
+    PyCapsule
+
+    """
+    return current_backend(x).to_dlpack(x)
+
+
 # Extra #
 # ------#
 
@@ -1839,3 +1869,102 @@ def logspace(
         device=device,
         out=out,
     )
+
+
+@handle_exceptions
+def memmap(
+    filename: str,
+    /,
+    *,
+    dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+    mode: str = "r+",
+    offset: int = 0,
+    shape: Optional[Union[ivy.Shape, ivy.NativeShape, Sequence[int]]] = None,
+    order: str = "C",
+) -> ivy.Array:
+    """Creates an array backed by the contents of a file on disk, without reading
+    the file into memory.
+
+    The data is mapped with ``numpy.memmap``, and the mapped memory is used directly
+    by the backends which can wrap numpy arrays without copying, such as numpy and
+    torch. Data is only read from disk for the parts of the array which are actually
+    accessed, so indexing a small part of a large file stays cheap. Backends which
+    keep their arrays in separately managed memory, such as jax and tensorflow, copy
+    the data when the array is created.
+
+    Parameters
+    ----------
+    filename
+        path of the file to map.
+    dtype
+        data type of the array elements. Default is the default float data type.
+    mode
+        the mode in which the file is opened, i.e. one of 'r' (read-only), 'r+'
+        (read and write), 'w+' (create or overwrite, then read and write) or 'c'
+        (copy-on-write, where changes are not saved to disk). Default is ``'r+'``.
+    offset
+        offset of the array data in the file, in bytes. Default is ``0``.
+    shape
+        shape of the array. If not given, the array is one dimensional and spans the
+        file from ``offset`` onwards. Required for mode ``'w+'``.
+    order
+        memory layout of the array, either ``'C'`` (row-major) or ``'F'``
+        (column-major). Default is ``'C'``.
+
+    Returns
+    -------
+    ret
+        an array backed by the contents of the file.
+
+    Examples
+    --------
+    >>> x = ivy.memmap("/tmp/x.dat", dtype="float32", mode="w+", shape=(2, 3))
+    >>> x[0] = 1.
+    >>> y = ivy.memmap("/tmp/x.dat", dtype="float32", mode="r", shape=(2, 3))
+    >>> print(y)
+    ivy.array([[1., 1., 1.],
+           [0., 0., 0.]])
+
+    """
+    dtype = ivy.as_ivy_dtype(ivy.default_float_dtype() if dtype is None else dtype)
+    x = np.memmap(
+        filename,
+        dtype=np.dtype(dtype),
+        mode=mode,
+        offset=offset,
+        shape=None if shape is None else tuple(shape),
+        order=order,
+    )
+    return ivy.asarray(x, copy=False)
+
+
+@handle_exceptions
+def load(filepath: str, /, *, mmap: bool = False) -> ivy.Array:
+    """Loads an array from a ``.npy`` file, as written by ``numpy.save``.
+
+    Parameters
+    ----------
+    filepath
+        path of the ``.npy`` file.
+    mmap
+        whether to memory-map the file instead of reading it into memory. The
+        mapping is copy-on-write, so the array can be modified without changing the
+        file. See :func:`ivy.memmap` for the backends which can use the mapped
+        memory without copying. Default is ``False``.
+
+    Returns
+    -------
+    ret
+        the array stored in the file.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> np.save("/tmp/x.npy", np.arange(6, dtype="float32").reshape(2, 3))
+    >>> x = ivy.load("/tmp/x.npy", mmap=True)
+    >>> print(x[1])
+    ivy.array([3., 4., 5.])
+
+    """
+    x = np.load(filepath, mmap_mode="c" if mmap else None)
+    return ivy.asarray(x, copy=False)
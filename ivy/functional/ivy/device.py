@@ -5,8 +5,15 @@ import os
 import gc
 import abc
 import math
+import queue as _queue
+import contextvars as _contextvars
+import numpy as np
 import psutil
 import pynvml
+import tracemalloc as _tracemalloc
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from multiprocessing import resource_tracker as _resource_tracker
+from multiprocessing import shared_memory as _shared_memory
 from typing import Optional, Tuple
 
 # noinspection PyUnresolvedReferences
@@ -30,6 +37,7 @@ default_device_stack = list()
 dev_handles = dict()
 split_factors = dict()
 max_chunk_sizes = dict()
+tuned_chunk_sizes = dict()
 
 
 # Extra #
@@ -912,6 +920,383 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _slice_query(axis, start, stop):
+    if axis < 0:
+        return (Ellipsis, slice(start, stop)) + (slice(None),) * (-axis - 1)
+    return (slice(None),) * axis + (slice(start, stop),)
+
+
+def _slice_along_axis(x, axis, start, stop):
+    return x[_slice_query(axis, start, stop)]
+
+
+def _is_out_of_memory_error(e):
+    msg = str(e).lower()
+    return isinstance(e, MemoryError) or any(
+        m in msg for m in ["out of memory", "oom when allocating", "unable to allocate"]
+    )
+
+
+def _call_with_peak_mem(func, inputs, device):
+    """Call the function, and return its return along with the peak memory in GB
+    used by the call. On CPU, this is the larger of the peak memory traced by
+    tracemalloc and the growth of the memory used by this process, and on GPU the
+    growth of the memory used on the device.
+    """
+    mem_query = "gpu" in device or device == "cpu"
+    if mem_query:
+        mem_before = used_mem_on_dev(device, process_specific=device == "cpu")
+    # the allocations are only traced if tracemalloc is not already in use elsewhere
+    trace = "gpu" not in device and not _tracemalloc.is_tracing()
+    if trace:
+        _tracemalloc.start()
+    try:
+        ret = func(*inputs)
+        peak_mem = _tracemalloc.get_traced_memory()[1] / 1e9 if trace else 0.0
+    finally:
+        if trace:
+            _tracemalloc.stop()
+    if mem_query:
+        mem_after = used_mem_on_dev(device, process_specific=device == "cpu")
+        peak_mem = max(peak_mem, mem_after - mem_before)
+    return ret, peak_mem
+
+
+def _tune_key(func, shape_key):
+    # functions are keyed by name rather than by the function object, such that
+    # closures are not kept alive and functions recreated on each call share sizes
+    return "{}.{}_{}".format(
+        getattr(func, "__module__", None),
+        getattr(func, "__qualname__", type(func).__qualname__),
+        shape_key,
+    )
+
+
+def _split_func_call_tuned(
+    func, inputs, input_axes, chunk_size, memory_budget, device, tune_key
+):
+    """Call the function on consecutive chunks of the inputs, yielding the return and
+    the size of each chunk.
+
+    The peak memory per row is measured on the first chunk only, as measuring slows
+    down the call, and the size of the following chunks is scaled from it towards
+    ``memory_budget``, growing at most two-fold at a time. The size is halved and
+    retried whenever the function runs out of memory, after which it stays below the
+    failed size and the memory is measured again. The latest size is stored in
+    ``tuned_chunk_sizes`` under ``tune_key``, for the next call to start from.
+    """
+    x = inputs[0]
+    shape = x.cont_shape if ivy.is_ivy_container(x) else x.shape
+    dim_size = shape[input_axes[0]]
+    max_size = dim_size
+    # peak memory in GB per row along the split axis
+    row_mem = None
+    start = 0
+    while start < dim_size:
+        size = min(chunk_size, dim_size - start)
+        inps = [
+            _slice_along_axis(inp, axis, start, start + size)
+            for inp, axis in zip(inputs, input_axes)
+        ]
+        try:
+            if row_mem is None:
+                ret, peak_mem = _call_with_peak_mem(func, inps, device)
+                row_mem = peak_mem / size
+            else:
+                ret = func(*inps)
+        except Exception as e:
+            if size == 1 or not _is_out_of_memory_error(e):
+                raise
+            max_size = size - 1
+            chunk_size = size // 2
+            row_mem = None
+            tuned_chunk_sizes[tune_key] = chunk_size
+            continue
+        start += size
+        if row_mem > 0:
+            new_chunk_size = int(memory_budget / row_mem)
+        else:
+            new_chunk_size = dim_size
+        chunk_size = max(1, min(new_chunk_size, 2 * chunk_size, max_size))
+        tuned_chunk_sizes[tune_key] = chunk_size
+        yield ret, size
+
+
+def _chunk_ret(ret, post_fn):
+    if isinstance(ret, tuple):
+        return tuple([post_fn(r) for r in ret])
+    return (post_fn(ret),)
+
+
+def _tree_reduce(fn, values):
+    """Reduce the values with ``fn`` pairwise, level by level, such that each value
+    goes through a logarithmic rather than linear number of reductions.
+    """
+    while len(values) > 1:
+        reduced = [fn(a, b) for a, b in zip(values[0::2], values[1::2])]
+        if len(values) % 2:
+            reduced.append(values[-1])
+        values = reduced
+    return values[0]
+
+
+def _write_chunk(outs, ret, output_axes, start, stop):
+    for out, r, axis in zip(outs, ret, output_axes):
+        if r.shape[axis] != stop - start:
+            raise ivy.exceptions.IvyException(
+                "the outputs of each chunk must have the same size as the chunk along "
+                "the output axes, as those of the first chunk do, but found {} for a "
+                "chunk of size {}".format(r.shape[axis], stop - start)
+            )
+        out[_slice_query(axis, start, stop)] = r
+
+
+def _split_func_call_threads(
+    func, inputs, input_axes, output_axes, bounds, outs, post_fn, num_workers
+):
+    """Call the function on the chunks of the inputs with the given bounds in a
+    thread pool, writing the returns to ``outs`` if these are preallocated, and
+    otherwise returning them in order.
+    """
+
+    def _call_chunk(start, stop):
+        inps = [
+            _slice_along_axis(inp, axis, start, stop)
+            for inp, axis in zip(inputs, input_axes)
+        ]
+        ret = _chunk_ret(func(*inps), post_fn)
+        if outs is None:
+            return ret
+        ret = [ivy.to_native(r) for r in ret]
+        _write_chunk(outs, ret, output_axes, start, stop)
+
+    with _ThreadPoolExecutor(max_workers=num_workers) as executor:
+        # each chunk runs in a copy of the current context, so that backends set
+        # with ivy.using_backend are also used by the worker threads
+        futures = [
+            executor.submit(_contextvars.copy_context().run, _call_chunk, *b)
+            for b in bounds
+        ]
+        return [future.result() for future in futures]
+
+
+def _split_func_call_worker(
+    func, backend, inputs, input_axes, outs, output_axes, bounds, results
+):
+    # spawned workers start without the backend of the parent process, which is
+    # only used within the worker, leaving the global backend untouched
+    with ivy.using_backend(backend):
+        _split_func_call_worker_chunks(
+            func, inputs, input_axes, outs, output_axes, bounds, results
+        )
+
+
+def _split_func_call_worker_chunks(
+    func, inputs, input_axes, outs, output_axes, bounds, results
+):
+    # the blocks stay attached until the worker exits, as the arrays passed to the
+    # function may still view them
+    blocks = [_shared_memory.SharedMemory(name=name) for name, _, _ in inputs]
+    inputs = [
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        for shm, (_, shape, dtype) in zip(blocks, inputs)
+    ]
+    if outs is not None:
+        blocks += [_shared_memory.SharedMemory(name=name) for name, _, _ in outs]
+        outs = [
+            np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            for shm, (_, shape, dtype) in zip(blocks[len(inputs) :], outs)
+        ]
+    for idx, (start, stop) in bounds:
+        try:
+            inps = [
+                ivy.asarray(_slice_along_axis(inp, axis, start, stop))
+                for inp, axis in zip(inputs, input_axes)
+            ]
+            ret = _chunk_ret(func(*inps), ivy.to_numpy)
+            if outs is not None:
+                _write_chunk(outs, ret, output_axes, start, stop)
+                ret = None
+            results.put((idx, ret))
+        except Exception as e:
+            results.put((idx, ivy.exceptions.IvyException(repr(e))))
+            return
+
+
+def _split_func_call_processes(
+    func, inputs, input_axes, output_axes, bounds, outs, num_workers
+):
+    """Call the function on the chunks of the inputs with the given bounds in
+    ``num_workers`` worker processes, which read the inputs from shared memory.
+
+    If ``outs`` holds preallocated numpy outputs, the workers write the returns of
+    each chunk to shared memory copies of these, which are copied back to ``outs``.
+    Otherwise, the returns are sent back as numpy arrays and returned in order.
+    """
+    multiprocessing = ivy.multiprocessing()
+    # the workers must share the resource tracker of this process, which
+    # unregisters the shared memory blocks when they are unlinked here
+    _resource_tracker.ensure_running()
+    results = multiprocessing.Queue()
+    blocks, views, workers = list(), list(), list()
+    finished = False
+
+    def _to_shared(x):
+        shm = _shared_memory.SharedMemory(create=True, size=max(x.nbytes, 1))
+        blocks.append(shm)
+        views.append(np.ndarray(x.shape, dtype=x.dtype, buffer=shm.buf))
+        views[-1][...] = x
+        return shm.name, x.shape, x.dtype.str
+
+    try:
+        shared_inputs = [_to_shared(ivy.to_numpy(inp)) for inp in inputs]
+        shared_outs = None if outs is None else [_to_shared(out) for out in outs]
+        indexed_bounds = list(enumerate(bounds))
+        num_workers = min(num_workers, len(bounds))
+        for i in range(num_workers):
+            worker = multiprocessing.Process(
+                target=_split_func_call_worker,
+                args=(
+                    func,
+                    ivy.current_backend().current_backend_str(),
+                    shared_inputs,
+                    input_axes,
+                    shared_outs,
+                    output_axes,
+                    indexed_bounds[i::num_workers],
+                    results,
+                ),
+                daemon=True,
+            )
+            worker.start()
+            workers.append(worker)
+        rets = [None] * len(bounds)
+        for _ in bounds:
+            while True:
+                try:
+                    idx, ret = results.get(timeout=1)
+                    break
+                except _queue.Empty:
+                    if any(worker.exitcode for worker in workers):
+                        raise ivy.exceptions.IvyException(
+                            "a split_func_call worker process exited unexpectedly"
+                        )
+            if isinstance(ret, Exception):
+                raise ret
+            rets[idx] = ret
+        if outs is not None:
+            for out, view in zip(outs, views[len(inputs) :]):
+                out[...] = view
+        finished = True
+        return rets
+    finally:
+        for worker in workers:
+            if not finished:
+                worker.terminate()
+            worker.join()
+        views.clear()
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def _split_func_call_parallel(
+    func,
+    inputs,
+    mode,
+    input_axes,
+    output_axes,
+    chunk_sizes,
+    post_fn,
+    parallel,
+    num_workers,
+):
+    """Call the function on the chunks of the inputs in parallel, and unify the
+    returns. The first chunk is called up front, and if its outputs are arrays of the
+    same size as the chunk along the output axes, the concatenated outputs are
+    preallocated, and the chunks write their outputs to these in place. The returns
+    of the mean and sum modes are added up with a tree reduction.
+    """
+    ivy.assertions.check_elem_in_list(parallel, ["threads", "processes"])
+    num_workers = ivy.default(num_workers, ivy.num_cpu_cores())
+    bounds = list()
+    start = 0
+    for size in chunk_sizes:
+        bounds.append((start, start + size))
+        start += size
+    inps = [
+        _slice_along_axis(inp, axis, *bounds[0])
+        for inp, axis in zip(inputs, input_axes)
+    ]
+    ret0 = _chunk_ret(func(*inps), post_fn)
+    if output_axes is None:
+        output_axes = [input_axes[0]] * len(ret0)
+    elif isinstance(output_axes, int):
+        output_axes = [output_axes] * len(ret0)
+    outs = None
+    if (
+        mode == "concat"
+        and (parallel == "processes" or ivy.inplace_arrays_supported())
+        and all(
+            ivy.is_array(r) and r.shape[axis] == chunk_sizes[0]
+            for r, axis in zip(ret0, output_axes)
+        )
+    ):
+        outs = list()
+        for r, axis in zip(ret0, output_axes):
+            shape = list(r.shape)
+            shape[axis] = start
+            if parallel == "processes":
+                outs.append(np.empty(shape, dtype=ivy.to_numpy(r).dtype))
+            else:
+                outs.append(ivy.empty(shape, dtype=r.dtype, device=ivy.dev(r)))
+        ret = [ivy.to_numpy(r) if parallel == "processes" else r for r in ret0]
+        _write_chunk(outs, ret, output_axes, *bounds[0])
+    if parallel == "threads":
+        rets = _split_func_call_threads(
+            func,
+            inputs,
+            input_axes,
+            output_axes,
+            bounds[1:],
+            outs,
+            post_fn,
+            num_workers,
+        )
+    else:
+        ivy.assertions.check_true(
+            all(ivy.is_array(inp) for inp in inputs),
+            "split_func_call only supports array inputs in processes",
+        )
+        rets = _split_func_call_processes(
+            func, inputs, input_axes, output_axes, bounds[1:], outs, num_workers
+        )
+        device = ivy.dev(inputs[0])
+        if outs is not None:
+            outs = [ivy.asarray(out, device=device) for out in outs]
+        else:
+            rets = [
+                tuple([post_fn(ivy.asarray(r, device=device)) for r in ret])
+                for ret in rets
+            ]
+    if outs is not None:
+        return outs[0] if len(outs) == 1 else outs
+    rets = [ret0] + rets
+    num_outputs = len(ret0)
+    if mode == "concat":
+        ret = [
+            ivy.concat([r[i] for r in rets], axis=output_axes[i])
+            for i in range(num_outputs)
+        ]
+        return ret[0] if len(ret) == 1 else ret
+    sums = [
+        _tree_reduce(lambda a, b: a + b, [r[i] for r in rets])
+        for i in range(num_outputs)
+    ]
+    sums_or_means = [s / len(rets) for s in sums] if mode == "mean" else sums
+    return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -925,6 +1310,9 @@ def split_func_call(
     output_axes: Union[int, Iterable[int]] = None,
     stop_gradients: bool = False,
     device: Union[ivy.Device, ivy.NativeDevice] = None,
+    memory_budget: float = None,
+    parallel: str = None,
+    num_workers: int = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """Call a function by splitting its inputs along a given axis, and calling the
     function in chunks, rather than feeding the entire input array at once. This can be
@@ -954,6 +1342,27 @@ def split_func_call(
         Whether to stop the gradients for each computed return. Default is ``False``.
     device
         The device to set the split factor for. Sets the default device by default.
+    memory_budget
+        The peak memory in GB which each chunk may use on the device. If specified,
+        the chunk size is tuned on the fly, from the peak memory measured for each
+        chunk, and halved whenever the function runs out of memory. The tuned size is
+        stored per function name and input shapes in ``ivy.tuned_chunk_sizes``, and used
+        as the starting size of the next call. Default is ``None``, in which case the
+        chunk size is fixed.
+    parallel
+        How to call the function on the chunks in parallel, must be one of
+        [ threads | processes ]. Threads suit functions whose kernels release the GIL,
+        while processes suit functions dominated by Python code, and receive the
+        inputs through shared memory. For processes, the inputs must be arrays, and
+        the function picklable unless processes are forked. If the outputs of the
+        first chunk have the same size as it along the output axes, the concatenated
+        outputs are preallocated and written to in place, otherwise the chunks are
+        concatenated. The outputs of the mean and sum modes are added up with a tree
+        reduction. Cannot be combined with ``memory_budget``. Default is ``None``, in
+        which case the chunks are called one after another.
+    num_workers
+        The number of threads or processes to call the chunks in. Default is ``None``,
+        in which case the number of CPU cores is used.
 
     Returns
     -------
@@ -963,8 +1372,8 @@ def split_func_call(
     """
     if isinstance(input_axes, int):
         input_axes = [input_axes] * len(inputs)
+    shape_key = "_".join([str(inp.shape) for inp in inputs])
     if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
-        shape_key = "_".join([str(inp.shape) for inp in inputs])
         if shape_key in max_chunk_sizes:
             max_chunk_size = max_chunk_sizes[shape_key]
         else:
@@ -982,47 +1391,79 @@ def split_func_call(
         with_callable=True,
     )
     dim_size = inputs[0].shape[input_axes[0]]
-    if chunk_size >= dim_size:
-        return func(*inputs)
-    num_chunks = dim_size / chunk_size
-    num_chunks_floored = math.floor(num_chunks)
-    num_chunks_ceiled = math.ceil(num_chunks)
-    chunk_sizes = [chunk_size] * num_chunks_floored
-    if num_chunks != num_chunks_floored:
-        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
-    inputs_split = [
-        ivy.split(
-            inp, num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
-        )
-        if ivy.is_array(inp)
-        else inp.split(
-            num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
-        )
-        for i, inp in enumerate(inputs)
-    ]
     is_mean = mode == "mean"
     is_sum = mode == "sum"
     post_fn = ivy.stop_gradient if stop_gradients else lambda x: x
+    tuned = ivy.exists(memory_budget)
+    ivy.assertions.check_false(
+        tuned and ivy.exists(parallel),
+        "memory_budget cannot be combined with parallel chunks",
+    )
+    if tuned:
+        tune_key = _tune_key(func, shape_key)
+        chunks = _split_func_call_tuned(
+            func,
+            inputs,
+            input_axes,
+            tuned_chunk_sizes.get(tune_key, chunk_size),
+            memory_budget,
+            ivy.default_device(device, as_native=False),
+            tune_key,
+        )
+    else:
+        if chunk_size >= dim_size:
+            return func(*inputs)
+        num_chunks = dim_size / chunk_size
+        num_chunks_floored = math.floor(num_chunks)
+        num_chunks_ceiled = math.ceil(num_chunks)
+        chunk_sizes = [chunk_size] * num_chunks_floored
+        if num_chunks != num_chunks_floored:
+            chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
+        if ivy.exists(parallel):
+            return _split_func_call_parallel(
+                func,
+                inputs,
+                mode,
+                input_axes,
+                output_axes,
+                chunk_sizes,
+                post_fn,
+                parallel,
+                num_workers,
+            )
+        inputs_split = [
+            ivy.split(
+                inp,
+                num_or_size_splits=chunk_sizes,
+                axis=input_axes[i],
+                with_remainder=True,
+            )
+            if ivy.is_array(inp)
+            else inp.split(
+                num_or_size_splits=chunk_sizes, axis=input_axes[i], with_remainder=True
+            )
+            for i, inp in enumerate(inputs)
+        ]
+        chunks = ((func(*inps), None) for inps in zip(*inputs_split))
     if is_mean or is_sum:
         sums = None
-        for inps in zip(*inputs_split):
+        for ret, size in chunks:
+            ret = (
+                [post_fn(r) for r in ret] if isinstance(ret, tuple) else [post_fn(ret)]
+            )
+            # the tuned chunks differ in size, so their means are weighted by size
+            if tuned and is_mean:
+                ret = [r * (size / dim_size) for r in ret]
             if not sums:
-                sums = func(*inps)
-                sums = (
-                    [post_fn(s) for s in sums]
-                    if isinstance(sums, tuple)
-                    else [post_fn(sums)]
-                )
+                sums = ret
             else:
-                ret = func(*inps)
-                if isinstance(ret, tuple):
-                    for i, r in enumerate(ret):
-                        sums[i] = sums[i] + post_fn(r)
-                else:
-                    sums[0] = sums[0] + post_fn(ret)
-        sums_or_means = [s / num_chunks_ceiled for s in sums] if is_mean else sums
+                for i, r in enumerate(ret):
+                    sums[i] = sums[i] + r
+        sums_or_means = (
+            [s / num_chunks_ceiled for s in sums] if is_mean and not tuned else sums
+        )
         return sums_or_means[0] if len(sums_or_means) == 1 else tuple(sums_or_means)
-    rets = [func(*i) for i in zip(*inputs_split)]
+    rets = [ret for ret, _ in chunks]
     rets = [
         tuple([post_fn(r) for r in ret]) if isinstance(ret, tuple) else (post_fn(ret),)
         for ret in rets
@@ -709,6 +709,73 @@ def to_numpy(
     return current_backend(x).to_numpy(x, copy=copy)
 
 
+@handle_exceptions
+def as_backend(
+    x: Union[ivy.Array, ivy.NativeArray], backend: str, /
+) -> Tuple[ivy.NativeArray, bool]:
+    """Converts an array into a native array of the framework ``backend``, sharing
+    the memory of ``x`` whenever the layout and device allow it.
+
+    The data is exchanged without copying via the DLPack protocol, or via the numpy
+    ``__array_interface__`` when ``x`` exposes it. Only if neither is possible, for
+    example for arrays which require gradients or for devices not supported by the
+    target framework, is the data copied through numpy.
+
+    Parameters
+    ----------
+    x
+        input array, of any of the supported frameworks.
+    backend
+        the framework to convert to, i.e. one of 'jax', 'torch', 'tensorflow',
+        'numpy'.
+
+    Returns
+    -------
+    ret
+        a tuple of the native array of ``backend`` and a boolean which is ``True``
+        if the data had to be copied, and ``False`` if the memory is shared with
+        ``x``.
+
+    Examples
+    --------
+    >>> x = ivy.array([1., 2., 3.])
+    >>> y, copied = ivy.as_backend(x, "numpy")
+    >>> print(y, copied)
+    [1. 2. 3.] False
+
+    """
+    x = x.data if ivy.is_ivy_array(x) else x
+    target = ivy.get_backend(backend)
+    source = ivy.backend_handler._determine_backend_from_args([x])
+    if source is target:
+        return x, False
+    to_numpy = target.backend == "numpy"
+    if hasattr(x, "__dlpack__"):
+        try:
+            return target.from_dlpack(x), False
+        except Exception:
+            pass
+    if source is not None and not to_numpy:
+        # frameworks which only exchange DLPack capsules
+        try:
+            return target.from_dlpack(source.to_dlpack(x)), False
+        except Exception:
+            pass
+    if hasattr(x, "__array_interface__"):
+        x_np = np.asarray(x)
+        if to_numpy:
+            return x_np, False
+        try:
+            return target.from_dlpack(x_np), False
+        except Exception:
+            pass
+    # the memory cannot be shared, so the data is copied through numpy
+    x_np = np.ascontiguousarray(source.to_numpy(x) if source else np.array(x))
+    if to_numpy:
+        return x_np, True
+    return target.from_dlpack(x_np), True
+
+
 @handle_nestable
 @handle_exceptions
 def isscalar(x: Any, /) -> bool:
@@ -1668,7 +1735,7 @@ def current_backend_str() -> Union[str, None]:
 
     """
     fw = current_backend()
-    if not backend_stack:
+    if not backend_stack and not ivy.backend_handler._backend_context.get():
         return ""
     return fw.current_backend_str()
 
@@ -1971,6 +2038,7 @@ def set_min_denominator(val: float) -> None:
 
     """
     ivy._MIN_DENOMINATOR = val
+    ivy.backend_handler._ivy_dict_modified()
 
 
 @handle_exceptions
@@ -2016,6 +2084,7 @@ def set_min_base(val: float) -> None:
 
     """
     ivy._MIN_BASE = val
+    ivy.backend_handler._ivy_dict_modified()
 
 
 @inputs_to_ivy_arrays
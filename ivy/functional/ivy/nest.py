@@ -786,6 +786,117 @@ def nested_argwhere(
     return [index for index in _indices if index]
 
 
+def _nested_where(nest, fn, check_nests, to_ignore, _index):
+    # yields the (index, value) pairs where fn evaluates as True lazily, in the same
+    # depth-first order as nested_argwhere, so searches can stop at the first match,
+    # with the nest itself never being a match of its own search
+    if isinstance(nest, (tuple, list)) and not isinstance(nest, to_ignore):
+        for i, item in enumerate(nest):
+            yield from _nested_where(item, fn, check_nests, to_ignore, _index + [i])
+        if check_nests and _index and fn(nest):
+            yield _index, nest
+    elif (isinstance(nest, dict) or isinstance(nest, UserDict)) and not isinstance(
+        nest, to_ignore
+    ):
+        for k, v in nest.items():
+            yield from _nested_where(v, fn, check_nests, to_ignore, _index + [k])
+        if check_nests and _index and fn(nest):
+            yield _index, nest
+    elif fn(nest):
+        yield _index, nest
+
+
+@handle_exceptions
+def nested_nth_index_where(
+    nest: Iterable,
+    fn: Callable,
+    /,
+    n: int = 0,
+    *,
+    check_nests: bool = False,
+    to_ignore: Optional[Union[type, Tuple[type]]] = None,
+) -> Optional[List]:
+    """Returns the index of the nth leaf node of the nest where fn evaluates as True,
+    stopping the search as soon as it is found, rather than finding all indices as
+    done by ivy.nested_argwhere.
+
+    Parameters
+    ----------
+    nest
+        The nest to check the leaves of.
+    fn
+        The conditon function, returning True or False.
+    n
+        The number of matching leaves to skip before returning an index. Default is
+        ``0``, returning the index of the first match.
+    check_nests
+        Whether to also check the nests for the condition, not only nest leaves.
+        Default is ``False``.
+    to_ignore
+        Types to ignore when deciding whether to go deeper into the nest or not
+
+    Returns
+    -------
+    ret
+        The index of the nth match, or None if fewer than n + 1 leaves match.
+
+    Examples
+    --------
+    >>> nest = [[1, -2, 3], {"a": -4, "b": 5}]
+    >>> print(ivy.nested_nth_index_where(nest, lambda x: x < 0, 1))
+    [1, 'a']
+    """
+    to_ignore = ivy.default(to_ignore, ())
+    for i, (index, _) in enumerate(_nested_where(nest, fn, check_nests, to_ignore, [])):
+        if i == n:
+            return index
+    return None
+
+
+@handle_exceptions
+def nested_first_where(
+    nest: Iterable,
+    fn: Callable,
+    /,
+    *,
+    check_nests: bool = False,
+    to_ignore: Optional[Union[type, Tuple[type]]] = None,
+    default: Any = None,
+) -> Any:
+    """Returns the first leaf node of the nest where fn evaluates as True, stopping the
+    search as soon as it is found.
+
+    Parameters
+    ----------
+    nest
+        The nest to check the leaves of.
+    fn
+        The conditon function, returning True or False.
+    check_nests
+        Whether to also check the nests for the condition, not only nest leaves.
+        Default is ``False``.
+    to_ignore
+        Types to ignore when deciding whether to go deeper into the nest or not
+    default
+        The value to return if no leaf matches. Default is ``None``.
+
+    Returns
+    -------
+    ret
+        The first matching leaf, or `default` if no leaf matches.
+
+    Examples
+    --------
+    >>> nest = {"a": [1, 2], "b": ivy.array([3.0])}
+    >>> print(ivy.nested_first_where(nest, ivy.is_array))
+    ivy.array([3.])
+    """
+    to_ignore = ivy.default(to_ignore, ())
+    for _, value in _nested_where(nest, fn, check_nests, to_ignore, []):
+        return value
+    return default
+
+
 @handle_exceptions
 def all_nested_indices(
     nest: Iterable,
@@ -957,6 +1068,233 @@ def map(
     return rets
 
 
+# the kinds of nodes of a nest, which decide how each node is rebuilt
+_TREE_TUPLE, _TREE_LIST, _TREE_DICT = 0, 1, 2
+_TREE_NAMEDTUPLE, _TREE_DERIVED_SEQUENCE, _TREE_DERIVED_DICT = 3, 4, 5
+
+
+class TreeDef:
+    """The structure of a nest, as returned by :func:`ivy.tree_flatten`, from which
+    the nest can be rebuilt with new leaves by :func:`ivy.tree_unflatten`.
+
+    Tree definitions are hashable and immutable, and equal structures share the
+    same cached instance, so that comparing them is usually an identity check.
+    """
+
+    __slots__ = ("_nodes", "_hash", "_plan", "num_leaves", "mutable")
+
+    def __init__(self, nodes):
+        self._nodes = nodes
+        self._hash = hash(nodes)
+        plan = list()
+        for node in reversed(nodes):
+            if node is None:
+                plan.append(None)
+                continue
+            cls, keys, num_children = node
+            if cls is tuple:
+                kind = _TREE_TUPLE
+            elif cls is list:
+                kind = _TREE_LIST
+            elif cls is dict:
+                kind = _TREE_DICT
+            elif issubclass(cls, tuple) and keys is not None:
+                kind = _TREE_NAMEDTUPLE
+            elif issubclass(cls, (tuple, list)):
+                kind = _TREE_DERIVED_SEQUENCE
+            else:
+                kind = _TREE_DERIVED_DICT
+            plan.append((kind, cls, keys, num_children))
+        self._plan = tuple(plan)
+        self.num_leaves = sum([node is None for node in nodes])
+        self.mutable = any(
+            [node is not None and issubclass(node[0], (list, dict)) for node in nodes]
+        )
+
+    def __eq__(self, other):
+        return self is other or (
+            isinstance(other, TreeDef) and self._nodes == other._nodes
+        )
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return "TreeDef(num_nodes={}, num_leaves={})".format(
+            len(self._nodes), self.num_leaves
+        )
+
+
+_tree_defs = dict()
+_tree_defs_max_size = 1024
+
+
+def _tree_def(nodes):
+    tree_def = _tree_defs.get(nodes)
+    if tree_def is None:
+        if len(_tree_defs) >= _tree_defs_max_size:
+            _tree_defs.clear()
+        tree_def = TreeDef(nodes)
+        _tree_defs[nodes] = tree_def
+    return tree_def
+
+
+def _tree_flatten(nest, derived_tuple, derived_list, derived_dict, to_ignore):
+    leaves, nodes = list(), list()
+    stack = [nest]
+    while stack:
+        x = stack.pop()
+        cls = type(x)
+        if to_ignore and isinstance(x, to_ignore):
+            keys, children = None, None
+        elif cls is tuple or (derived_tuple and isinstance(x, tuple)):
+            keys, children = getattr(x, "_fields", None), list(x)
+        elif cls is list or (derived_list and isinstance(x, list)):
+            keys, children = None, list(x)
+        elif cls is dict or (derived_dict and isinstance(x, dict)):
+            keys, children = tuple(x.keys()), list(x.values())
+        else:
+            keys, children = None, None
+        if children is None:
+            leaves.append(x)
+            nodes.append(None)
+            continue
+        nodes.append((cls, keys, len(children)))
+        children.reverse()
+        stack.extend(children)
+    return leaves, _tree_def(tuple(nodes))
+
+
+def _tree_update_inplace(
+    nest, ret, derived_tuple, derived_list, derived_dict, to_ignore
+):
+    # updates the lists and dicts of `nest` in place with the children of the
+    # corresponding nodes of `ret`, which has the same structure
+    stack = [(nest, ret)]
+    while stack:
+        x, new = stack.pop()
+        cls = type(x)
+        if to_ignore and isinstance(x, to_ignore):
+            continue
+        if cls is tuple or (derived_tuple and isinstance(x, tuple)):
+            stack.extend(zip(x, new))
+        elif cls is list or (derived_list and isinstance(x, list)):
+            children = list(x)
+            x[:] = new
+            stack.extend(zip(children, new))
+        elif cls is dict or (derived_dict and isinstance(x, dict)):
+            children = list(x.items())
+            x.update(new)
+            stack.extend([(v, new[k]) for k, v in children])
+
+
+def _include_derived_flags(include_derived):
+    if include_derived is True:
+        return True, True, True
+    if not include_derived:
+        return False, False, False
+    return tuple([bool(include_derived.get(t, False)) for t in (tuple, list, dict)])
+
+
+@handle_exceptions
+def tree_flatten(
+    nest: Any,
+    /,
+    *,
+    include_derived: Optional[Union[Dict[type, bool], bool]] = None,
+    to_ignore: Optional[Union[type, Tuple[type]]] = None,
+) -> Tuple[List, TreeDef]:
+    """Flattens a nest into a list of its leaves, and the definition of its structure.
+    All dicts, lists and tuples are traversed in the same order as
+    :func:`ivy.nested_map`, iteratively, so that deep nests do not hit the recursion
+    limit.
+
+    Parameters
+    ----------
+    nest
+        The nest to flatten.
+    include_derived
+        Whether to also traverse classes derived from tuple, list and dict, such as
+        named tuples or ivy.Container instances. Default is ``False``.
+    to_ignore
+        Types to treat as leaves, even if they are tuples, lists or dicts.
+
+    Returns
+    -------
+    ret
+        The leaves of the nest, and the hashable definition of its structure.
+
+    Examples
+    --------
+    >>> leaves, tree_def = ivy.tree_flatten({'a': [1, 2], 'b': (3,)})
+    >>> print(leaves)
+    [1, 2, 3]
+    >>> print(ivy.tree_unflatten(tree_def, [4, 5, 6]))
+    {'a': [4, 5], 'b': (6,)}
+    """
+    return _tree_flatten(
+        nest,
+        *_include_derived_flags(include_derived),
+        ivy.default(to_ignore, ()),
+    )
+
+
+@handle_exceptions
+def tree_unflatten(tree_def: TreeDef, leaves: Sequence, /) -> Any:
+    """Builds a nest with the structure defined by ``tree_def``, as returned by
+    :func:`ivy.tree_flatten`, and with the given leaves.
+
+    Parameters
+    ----------
+    tree_def
+        The definition of the structure of the nest.
+    leaves
+        The leaves of the new nest, in the order returned by :func:`ivy.tree_flatten`.
+
+    Returns
+    -------
+    ret
+        The new nest.
+
+    Examples
+    --------
+    >>> leaves, tree_def = ivy.tree_flatten([(1, 2), {'a': 3}])
+    >>> print(ivy.tree_unflatten(tree_def, [x * 2 for x in leaves]))
+    [(2, 4), {'a': 6}]
+    """
+    if len(leaves) != tree_def.num_leaves:
+        raise ivy.exceptions.IvyException(
+            "expected {} leaves, but found {}".format(tree_def.num_leaves, len(leaves))
+        )
+    values = list()
+    leaf_idx = len(leaves)
+    for node in tree_def._plan:
+        if node is None:
+            leaf_idx -= 1
+            values.append(leaves[leaf_idx])
+            continue
+        kind, cls, keys, num_children = node
+        if num_children:
+            children = values[-num_children:]
+            children.reverse()
+            del values[-num_children:]
+        else:
+            children = list()
+        if kind == _TREE_TUPLE:
+            values.append(tuple(children))
+        elif kind == _TREE_LIST:
+            values.append(children)
+        elif kind == _TREE_DICT:
+            values.append(dict(zip(keys, children)))
+        elif kind == _TREE_NAMEDTUPLE:
+            values.append(cls(*children))
+        elif kind == _TREE_DERIVED_SEQUENCE:
+            values.append(cls(children))
+        else:
+            values.append(cls(**dict(zip(keys, children))))
+    return values[0]
+
+
 @handle_exceptions
 def nested_map(
     x: Union[ivy.Array, ivy.NativeArray, Iterable],
@@ -1025,6 +1363,23 @@ def nested_map(
     for t in (tuple, list, dict):
         if t not in include_derived:
             include_derived[t] = False
+    if (
+        not to_mutable
+        and not extra_nest_types
+        and max_depth is None
+        and _depth == 0
+        and _tuple_check_fn is None
+        and _list_check_fn is None
+        and _dict_check_fn is None
+    ):
+        # the nest is traversed iteratively instead, and then updated in place
+        # from the new nest if shallow
+        derived = (include_derived[tuple], include_derived[list], include_derived[dict])
+        leaves, tree_def = _tree_flatten(x, *derived, to_ignore)
+        ret = tree_unflatten(tree_def, [fn(leaf) for leaf in leaves])
+        if shallow:
+            _tree_update_inplace(x, ret, *derived, to_ignore)
+        return ret
     if ivy.exists(max_depth) and _depth > max_depth:
         return x
     class_instance = type(x)
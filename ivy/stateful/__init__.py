@@ -2,6 +2,8 @@ from . import activations
 from .activations import *
 from . import converters
 from .converters import *
+from . import data_parallel
+from .data_parallel import *
 from . import initializers
 from .initializers import *
 from . import layers
@@ -14,3 +16,5 @@ from . import optimizers
 from .optimizers import *
 from . import sequential
 from .sequential import *
+from . import shared_array_pool
+from .shared_array_pool import *
@@ -0,0 +1,363 @@
+"""Data-parallel execution of modules across local worker processes"""
+
+# global
+import queue as _queue
+import weakref as _weakref
+import numpy as _np
+from multiprocessing import resource_tracker as _resource_tracker
+from multiprocessing import shared_memory as _shared_memory
+
+# local
+import ivy
+from ivy.container.base import _from_shared_memory, _to_shared_memory
+from ivy.functional.ivy.gradients import _is_variable
+
+
+# the arrays in a shared memory block start at multiples of this many bytes
+_shared_alignment = 64
+
+
+class _SharedArrays:
+    """Numpy arrays with the given shapes and dtypes, laid out in a single shared
+    memory block, which is created if no name is given and attached to otherwise.
+    """
+
+    def __init__(self, specs, name=None):
+        self.specs = tuple(specs)
+        offsets = list()
+        size = 0
+        for shape, dtype in self.specs:
+            offsets.append(size)
+            nbytes = int(_np.prod(shape)) * _np.dtype(dtype).itemsize
+            size += -(-nbytes // _shared_alignment) * _shared_alignment
+        self._shm = _shared_memory.SharedMemory(
+            name=name, create=name is None, size=max(size, 1) if name is None else 0
+        )
+        self.name = self._shm.name
+        self.arrays = [
+            _np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset)
+            for (shape, dtype), offset in zip(self.specs, offsets)
+        ]
+
+    @property
+    def spec(self):
+        return self.name, self.specs
+
+    def close(self, unlink=False):
+        self.arrays = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # arrays viewing the block are still alive, and the block is then
+            # unmapped once these are released
+            pass
+        if unlink:
+            self._shm.unlink()
+
+
+def _attach(attached, spec):
+    name, specs = spec
+    if name not in attached:
+        attached[name] = _SharedArrays(specs, name=name)
+    return attached[name].arrays
+
+
+def _data_parallel_worker(
+    module, loss_fn, backend, as_variables, idx, commands, results
+):
+    # spawned workers start without the backend of the parent process, which is
+    # only used within the worker, leaving the global backend untouched
+    with ivy.using_backend(backend):
+        _data_parallel_worker_commands(
+            module, loss_fn, as_variables, idx, commands, results
+        )
+
+
+def _data_parallel_worker_commands(
+    module, loss_fn, as_variables, idx, commands, results
+):
+    attached = dict()
+    while True:
+        command = commands.get()
+        if command is None:
+            return
+        mode, v_spec, batch_spec, grads_spec, tree_def, leaves, bounds = command
+        # blocks which have since been replaced by the parent are detached
+        for name in list(attached):
+            if name not in [v_spec[0], batch_spec[0], grads_spec[0]]:
+                attached.pop(name).close()
+        try:
+            v = [ivy.asarray(x, device=module._dev) for x in _attach(attached, v_spec)]
+            if as_variables:
+                v = [ivy.variable(x) for x in v]
+            v = module.v.cont_from_flat_list(v)
+            leaves = list(leaves)
+            array_leaves = iter(_attach(attached, batch_spec))
+            for i, leaf in enumerate(leaves):
+                if leaf is None:
+                    x = next(array_leaves)[bounds[0] : bounds[1]]
+                    leaves[i] = ivy.asarray(x, device=module._dev)
+            batch = ivy.tree_unflatten(tree_def, leaves)
+            if mode == "call":
+                ret_leaves, ret_def = ivy.tree_flatten(module(*batch, v=v))
+                ret_leaves = [
+                    ivy.to_numpy(x) if ivy.is_array(x) else x for x in ret_leaves
+                ]
+                results.put((idx, (_to_shared_memory(ret_leaves), ret_def)))
+                continue
+            loss, grads = ivy.execute_with_gradients(
+                lambda v_: loss_fn(module, v_, *batch), v
+            )
+            # grads are None for backends without autograd, such as numpy
+            if grads is not None:
+                grads_out = _attach(attached, grads_spec)
+                num_leaves = len(v_spec[1])
+                grads_out = grads_out[idx * num_leaves : (idx + 1) * num_leaves]
+                for out, grad in zip(grads_out, grads.cont_to_flat_list()):
+                    out[...] = 0 if grad is None else ivy.to_numpy(grad)
+            results.put((idx, (ivy.to_numpy(loss), grads is not None)))
+        except Exception as e:
+            results.put((idx, ivy.exceptions.IvyException(repr(e))))
+
+
+def _stop_data_parallel_workers(commands, workers, blocks):
+    for worker_commands in commands:
+        worker_commands.put(None)
+    for worker in workers:
+        worker.join(timeout=5)
+        if worker.is_alive():
+            worker.terminate()
+            worker.join()
+    for block in blocks:
+        block.close(unlink=True)
+
+
+class DataParallel:
+    """DataParallel calls a module on batches split across worker processes."""
+
+    def __init__(self, module, /, *, loss_fn=None, num_workers=None, context=None):
+        """
+        Replicate a built module across local worker processes, on the virtual
+        devices ``cpu:0`` to ``cpu:N-1``, to call it on batches split across these.
+
+        The batches are scattered to the workers through shared memory, with each
+        worker receiving a contiguous part along the first axis. The variables of
+        the module are broadcast to the workers through shared memory on each call,
+        so updates of ``module.v`` are picked up by the replicas, and the gradients
+        of the workers are gathered in shared memory and averaged with
+        ``ivy.Container.cont_reduce``.
+
+        Parameters
+        ----------
+        module
+            The module to replicate.
+        loss_fn
+            The function ``loss_fn(module, v, *batch)`` returning the mean loss of the
+            module with variables ``v`` for a part of a batch, used by
+            :meth:`execute_with_gradients`. Default is ``None``.
+        num_workers
+            The number of worker processes. Default is ``None``, in which case the
+            number of devices the module was created with is used if there are
+            several, and otherwise the number of CPU cores.
+        context
+            The multiprocessing context to start the workers with, either fork,
+            forkserver or spawn. Unless the workers are forked, the module and
+            ``loss_fn`` must be picklable. Default is ``None``.
+        """
+        ivy.assertions.check_true(
+            module.built_, "the module must be built to be replicated"
+        )
+        self._module = module
+        self._loss_fn = loss_fn
+        num_workers = ivy.default(
+            num_workers,
+            len(module._devs) if len(module._devs) > 1 else ivy.num_cpu_cores(),
+        )
+        self.devices = ["cpu:{}".format(i) for i in range(num_workers)]
+        v_leaves = module.v.cont_to_flat_list()
+        self._v = _SharedArrays(
+            [(tuple(x.shape), ivy.to_numpy(x).dtype.str) for x in v_leaves]
+        )
+        self._grads = _SharedArrays(self._v.specs * num_workers)
+        self._batch = None
+        self._blocks = [self._v, self._grads]
+        self._commands, self._workers = list(), list()
+        self._finalizer = _weakref.finalize(
+            self,
+            _stop_data_parallel_workers,
+            self._commands,
+            self._workers,
+            self._blocks,
+        )
+        multiprocessing = ivy.multiprocessing(context)
+        # the workers must share the resource tracker of this process, which
+        # unregisters the shared memory blocks when they are unlinked here
+        _resource_tracker.ensure_running()
+        self._results = multiprocessing.Queue()
+        as_variables = any(_is_variable(x) for x in v_leaves)
+        for i in range(num_workers):
+            self._commands.append(multiprocessing.Queue())
+            worker = multiprocessing.Process(
+                target=_data_parallel_worker,
+                args=(
+                    module,
+                    loss_fn,
+                    ivy.current_backend().current_backend_str(),
+                    as_variables,
+                    i,
+                    self._commands[i],
+                    self._results,
+                ),
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    # Private #
+    # --------#
+
+    def _get_result(self):
+        while True:
+            try:
+                return self._results.get(timeout=1)
+            except _queue.Empty:
+                if any(worker.exitcode for worker in self._workers):
+                    raise ivy.exceptions.IvyException(
+                        "a DataParallel worker process exited unexpectedly"
+                    )
+
+    def _run(self, mode, batch):
+        """Scatter the batch and the variables of the module to the workers, and
+        return the weight and the result of each worker which received a part of
+        the batch.
+        """
+        ivy.assertions.check_true(
+            self._finalizer.alive, "the DataParallel workers are closed"
+        )
+        leaves, tree_def = ivy.tree_flatten(batch)
+        arrays = [ivy.to_numpy(x) for x in leaves if ivy.is_array(x)]
+        ivy.assertions.check_true(arrays, "the batch must contain arrays to split")
+        specs = tuple([(x.shape, x.dtype.str) for x in arrays])
+        if self._batch is None or self._batch.specs != specs:
+            if self._batch is not None:
+                self._blocks.remove(self._batch)
+                self._batch.close(unlink=True)
+            self._batch = _SharedArrays(specs)
+            self._blocks.append(self._batch)
+        for out, x in zip(self._batch.arrays, arrays):
+            out[...] = x
+        for out, x in zip(self._v.arrays, self._module.v.cont_to_flat_list()):
+            out[...] = ivy.to_numpy(x)
+        leaves = [None if ivy.is_array(x) else x for x in leaves]
+        batch_size = arrays[0].shape[0]
+        num_workers = len(self._workers)
+        parts = list()
+        start = 0
+        for i in range(num_workers):
+            stop = start + batch_size // num_workers + (i < batch_size % num_workers)
+            if stop > start:
+                parts.append((i, start, stop))
+            start = stop
+        for i, start, stop in parts:
+            self._commands[i].put(
+                (
+                    mode,
+                    self._v.spec,
+                    self._batch.spec,
+                    self._grads.spec,
+                    tree_def,
+                    leaves,
+                    (start, stop),
+                )
+            )
+        # all results are received before raising, to leave no stale results behind
+        rets = dict(self._get_result() for _ in parts)
+        errors = [ret for ret in rets.values() if isinstance(ret, Exception)]
+        if errors:
+            if mode == "call":
+                # the returns of the other workers are read to release their blocks
+                for ret in rets.values():
+                    if not isinstance(ret, Exception):
+                        _from_shared_memory(ret[0])
+            raise errors[0]
+        return [((stop - start) / batch_size, i, rets[i]) for i, start, stop in parts]
+
+    # Public #
+    # -------#
+
+    def __call__(self, *args):
+        """
+        Call the module on the batch ``args``, split across the workers along the
+        first axis, and concatenate the returns of the workers along the first axis.
+
+        Returns
+        -------
+        ret
+            The return of the module for the whole batch.
+        """
+        rets = [ret for _, _, ret in self._run("call", args)]
+        ret_def = rets[0][1]
+        rets = [_from_shared_memory(ret_leaves) for ret_leaves, _ in rets]
+        ret_leaves = [
+            ivy.concat(
+                [ivy.asarray(ret[i], device=self._module._dev) for ret in rets], axis=0
+            )
+            if isinstance(leaf, _np.ndarray)
+            else leaf
+            for i, leaf in enumerate(rets[0])
+        ]
+        return ivy.tree_unflatten(ret_def, ret_leaves)
+
+    def execute_with_gradients(self, *batch):
+        """
+        Compute the loss of the module for the batch, split across the workers along
+        the first axis, and its gradients with respect to the variables of the
+        module, averaged across the workers.
+
+        The losses and gradients of the workers are weighted by the sizes of their
+        parts of the batch, such that these match those of the mean loss over the
+        whole batch.
+
+        Returns
+        -------
+        ret
+            The loss, and the container of gradients, which is ``None`` for backends
+            without automatic differentiation.
+        """
+        ivy.assertions.check_true(
+            ivy.exists(self._loss_fn),
+            "a loss_fn must be given to compute the gradients",
+        )
+        rets = self._run("grads", batch)
+        weights = [weight for weight, _, _ in rets]
+        losses = [ret[0] for _, _, ret in rets]
+        loss = sum([weight * x for weight, x in zip(weights, losses)])
+        loss = ivy.asarray(
+            _np.asarray(loss, dtype=losses[0].dtype), device=self._module._dev
+        )
+        if not all(ret[1] for _, _, ret in rets):
+            return loss, None
+        num_leaves = len(self._v.specs)
+        grads = [
+            self._module.v.cont_from_flat_list(
+                [
+                    ivy.asarray(x, device=self._module._dev)
+                    for x in self._grads.arrays[i * num_leaves : (i + 1) * num_leaves]
+                ]
+            )
+            for _, i, _ in rets
+        ]
+        grads = ivy.Container.cont_reduce(
+            grads, lambda xs: sum([x * w for x, w in zip(xs, weights)])
+        )
+        return loss, grads
+
+    def close(self):
+        """Stop the worker processes, and release the shared memory blocks."""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,337 @@
+"""Pool of arrays in shared memory, passed to worker processes by handle"""
+
+# global
+import os as _os
+import struct as _struct
+import threading as _threading
+import weakref as _weakref
+from collections import namedtuple as _namedtuple
+from multiprocessing import resource_tracker as _resource_tracker
+from multiprocessing import shared_memory as _shared_memory
+from typing import Optional, Sequence, Union
+import numpy as _np
+
+# local
+import ivy
+
+
+# the reference count of a shared array is stored in the first bytes of its
+# segment, and its data starts after this many bytes
+_shared_array_header_size = 64
+
+SharedArrayHandle = _namedtuple("SharedArrayHandle", ["name", "shape", "dtype"])
+
+
+class _SharedArrayPoolState:
+    """The segments of a shared array pool attached in the current process."""
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.pid = _os.getpid()
+        self.segments = dict()
+        self.views = dict()
+        self.created = set()
+        self.pending = list()
+        self.stale = list()
+        self.local = _threading.local()
+        self.closed = False
+
+    def attach(self, name):
+        if name not in self.segments:
+            try:
+                self.segments[name] = _shared_memory.SharedMemory(name=name)
+            except FileNotFoundError:
+                raise ivy.exceptions.IvyException(
+                    "the shared array {} has been released".format(name)
+                )
+        return self.segments[name]
+
+    def detach(self, name):
+        shm = self.segments.pop(name, None)
+        if shm is not None:
+            self.stale.append(shm)
+        stale, self.stale = self.stale, list()
+        for shm in stale:
+            try:
+                shm.close()
+            except BufferError:
+                # views of the segment are still being released, and it is then
+                # closed on a later update
+                self.stale.append(shm)
+
+    def update(self, name, delta):
+        """Add delta to the reference count of a segment, which is unlinked once
+        this reaches zero, and return the new count."""
+        with self.lock:
+            self.local.locked = True
+            try:
+                shm = self.attach(name)
+                count = _struct.unpack_from("q", shm.buf)[0]
+                if count < 1:
+                    raise ivy.exceptions.IvyException(
+                        "the shared array {} has been released".format(name)
+                    )
+                count += delta
+                _struct.pack_into("q", shm.buf, 0, count)
+                if count == 0:
+                    shm.unlink()
+                    self.created.discard(name)
+            finally:
+                self.local.locked = False
+        if count == 0 or (not self.views.get(name) and name not in self.created):
+            self.views.pop(name, None)
+            self.detach(name)
+        while self.pending:
+            self.update(self.pending.pop(), -1)
+        return count
+
+    def release_view(self, name, pid):
+        # views inherited by forked processes hold no references of their own, and
+        # the segments of a closed pool are already unlinked
+        if _os.getpid() != pid or self.closed:
+            return
+        self.views[name] -= 1
+        if getattr(self.local, "locked", False):
+            # the view was garbage collected while this thread updates a count
+            self.pending.append(name)
+            return
+        try:
+            self.update(name, -1)
+        except ivy.exceptions.IvyException:
+            # the segment was unlinked by closing the pool in another process
+            pass
+
+
+def _close_shared_array_pool(state):
+    state.closed = True
+    with state.lock:
+        for name in list(state.created):
+            try:
+                shm = state.attach(name)
+            except ivy.exceptions.IvyException:
+                continue
+            _struct.pack_into("q", shm.buf, 0, 0)
+            shm.unlink()
+        state.created.clear()
+    for name in list(state.segments):
+        state.detach(name)
+
+
+class SharedArrayPool:
+    """Arrays in shared memory segments, which are passed to worker processes by
+    their named handles instead of being pickled."""
+
+    def __init__(self, context: str = None) -> None:
+        """
+        Initialise a pool of arrays in ``multiprocessing.shared_memory`` segments.
+
+        Each array is allocated in its own segment, which holds a reference count
+        shared by all processes. The count starts at one for the handle returned
+        on allocation, and each view of the array holds a further reference while
+        it is alive. The segment is unlinked once the count reaches zero.
+
+        The pool must be passed to the worker processes on creation, such as in
+        the ``args`` of ``ivy.multiprocessing(context).Process``. The handles are
+        small named tuples, which can then be sent through queues. Sending a handle
+        passes on its reference, which the receiver releases once it has a view.
+
+        Parameters
+        ----------
+        context
+            The context of the multiprocessing, either fork, forkserver or spawn,
+            with which the worker processes are started. Default is ``None``.
+
+        Examples
+        --------
+        >>> pool = ivy.SharedArrayPool()
+        >>> handle = pool.from_array(ivy.array([1., 2., 3.]))
+        >>> x = pool.view(handle)
+        >>> pool.release(handle)
+        >>> print(x)
+        ivy.array([1., 2., 3.])
+        """
+        self._lock = ivy.multiprocessing(context).Lock()
+        self._owner = _os.getpid()
+        # the workers must share the resource tracker of this process, which
+        # unregisters the segments when they are unlinked by any process
+        _resource_tracker.ensure_running()
+        self._init_state()
+
+    def _init_state(self):
+        self._state = _SharedArrayPoolState(self._lock)
+        self._finalizer = _weakref.finalize(self, _close_shared_array_pool, self._state)
+        if self._state.pid != self._owner:
+            # the segments allocated by workers are left to the processes their
+            # handles were sent to when the workers exit
+            self._finalizer.detach()
+
+    def _get_state(self):
+        if self._state.pid != _os.getpid():
+            # the pool was inherited by a forked process
+            self._init_state()
+        return self._state
+
+    def __getstate__(self):
+        return {"lock": self._lock, "owner": self._owner}
+
+    def __setstate__(self, state):
+        self._lock = state["lock"]
+        self._owner = state["owner"]
+        self._init_state()
+
+    def allocate(
+        self,
+        shape: Union[ivy.Shape, ivy.NativeShape, Sequence[int]],
+        /,
+        *,
+        dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+    ) -> SharedArrayHandle:
+        """Allocate an uninitialised array in a new shared memory segment.
+
+        Parameters
+        ----------
+        shape
+            The shape of the array.
+        dtype
+            The data type of the array. Default is ``None``, in which case the
+            default float data type is used.
+
+        Returns
+        -------
+        ret
+            The handle of the array, which holds one reference to its segment.
+        """
+        state = self._get_state()
+        shape = tuple([int(d) for d in shape])
+        dtype = str(ivy.as_ivy_dtype(ivy.default(dtype, ivy.default_float_dtype())))
+        size = (
+            _shared_array_header_size + int(_np.prod(shape)) * _np.dtype(dtype).itemsize
+        )
+        shm = _shared_memory.SharedMemory(create=True, size=size)
+        _struct.pack_into("q", shm.buf, 0, 1)
+        state.segments[shm.name] = shm
+        state.created.add(shm.name)
+        return SharedArrayHandle(shm.name, shape, dtype)
+
+    def from_array(self, x: Union[ivy.Array, ivy.NativeArray], /) -> SharedArrayHandle:
+        """Copy an array into a new shared memory segment.
+
+        Parameters
+        ----------
+        x
+            The array to copy.
+
+        Returns
+        -------
+        ret
+            The handle of the array, which holds one reference to its segment.
+        """
+        x = ivy.to_numpy(x)
+        handle = self.allocate(x.shape, dtype=str(x.dtype))
+        shm = self._state.segments[handle.name]
+        _np.ndarray(
+            x.shape, dtype=x.dtype, buffer=shm.buf, offset=_shared_array_header_size
+        )[...] = x
+        return handle
+
+    def view(self, handle: SharedArrayHandle, /) -> ivy.Array:
+        """Reconstruct an array from its handle, in this or any worker process.
+
+        For the numpy and torch backends the array is a zero-copy view of the
+        segment, so writes to it are seen by all processes. The array holds a
+        reference to the segment while it is alive, or while the backend array it
+        was copied to is alive for backends which cannot share the memory.
+
+        Parameters
+        ----------
+        handle
+            The handle of the array.
+
+        Returns
+        -------
+        ret
+            The array.
+        """
+        state = self._get_state()
+        state.views[handle.name] = state.views.get(handle.name, 0) + 1
+        try:
+            state.update(handle.name, 1)
+        except ivy.exceptions.IvyException:
+            state.views[handle.name] -= 1
+            raise
+        x = _np.ndarray(
+            handle.shape,
+            dtype=handle.dtype,
+            buffer=state.segments[handle.name].buf,
+            offset=_shared_array_header_size,
+        )
+        _weakref.finalize(x, state.release_view, handle.name, state.pid)
+        # the implicit numpy backend is used if no backend is set
+        backend = ivy.current_backend().current_backend_str()
+        return ivy.to_ivy(ivy.as_backend(x, backend)[0])
+
+    def incref(self, handle: SharedArrayHandle, /) -> int:
+        """Add a reference to the segment of an array, such as before sending its
+        handle to one more process.
+
+        Parameters
+        ----------
+        handle
+            The handle of the array.
+
+        Returns
+        -------
+        ret
+            The new reference count.
+        """
+        return self._get_state().update(handle.name, 1)
+
+    def release(self, handle: SharedArrayHandle, /) -> int:
+        """Release a reference to the segment of an array, which is unlinked once
+        no references are left.
+
+        Parameters
+        ----------
+        handle
+            The handle of the array.
+
+        Returns
+        -------
+        ret
+            The new reference count.
+        """
+        return self._get_state().update(handle.name, -1)
+
+    def refcount(self, handle: SharedArrayHandle, /) -> int:
+        """Return the number of references to the segment of an array, across all
+        processes, which is zero once it has been released.
+
+        Parameters
+        ----------
+        handle
+            The handle of the array.
+
+        Returns
+        -------
+        ret
+            The reference count.
+        """
+        try:
+            return self._get_state().update(handle.name, 0)
+        except ivy.exceptions.IvyException:
+            return 0
+
+    def close(self):
+        """Unlink all segments allocated by this process which are still
+        referenced. Existing views remain valid, but the handles can no longer be
+        viewed. This is done automatically once the pool is garbage collected in
+        the process which created it."""
+        self._finalizer.detach()
+        _close_shared_array_pool(self._get_state())
+        self._init_state()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -2,6 +2,7 @@
 
 # global
 from hypothesis import strategies as st
+import numpy as np
 
 # local
 import ivy
@@ -421,6 +422,27 @@ def test_from_dlpack(
     )
 
 
+# to_dlpack
+def test_to_dlpack():
+    x = ivy.array([1.0, 2.0, 3.0])
+    y = ivy.array([4.0, 5.0])
+    for capsule in [ivy.to_dlpack(x), ivy.to_dlpack(x.data), x.to_dlpack()]:
+        assert type(capsule).__name__ == "PyCapsule"
+    # containers are mapped leaf-wise
+    cont = ivy.Container(a=x, b={"c": y})
+    for capsules in [
+        ivy.to_dlpack(cont),
+        ivy.Container.static_to_dlpack(cont),
+        cont.to_dlpack(),
+    ]:
+        assert isinstance(capsules, ivy.Container)
+        assert type(capsules.a).__name__ == "PyCapsule"
+        assert type(capsules.b.c).__name__ == "PyCapsule"
+    capsules = cont.to_dlpack(key_chains=["a"])
+    assert type(capsules.a).__name__ == "PyCapsule"
+    assert capsules.b.c is y
+
+
 @st.composite
 def _fill_value(draw):
     dtype = draw(helpers.get_dtypes("numeric", full=False, key="dtype"))[0]
@@ -885,3 +907,30 @@ def test_one_hot(
         dtype=dtype,
         ground_truth_backend=ground_truth_backend,
     )
+
+
+# memmap
+def test_memmap(tmp_path):
+    filename = str(tmp_path / "x.dat")
+    x_np = np.arange(12, dtype="float32").reshape((4, 3))
+    x_np.tofile(filename)
+    x = ivy.memmap(filename, dtype="float32", mode="r", shape=(4, 3))
+    assert x.shape == (4, 3) and x.dtype == "float32"
+    assert np.array_equal(ivy.to_numpy(x), x_np)
+    y = ivy.memmap(filename, dtype="float32", mode="r", offset=12, shape=(3,))
+    assert np.array_equal(ivy.to_numpy(y), x_np[1])
+
+
+# load
+def test_load(tmp_path):
+    filepath = str(tmp_path / "x.npy")
+    x_np = np.arange(12, dtype="float32").reshape((4, 3))
+    np.save(filepath, x_np)
+    for mmap in [False, True]:
+        x = ivy.load(filepath, mmap=mmap)
+        assert ivy.is_ivy_array(x)
+        assert np.array_equal(ivy.to_numpy(x), x_np)
+        assert np.array_equal(ivy.to_numpy(x[ivy.array([0, 3])]), x_np[[0, 3]])
+    # the mapping is copy-on-write, so the file is left unchanged
+    x[0] = 0.0
+    assert np.array_equal(np.load(filepath), x_np)
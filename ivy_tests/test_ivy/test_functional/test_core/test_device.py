@@ -1,12 +1,15 @@
 """Collection of tests for unified device functions."""
 
 # global
+import contextlib
+import gc
 import io
 import multiprocessing
 import os
 import re
 import shutil
 import sys
+import weakref
 
 import numpy as np
 import pynvml
@@ -15,6 +18,7 @@ from hypothesis import strategies as st, assume
 
 # local
 import ivy
+from ivy.functional.ivy.device import _tune_key
 from ivy.functional.ivy.gradients import _variable
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
@@ -390,6 +394,124 @@ def test_split_func_call_with_cont_input(
     helpers.assert_all_close(ivy.to_numpy(c.cont_key), ivy.to_numpy(c_true.cont_key))
 
 
+@handle_test(
+    fn_tree="functional.ivy.split_func_call",
+    array_shape=helpers.lists(
+        arg=helpers.ints(min_value=1, max_value=3),
+        min_size="num_dims",
+        max_size="num_dims",
+        size_bounds=[1, 3],
+    ),
+    dtype=helpers.get_dtypes("float", full=False),
+    chunk_size=helpers.ints(min_value=1, max_value=3),
+    axis=_axis(),
+    parallel=st.sampled_from(["threads", "processes"]),
+)
+def test_split_func_call_in_parallel(
+    *,
+    array_shape,
+    dtype,
+    chunk_size,
+    axis,
+    parallel,
+):
+    # inputs
+    shape = tuple(array_shape)
+    x1 = ivy.asarray(np.random.uniform(size=shape).astype(dtype[0]))
+    x2 = ivy.asarray(np.random.uniform(size=shape).astype(dtype[0]))
+
+    # concat, with the outputs preallocated
+    a, b = ivy.split_func_call(
+        lambda t0, t1: (t0 * t1, t0 - t1),
+        [x1, x2],
+        "concat",
+        chunk_size=chunk_size,
+        input_axes=axis,
+        parallel=parallel,
+        num_workers=2,
+    )
+    helpers.assert_all_close(ivy.to_numpy(a), ivy.to_numpy(x1 * x2))
+    helpers.assert_all_close(ivy.to_numpy(b), ivy.to_numpy(x1 - x2))
+
+    # sum, with the outputs added up by a tree reduction
+    ret = ivy.split_func_call(
+        lambda t0, t1: ivy.sum(t0 * t1, axis=axis),
+        [x1, x2],
+        "sum",
+        chunk_size=chunk_size,
+        input_axes=axis,
+        parallel=parallel,
+        num_workers=2,
+    )
+    helpers.assert_all_close(
+        ivy.to_numpy(ret), ivy.to_numpy(ivy.sum(x1 * x2, axis=axis)), rtol=1e-3
+    )
+
+
+def test_split_func_call_processes_without_global_backend():
+    ivy.clear_backend_stack()
+    x = np.arange(6.0)
+    # the workers use the backend of the caller without setting a global backend
+    for backend in [None, "numpy"]:
+        with ivy.using_backend(backend) if backend else contextlib.nullcontext():
+            ret = ivy.split_func_call(
+                lambda t: t * 2,
+                [ivy.asarray(x)],
+                "concat",
+                chunk_size=2,
+                parallel="processes",
+                num_workers=2,
+            )
+        helpers.assert_all_close(ivy.to_numpy(ret), x * 2)
+        assert ivy.current_backend_str() == ""
+
+
+@handle_test(fn_tree="functional.ivy.split_func_call")
+def test_split_func_call_with_memory_budget(on_device):
+    x = ivy.asarray(np.random.uniform(size=(64, 128)), device=on_device)
+
+    # the chunk size is tuned to the memory budget, and stored for the next call
+    def func(t):
+        return t * 2
+
+    ret = ivy.split_func_call(func, [x], "concat", memory_budget=1e-5, device=on_device)
+    helpers.assert_all_close(ivy.to_numpy(ret), ivy.to_numpy(x) * 2)
+    tune_key = _tune_key(func, str(x.shape))
+    assert 1 <= ivy.tuned_chunk_sizes[tune_key] < 64
+
+    # the sizes are stored by function name, without keeping the function alive
+    func_ref = weakref.ref(func)
+    del func
+    gc.collect()
+    assert func_ref() is None
+    num_tuned = len(ivy.tuned_chunk_sizes)
+    for _ in range(2):
+        ivy.split_func_call(lambda t: t * 2, [x], "concat", memory_budget=1e-5)
+    assert len(ivy.tuned_chunk_sizes) == num_tuned + 1
+
+    # the means of the chunks are weighted by their sizes
+    ret = ivy.split_func_call(
+        lambda t: ivy.mean(t, axis=0),
+        [x],
+        "mean",
+        memory_budget=1e-5,
+        device=on_device,
+    )
+    helpers.assert_all_close(ivy.to_numpy(ret), np.mean(ivy.to_numpy(x), axis=0))
+
+    # the chunk size is halved whenever the function runs out of memory
+    def oom_func(t):
+        if t.shape[0] > 8:
+            raise MemoryError("out of memory")
+        return t + 1
+
+    ret = ivy.split_func_call(
+        oom_func, [x], "concat", memory_budget=1.0, chunk_size=64, device=on_device
+    )
+    helpers.assert_all_close(ivy.to_numpy(ret), ivy.to_numpy(x) + 1)
+    assert ivy.tuned_chunk_sizes[_tune_key(oom_func, str(x.shape))] == 8
+
+
 # profiler
 @handle_test(
     fn_tree="functional.ivy.Profiler",
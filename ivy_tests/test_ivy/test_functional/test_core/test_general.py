@@ -281,6 +281,29 @@ def test_to_numpy(
     )
 
 
+# as_backend
+def test_as_backend():
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    ret, copied = ivy.as_backend(x, "numpy")
+    assert isinstance(ret, np.ndarray)
+    assert np.array_equal(ret, ivy.to_numpy(x))
+    if ivy.current_backend_str() == "numpy":
+        assert ret is x.data and not copied
+
+    # objects exposing the array interface are viewed without copying
+    class ArrayInterface:
+        def __init__(self, array):
+            self.__array_interface__ = array.__array_interface__
+
+    x_np = np.arange(6.0).reshape((2, 3))
+    ret, copied = ivy.as_backend(ArrayInterface(x_np), "numpy")
+    assert not copied and np.shares_memory(ret, x_np)
+
+    # anything else is copied
+    ret, copied = ivy.as_backend([1.0, 2.0], "numpy")
+    assert copied and np.array_equal(ret, np.array([1.0, 2.0]))
+
+
 # to_scalar
 @handle_test(
     fn_tree="functional.ivy.to_scalar",
@@ -1,6 +1,7 @@
 """Collection of tests for unified general functions."""
 
 # global
+import collections
 import copy
 import warnings
 import pytest
@@ -217,6 +218,49 @@ def test_nested_argwhere_w_extra_nest_types():
     assert indices[3] == ["b", "c", 0, 1, 0]
 
 
+# nested_nth_index_where
+@pytest.mark.parametrize(
+    "nest", [{"a": [[0], [1]], "b": {"c": [[[2], [4]], [[6], [8]]]}}]
+)
+@pytest.mark.parametrize("check_nests", [False, True])
+def test_nested_nth_index_where(nest, check_nests):
+    fn = lambda x: isinstance(x, list) or (isinstance(x, int) and x < 5)
+    indices = ivy.nested_argwhere(nest, fn, check_nests)
+    for n, index in enumerate(indices):
+        assert ivy.nested_nth_index_where(nest, fn, n, check_nests=check_nests) == index
+    assert (
+        ivy.nested_nth_index_where(nest, fn, len(indices), check_nests=check_nests)
+        is None
+    )
+
+
+def test_nested_nth_index_where_skips_root():
+    fn = lambda x: isinstance(x, list)
+    assert ivy.nested_nth_index_where([[1]], fn, 0, check_nests=True) == [0]
+    assert ivy.nested_nth_index_where([[1]], fn, 1, check_nests=True) is None
+    fn = lambda x: isinstance(x, dict)
+    assert ivy.nested_first_where({"a": 1}, fn, check_nests=True) is None
+
+
+# nested_first_where
+@pytest.mark.parametrize(
+    "nest", [{"a": [[0], [1]], "b": {"c": [[[2], [4]], [[6], [8]]]}}]
+)
+def test_nested_first_where(nest):
+    assert ivy.nested_first_where(nest, lambda x: x > 1) == 2
+    assert ivy.nested_first_where(nest, lambda x: x > 8) is None
+    assert ivy.nested_first_where(nest, lambda x: x > 8, default=-1) == -1
+    calls = list()
+
+    def _fn(x):
+        calls.append(x)
+        return x == 1
+
+    # the search stops at the first match
+    assert ivy.nested_first_where(nest, _fn) == 1
+    assert calls == [0, 1]
+
+
 # all_nested_indices
 @pytest.mark.parametrize(
     "nest", [{"a": [[0], [1]], "b": {"c": [[[2], [4]], [[6], [8]]]}}]
@@ -430,6 +474,19 @@ def test_nested_map(x, fn, shallow):
         assert x != x_copy
 
 
+def test_nested_map_shallow_deep_nest():
+    inner = [0, 1]
+    x = {"a": (inner, {"b": [2]})}
+    for _ in range(10000):
+        x = [x]
+    ret = ivy.nested_map(x, lambda v: v + 1)
+    for _ in range(10000):
+        x, ret = x[0], ret[0]
+    # the lists and dicts of the nest are updated in place
+    assert x == ret == {"a": ([1, 2], {"b": [3]})}
+    assert inner == [1, 2]
+
+
 # nested_map_w_extra_nest_types
 @pytest.mark.parametrize("fn", [lambda x: x**2])
 def test_nested_map_w_extra_nest_types(fn):
@@ -442,6 +499,73 @@ def test_nested_map_w_extra_nest_types(fn):
     assert ivy.all(x_copy["b"]["c"] == x["b"]["c"])
 
 
+# tree_flatten and tree_unflatten
+@pytest.mark.parametrize(
+    "nest, expected_leaves",
+    [
+        (1, [1]),
+        ({"a": [[0, 1], (2, 3)], "b": {"c": [[4], []], "d": ()}}, [0, 1, 2, 3, 4]),
+        (([0, {"a": (1, 2)}], {}, [3]), [0, 1, 2, 3]),
+    ],
+)
+@pytest.mark.parametrize("include_derived", [None, True])
+def test_tree_flatten_and_unflatten(nest, expected_leaves, include_derived):
+    leaves, tree_def = ivy.tree_flatten(nest, include_derived=include_derived)
+    assert leaves == expected_leaves
+    assert tree_def.num_leaves == len(leaves)
+    assert ivy.tree_unflatten(tree_def, leaves) == nest
+    # equal structures share the same hashable tree definition
+    new_leaves, new_tree_def = ivy.tree_flatten(
+        ivy.tree_unflatten(tree_def, [x * 2 for x in leaves]),
+        include_derived=include_derived,
+    )
+    assert new_tree_def is tree_def
+    assert hash(new_tree_def) == hash(tree_def)
+    assert new_leaves == [x * 2 for x in leaves]
+    assert ivy.nested_map(nest, lambda x: x * 2, include_derived, shallow=False) == (
+        ivy.tree_unflatten(tree_def, new_leaves)
+    )
+    with pytest.raises(ivy.exceptions.IvyException):
+        ivy.tree_unflatten(tree_def, leaves + [4])
+
+
+def test_tree_flatten_and_unflatten_w_derived_types():
+    point = collections.namedtuple("point", ["x", "y"])
+    container = ivy.Container(a=ivy.array([1]), b={"c": ivy.array([2])})
+    nest = {"a": point(ivy.array([0]), [container]), "b": (container,)}
+
+    # named tuples and containers are leaves, unless derived classes are included
+    leaves, tree_def = ivy.tree_flatten(nest)
+    assert len(leaves) == 2
+    assert leaves[0] is nest["a"]
+    assert leaves[1] is container
+    assert ivy.tree_unflatten(tree_def, leaves) == nest
+
+    leaves, tree_def = ivy.tree_flatten(nest, include_derived=True)
+    assert len(leaves) == 5
+    ret = ivy.tree_unflatten(tree_def, [ivy.to_numpy(x) + 1 for x in leaves])
+    assert isinstance(ret["a"], point)
+    assert isinstance(ret["a"].y[0], ivy.Container)
+    assert np.array_equal(ret["a"].y[0].b.c, np.array([3]))
+    assert np.array_equal(ret["b"][0].a, np.array([2]))
+
+    # leaves of ignored types are not traversed
+    leaves, _ = ivy.tree_flatten(nest, include_derived=True, to_ignore=ivy.Container)
+    assert leaves[1] is container
+
+
+def test_tree_flatten_and_unflatten_deep_nest():
+    nest = 0
+    for _ in range(10000):
+        nest = [nest]
+    leaves, tree_def = ivy.tree_flatten(nest)
+    assert leaves == [0]
+    ret = ivy.tree_unflatten(tree_def, [1])
+    for _ in range(10000):
+        ret = ret[0]
+    assert ret == 1
+
+
 # nested_any
 @pytest.mark.parametrize("x", [{"a": [[0, 1], [2, 3]], "b": {"c": [[0], [1]]}}])
 @pytest.mark.parametrize("fn", [lambda x: True if x % 2 == 0 else False])
@@ -1,6 +1,9 @@
 # global
+import importlib.util
+import pickle
 from hypothesis import assume, strategies as st
 import numpy as np
+import pytest
 
 # local
 import ivy
@@ -176,6 +179,103 @@ def test_array_property_T(
     )
 
 
+def test_array_lazy_metadata():
+    data = ivy.native_array([[1.0, 2.0, 3.0]], dtype="float32")
+    x = Array(data)
+    assert not hasattr(x, "__dict__")
+    assert x._dtype is None and x._device is None and x._size is None
+    assert x.dtype == "float32"
+    assert x.size == 3
+    assert x.device == ivy.dev(data)
+    assert x._dtype == "float32" and x._size == 3
+    x.data = ivy.native_array([1, 2], dtype="int32")
+    assert x._dtype is None
+    assert x.dtype == "int32" and x.size == 2 and x.shape == (2,)
+
+
+def test_array_lazy_metadata_after_backend_change():
+    x = Array(ivy.native_array([1.0, 2.0], dtype="float32"))
+    device = ivy.dev(x.data)
+    backends = [
+        b
+        for b in ["numpy", "torch", "jax", "tensorflow"]
+        if b != ivy.current_backend_str() and importlib.util.find_spec(b)
+    ]
+    if not backends:
+        pytest.skip("no other backend is installed")
+    # the metadata is computed by the backend which created the array
+    ivy.set_backend(backends[0])
+    try:
+        assert x.dtype == "float32"
+        assert x.device == device
+        assert repr(x).startswith("ivy.array([1., 2.]")
+    finally:
+        ivy.unset_backend()
+
+
+def test_array_operator_fast_path():
+    x = ivy.array([1.0, 2.0, 3.0])
+    y = ivy.array([4.0, 5.0, 6.0])
+    for ret, expected in [
+        (x + y, ivy.add(x, y)),
+        (2.0 - x, ivy.subtract(2.0, x)),
+        (x @ y, ivy.matmul(x, y)),
+        (x < y, ivy.less(x, y)),
+    ]:
+        assert isinstance(ret, Array)
+        assert ret.dtype == expected.dtype
+        assert np.array_equal(ivy.to_numpy(ret), ivy.to_numpy(expected))
+    # operands which are not ivy arrays use the fully wrapped function
+    ret = x + ivy.Container(a=y)
+    assert isinstance(ret, ivy.Container)
+    assert np.array_equal(ivy.to_numpy(ret.a), ivy.to_numpy(ivy.add(x, y)))
+    # errors raised by the backend are not retried through the wrapped function
+    backend = ivy.current_backend()
+    matmul = backend.matmul
+    calls = list()
+
+    def counted_matmul(*args, **kwargs):
+        calls.append(args)
+        return matmul(*args, **kwargs)
+
+    backend.matmul = counted_matmul
+    try:
+        with pytest.raises(ivy.exceptions.IvyException):
+            x @ ivy.array([1.0, 2.0])
+    finally:
+        backend.matmul = matmul
+    assert len(calls) == 1
+
+
+def test_array_pickle_out_of_band():
+    x = ivy.array([1.0, 2.0, 3.0])
+    buffers = list()
+    pickled = pickle.dumps(x, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    x_again = pickle.loads(pickled, buffers=buffers)
+    assert isinstance(x_again, Array)
+    assert x_again.backend == x.backend
+    assert np.array_equal(ivy.to_numpy(x_again), ivy.to_numpy(x))
+    # in-band pickling is unchanged
+    for protocol in [2, 5]:
+        x_again = pickle.loads(pickle.dumps(x, protocol=protocol))
+        assert np.array_equal(ivy.to_numpy(x_again), ivy.to_numpy(x))
+
+
+def test_array_unpickle_using_backend():
+    x = ivy.array([1.0, 2.0, 3.0])
+    stack = list(ivy.backend_stack)
+    # unpickling does not set the global backend, which cannot be changed while
+    # a using_backend context is active
+    with ivy.using_backend(x.backend):
+        for protocol in [2, 5]:
+            x_again = pickle.loads(pickle.dumps(x, protocol=protocol))
+            assert isinstance(x_again, Array)
+            assert x_again.backend == x.backend
+            assert np.array_equal(ivy.to_numpy(x_again), ivy.to_numpy(x))
+    assert ivy.backend_stack == stack
+
+
 @handle_method(method_tree="Array.__getitem__", query_dtype_and_x=_getitem_setitem())
 def test_array__getitem__(
     query_dtype_and_x,
@@ -2,6 +2,7 @@
 import pytest
 import importlib
 import types
+import threading
 
 
 try:
@@ -67,13 +68,14 @@ if "torch" in available_frameworks():
 def test_set_backend(backend, array_type):
     # recording data before backend change
     stack_before = []
-    func_address_before = id(ivy.sum)
     stack_before.extend(ivy.backend_stack)
 
     ivy.set_backend(backend)
     stack_after = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.assertions.check_equal(func_address_before, id(ivy.sum), inverse=True)
+    # check that the function has been replaced by the backend's wrapped version
+    ivy.assertions.check_equal(
+        id(ivy.backend_handler.ivy_original_dict["sum"]), id(ivy.sum), inverse=True
+    )
     # using ivy assertions to ensure the desired backend is set
     ivy.assertions.check_less(len(stack_before), len(stack_after))
     ivy.assertions.check_equal(ivy.current_backend_str(), backend)
@@ -91,13 +93,18 @@ def test_unset_backend(backend):
 
     ivy.set_backend(backend)
     stack_before_unset = []
-    func_address_before_unset = id(ivy.sum)
     stack_before_unset.extend(ivy.backend_stack)
 
     unset_backend = ivy.unset_backend()
     stack_after_unset = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.assertions.check_equal(func_address_before_unset, id(ivy.sum), inverse=True)
+    # check that the function is that of the previously set backend, or ivy's
+    if stack_after_unset:
+        namespace, _ = ivy.backend_handler._backend_namespace(stack_after_unset[-1])
+        ivy.assertions.check_equal(id(namespace["sum"]), id(ivy.sum))
+    else:
+        ivy.assertions.check_equal(
+            id(ivy.backend_handler.ivy_original_dict["sum"]), id(ivy.sum)
+        )
     ivy.assertions.check_equal(
         unset_backend, importlib.import_module(_backend_dict[backend])
     )
@@ -166,3 +173,92 @@ def test_get_backend(backend):
 
     # checking whether the backend is returned correctly
     ivy.assertions.check_equal(ivy.get_backend(backend), imported_backend)
+
+
+@pytest.mark.parametrize("backend", available_frameworks())
+def test_backend_namespace_cached(backend):
+    ivy.set_backend(backend)
+    sum_fn = ivy.sum
+    ivy.unset_backend()
+    ivy.set_backend(backend)
+    # the wrapped namespace is reused rather than rebuilt
+    assert ivy.sum is sum_fn
+    assert ivy.current_backend_str() == backend
+    ivy.unset_backend()
+    # modifying the ivy namespace invalidates the cached namespaces
+    min_base = ivy.get_min_base()
+    ivy.clear_backend_stack()
+    ivy.set_min_base(min_base)
+    ivy.set_backend(backend)
+    assert ivy.sum is not sum_fn
+    ivy.unset_backend()
+
+
+@pytest.mark.parametrize("backend", available_frameworks())
+def test_using_backend(backend):
+    ivy.clear_backend_stack()
+    original_sum = ivy.sum
+    results = dict()
+
+    def _thread_backend():
+        results["thread"] = ivy.current_backend_str()
+
+    with ivy.using_backend(backend):
+        # the global namespace is left untouched
+        assert ivy.sum is original_sum
+        assert ivy.current_backend_str() == backend
+        x = ivy.array([1.0, 2.0])
+        assert ivy.array_equal(ivy.add(x, x), ivy.array([2.0, 4.0]))
+        # other threads do not see the backend
+        thread = threading.Thread(target=_thread_backend)
+        thread.start()
+        thread.join()
+    assert results["thread"] == ""
+    assert ivy.current_backend_str() == ""
+
+
+@pytest.mark.parametrize("backend", available_frameworks())
+def test_using_backend_locks_global_backend(backend):
+    ivy.clear_backend_stack()
+    with ivy.using_backend(backend):
+        with pytest.raises(ivy.exceptions.IvyException):
+            ivy.set_backend(backend)
+    ivy.set_backend(backend)
+    with ivy.using_backend(backend):
+        with pytest.raises(ivy.exceptions.IvyException):
+            ivy.unset_backend()
+    ivy.unset_backend()
+    assert ivy.current_backend_str() == ""
+
+
+def test_using_backend_threads():
+    backends = available_frameworks()
+    if len(backends) < 2:
+        pytest.skip("a second backend is not installed")
+    backends = backends[:2]
+    ivy.clear_backend_stack()
+    barrier = threading.Barrier(len(backends))
+    results = dict()
+
+    def _thread_backend(backend):
+        with ivy.using_backend(backend):
+            # both contexts are active at the same time
+            barrier.wait(timeout=60)
+            x = ivy.array([1.0, 2.0])
+            results[backend] = (
+                ivy.current_backend_str(),
+                ivy.current_backend(ivy.to_native(x)).current_backend_str(),
+                ivy.to_numpy(ivy.add(x, x)).tolist(),
+            )
+
+    threads = [
+        threading.Thread(target=_thread_backend, args=(backend,))
+        for backend in backends
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for backend in backends:
+        assert results[backend] == (backend, backend, [2.0, 4.0])
+    assert ivy.current_backend_str() == ""
@@ -1,4 +1,5 @@
 # global
+import gc
 import os
 import queue
 import pytest
@@ -6,6 +7,8 @@ import random
 import numpy as np
 import multiprocessing
 import pickle
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 # local
 import ivy
@@ -1468,6 +1471,74 @@ def test_container_prune_key_chains(on_device):
     assert _test_bc_exception(container_pruned)
 
 
+def test_container_key_chains_many(on_device):
+    container = Container(
+        {
+            "layer{}".format(i): {
+                "w": ivy.array([i], device=on_device),
+                "b": {"x": ivy.array([-i], device=on_device)},
+            }
+            for i in range(20)
+        }
+    )
+    key_chains = ["layer{}/w".format(i) for i in range(0, 20, 2)] + [
+        "layer3",
+        "layer5.b",
+        "layer5/b/x",
+        "missing/w",
+    ]
+
+    # at key chains, selected with a single traversal
+    ret = container.cont_at_key_chains(key_chains[:-1])
+    assert set(ret.cont_all_key_chains()) == set(
+        ["layer{}/w".format(i) for i in range(0, 20, 2)]
+        + ["layer3/w", "layer3/b/x", "layer5/b/x"]
+    )
+    assert np.allclose(ivy.to_numpy(ret.layer5.b.x), np.array([-5]))
+    ret = container.cont_at_key_chains(key_chains, ignore_key_errors=True)
+    assert "missing" not in ret
+    with pytest.raises(ivy.exceptions.IvyException):
+        container.cont_at_key_chains(key_chains)
+
+    # pruned key chains match pruning each key chain in turn
+    expected = container
+    for kc in key_chains:
+        expected = expected.cont_prune_key_chain(kc)
+    ret = container.cont_prune_key_chains(key_chains)
+    assert ret.cont_all_key_chains() == expected.cont_all_key_chains()
+    assert "layer3" not in ret
+    assert "b" not in ret.layer5
+
+    # mapped key chains, with whole sub-containers skipped
+    ret = container.cont_map(
+        lambda x, _: x + 100, key_chains=key_chains, prune_unapplied=True
+    )
+    assert set(ret.cont_all_key_chains()) == set(
+        ["layer{}/w".format(i) for i in range(0, 20, 2)] + ["layer5/b/x"]
+    )
+    assert np.allclose(ivy.to_numpy(ret.layer4.w), np.array([104]))
+    ret = Container.cont_multi_map(
+        lambda xs, _: xs[0] + xs[1],
+        [container, container],
+        key_chains=key_chains,
+        prune_unapplied=True,
+    )
+    assert set(ret.cont_all_key_chains()) == set(
+        ["layer{}/w".format(i) for i in range(0, 20, 2)]
+        + ["layer3/w", "layer3/b/x", "layer5/b/x"]
+    )
+    assert np.allclose(ivy.to_numpy(ret.layer3.b.x), np.array([-6]))
+    ret = Container.cont_multi_map(
+        lambda xs, _: xs[0] + xs[1],
+        [container, container],
+        key_chains=key_chains,
+        to_apply=False,
+        prune_unapplied=True,
+    )
+    assert "layer3" not in ret
+    assert np.allclose(ivy.to_numpy(ret.layer1.w), np.array([2]))
+
+
 def test_container_format_key_chains(on_device):
     dict_in = {
         "_a": ivy.array([1], device=on_device),
@@ -1905,6 +1976,113 @@ def test_container_from_flat_list(on_device):
     assert np.allclose(ivy.to_numpy(container.b.d), np.array([6]))
 
 
+def test_container_flat_buffer(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {"c": ivy.array([[3.0], [4.0]], device=on_device)},
+        }
+    )
+    buffer = container.cont_to_flat_buffer()
+    assert np.allclose(ivy.to_numpy(buffer), np.array([1.0, 2.0, 3.0, 4.0]))
+    container_from_buffer = container.cont_from_flat_buffer(buffer * 2)
+    assert container_from_buffer.b.c.shape == (2, 1)
+    assert np.allclose(ivy.to_numpy(container_from_buffer.b.c), np.array([[6], [8]]))
+    # mixed data types form one buffer for each data type, unless a dtype is given
+    mixed = Container(
+        a=ivy.array([1], dtype="int32", device=on_device),
+        b=ivy.array([2.0], dtype="float32", device=on_device),
+        c=ivy.array([3, 4], dtype="int32", device=on_device),
+    )
+    buffers = mixed.cont_to_flat_buffer()
+    assert sorted(buffers) == ["float32", "int32"]
+    assert np.allclose(ivy.to_numpy(buffers["int32"]), np.array([1, 3, 4]))
+    assert np.allclose(ivy.to_numpy(buffers["float32"]), np.array([2.0]))
+    mixed_from_buffers = mixed.cont_from_flat_buffer(
+        {k: v * 2 for k, v in buffers.items()}
+    )
+    assert mixed_from_buffers.c.dtype == "int32"
+    assert np.allclose(ivy.to_numpy(mixed_from_buffers.c), np.array([6, 8]))
+    assert np.allclose(ivy.to_numpy(mixed_from_buffers.b), np.array([4.0]))
+    with pytest.raises(ivy.exceptions.IvyException):
+        mixed.cont_from_flat_buffer({"int32": buffers["int32"]})
+    assert mixed.cont_to_flat_buffer(dtype="float32").dtype == "float32"
+    # buffer-backed container
+    if ivy.inplace_arrays_supported():
+        buffer = container.cont_to_flat_buffer(inplace=True)
+        buffer = ivy.inplace_update(buffer, buffer + 1)
+        assert np.allclose(ivy.to_numpy(container.a), np.array([2.0, 3.0]))
+        assert np.allclose(ivy.to_numpy(container.b.c), np.array([[4.0], [5.0]]))
+
+
+def test_container_structure_cache(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {
+                "c": ivy.array([2], device=on_device),
+                "d": ivy.array([3], device=on_device),
+            },
+        }
+    )
+    assert container.cont_all_key_chains() == ["a", "b/c", "b/d"]
+    assert len(container.cont_to_flat_list()) == 3
+    mapped = container.cont_map(lambda x, _: x + 1)
+    assert np.allclose(ivy.to_numpy(mapped.b.d), np.array([4]))
+    assert mapped.cont_all_key_chains() == ["a", "b/c", "b/d"]
+    # adding a key to a sub-container invalidates the cached structure
+    container.b.e = ivy.array([4], device=on_device)
+    assert container.cont_all_key_chains() == ["a", "b/c", "b/d", "b/e"]
+    # as does removing a key
+    del container["a"]
+    assert container.cont_all_key_chains() == ["b/c", "b/d", "b/e"]
+    # and replacing a sub-container
+    container.b = Container(f=ivy.array([5], device=on_device))
+    assert container.cont_all_key_chains() == ["b/f"]
+    assert np.allclose(ivy.to_numpy(container.cont_to_flat_list()[0]), np.array([5]))
+    # the cached structures do not keep the containers alive through cycles
+    refs = [weakref.ref(container), weakref.ref(mapped)]
+    refs += [weakref.ref(leaf) for leaf in mapped.cont_to_flat_list()]
+    gc.disable()
+    try:
+        del container, mapped
+        assert all(ref() is None for ref in refs)
+    finally:
+        gc.enable()
+
+
+def test_container_structural_hash(on_device):
+    dict_in = {
+        "a": ivy.array([1.0], device=on_device),
+        "b": {"c": ivy.array([[2, 3]], device=on_device), "d": 4},
+    }
+    container0 = Container(dict_in)
+    container1 = Container(dict_in)
+    assert container0.cont_structural_hash() == container1.cont_structural_hash()
+    assert container0.cont_map(lambda x, _: x).cont_structural_hash() == (
+        container0.cont_structural_hash()
+    )
+    assert Container.cont_identical([container0, container1])
+    assert Container.cont_identical_structure([container0, container1])
+    assert not Container.cont_structural_diff(container0, container1, mode="diff_only")
+    # replacing a leaf with one of the same shape and dtype keeps the hash
+    container1.a = ivy.array([5.0], device=on_device)
+    assert container0.cont_structural_hash() == container1.cont_structural_hash()
+    assert not Container.cont_identical([container0, container1])
+    assert Container.cont_identical_structure([container0, container1])
+    # otherwise the cached hash is invalidated
+    container1.b.c = ivy.array([2, 3], device=on_device)
+    assert container0.cont_structural_hash() != container1.cont_structural_hash()
+    assert not Container.cont_identical_structure([container0, container1])
+    diff = Container.cont_structural_diff(container0, container1, mode="diff_only")
+    assert diff.cont_all_key_chains() == ["b/c/diff_0", "b/c/diff_1"]
+    container1.b.c = ivy.array([[2, 3]], device=on_device)
+    assert container0.cont_structural_hash() == container1.cont_structural_hash()
+    container1.b.e = ivy.array([6], device=on_device)
+    assert container0.cont_structural_hash() != container1.cont_structural_hash()
+    assert not Container.cont_identical_structure([container0, container1])
+
+
 @pytest.mark.parametrize("inplace", [True, False])
 def test_container_map(inplace, on_device):
     # without key_chains specification
@@ -2013,6 +2191,29 @@ def test_container_map(inplace, on_device):
     assert np.allclose(ivy.to_numpy(container_mapped["b"][1]), np.array([4]))
 
 
+@pytest.mark.parametrize("num_workers", [None, 1, 4])
+def test_container_map_num_workers(num_workers, on_device):
+    container = Container(
+        {
+            "a": ivy.ones((128, 128), device=on_device),
+            "b": {
+                "c": ivy.ones((128, 129), device=on_device),
+                "d": ivy.array([3.0], device=on_device),
+            },
+        }
+    )
+    mapped = container.cont_map(lambda x, kc: x * 2, num_workers=num_workers)
+    assert mapped.cont_all_key_chains() == ["a", "b/c", "b/d"]
+    assert mapped.cont_config == container.cont_config
+    assert np.allclose(ivy.to_numpy(mapped.b.c), np.full((128, 129), 2.0))
+    assert np.allclose(ivy.to_numpy(mapped.b.d), np.array([6.0]))
+    summed = Container.cont_multi_map(
+        lambda xs, kc: xs[0] + xs[1], [container, mapped], num_workers=num_workers
+    )
+    assert summed.cont_all_key_chains() == ["a", "b/c", "b/d"]
+    assert np.allclose(ivy.to_numpy(summed.a), np.full((128, 128), 3.0))
+
+
 @pytest.mark.parametrize("inplace", [True, False])
 def test_container_map_sub_conts(inplace, on_device):
     # without key_chains specification
@@ -2546,6 +2747,38 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_from_disk_as_hdf5_lazy(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    container = Container(
+        {
+            "a": ivy.array([[0, 1], [2, 3], [4, 5], [6, 7]], device=on_device),
+            "b": {"c": ivy.array([0.0, 1.0, 2.0, 3.0], device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath)
+
+    # lazy loading
+    loaded_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(1, None), lazy=True
+    )
+    assert loaded_container.a.shape == (3, 2)
+    assert loaded_container.b.c.shape == (3,)
+
+    # only the sliced rows are read
+    loaded_slice = loaded_container[1:3]
+    assert np.array_equal(ivy.to_numpy(loaded_slice.a), np.array([[4, 5], [6, 7]]))
+    assert np.array_equal(ivy.to_numpy(loaded_slice.b.c), np.array([2.0, 3.0]))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c.to_ivy()), np.array([1.0, 2.0, 3.0])
+    )
+    del loaded_container, loaded_slice
+
+    os.remove(save_filepath)
+
+
 def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -2585,6 +2818,36 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize("virtual", [True, False])
+def test_container_shuffle_h5_file_chunked(virtual, on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    container = Container(
+        {
+            "a": ivy.array([[i, i] for i in range(10)], device=on_device),
+            "b": {"c": ivy.arange(10, device=on_device)},
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath)
+
+    # shuffling in chunks smaller than the datasets
+    Container.shuffle_h5_file(save_filepath, 1, chunk_size=3, virtual=virtual)
+    container_shuffled = Container.cont_from_disk_as_hdf5(save_filepath)
+
+    # testing
+    data = np.arange(10)
+    random.seed(1)
+    random.shuffle(data)
+    assert list(container_shuffled.cont_all_key_chains()) == ["a", "b/c"]
+    assert (ivy.to_numpy(container_shuffled.a) == np.stack([data, data], -1)).all()
+    assert (ivy.to_numpy(container_shuffled.b.c) == data).all()
+    assert Container.h5_file_size(save_filepath)[1] == 10
+
+    os.remove(save_filepath)
+
+
 def test_container_pickle(on_device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=on_device),
@@ -2614,6 +2877,38 @@ def test_container_pickle(on_device):
     ivy.Container.cont_identical_configs([cont, cont_again])
 
 
+def test_container_pickle_out_of_band(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {"c": ivy.zeros((2, 2), device=on_device), "d": "string"},
+        }
+    )
+    buffers = list()
+    pickled = pickle.dumps(container, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 2
+    container_again = pickle.loads(pickled, buffers=buffers)
+    assert container_again.cont_all_key_chains() == ["a", "b/c", "b/d"]
+    assert np.array_equal(ivy.to_numpy(container_again.a), np.array([1.0, 2.0]))
+    assert container_again.b.d == "string"
+
+
+def test_container_to_and_from_shared_memory(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {"c": ivy.ones((2, 2), device=on_device), "d": "string"},
+        }
+    )
+    handle = container.cont_to_shared_memory()
+    handle = pickle.loads(pickle.dumps(handle))
+    container_again = Container.cont_from_shared_memory(handle)
+    assert container_again.cont_all_key_chains() == ["a", "b/c", "b/d"]
+    assert np.array_equal(ivy.to_numpy(container_again.b.c), np.ones((2, 2)))
+    assert container_again.b.d == "string"
+    del container_again
+
+
 def test_container_to_and_from_disk_as_pickled(on_device):
     save_filepath = "container_on_disk.pickled"
     dict_in = {
@@ -2642,6 +2937,47 @@ def test_container_to_and_from_disk_as_pickled(on_device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize("mmap", [True, False])
+def test_container_to_and_from_disk_as_binary(mmap, on_device):
+    save_filepath = "container_on_disk.ivyc"
+    dict_in = {
+        "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+        "b": {
+            "c": ivy.array(5, device=on_device),
+            "d": ivy.array([True, False], device=on_device),
+            "e": {},
+            "f": "string",
+        },
+    }
+    container = Container(dict_in)
+
+    # saving
+    container.cont_to_disk_as_binary(save_filepath)
+    assert os.path.exists(save_filepath)
+
+    # loading
+    loaded_container = Container.cont_from_disk_as_binary(save_filepath, mmap=mmap)
+    assert loaded_container.cont_all_key_chains(include_empty=True) == [
+        "a",
+        "b/c",
+        "b/d",
+        "b/e",
+        "b/f",
+    ]
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a))
+    assert loaded_container.b.c.shape == ()
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)
+    )
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.d), ivy.to_numpy(container.b.d)
+    )
+    assert loaded_container.b.f == "string"
+    del loaded_container
+
+    os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_json(on_device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -2874,6 +3210,69 @@ def test_container_from_queues(on_device):
     del container
 
 
+def _queue_worker_fn(idx):
+    return {"a": np.full((idx + 1, 2), float(idx)), "b": {"c": np.arange(idx + 1)}}
+
+
+def test_container_from_worker_fn(on_device):
+    if "gpu" in on_device:
+        # Cannot re-initialize CUDA in forked subprocess. 'spawn'
+        # start method must be used.
+        pytest.skip()
+
+    container = Container.cont_from_worker_fn(
+        _queue_worker_fn,
+        [1, 2, 3],
+        num_workers=2,
+        queue_prefetch=1,
+        queue_cache_size=1,
+        container_combine_method="concat",
+        queue_timeout=10.0,
+    )
+
+    # queue 0, with queue 1 prefetched
+    assert np.allclose(ivy.to_numpy(container[0].a), np.array([0.0, 0.0]))
+    assert 1 in container._queue_futures
+
+    # queues 1 and 2, with queue 0 evicted
+    assert np.allclose(ivy.to_numpy(container[1:3].b.c), np.array([0, 1]))
+    assert np.allclose(ivy.to_numpy(container[5].a), np.array([2.0, 2.0]))
+    assert list(container._loaded_containers_from_queues) == [2]
+
+    del container
+
+
+def test_container_worker_queues_threads(on_device):
+    if "gpu" in on_device:
+        # Cannot re-initialize CUDA in forked subprocess. 'spawn'
+        # start method must be used.
+        pytest.skip()
+
+    def _num_shared_blocks():
+        if not os.path.isdir("/dev/shm"):
+            return 0
+        return len([f for f in os.listdir("/dev/shm") if f.startswith("psm_")])
+
+    num_blocks = _num_shared_blocks()
+    container = Container.cont_from_worker_fn(
+        _queue_worker_fn, [1, 2, 3, 4], num_workers=2, queue_prefetch=0
+    )
+    queues = container._queues
+
+    # items requested from several threads are each received by their thread
+    with ThreadPoolExecutor(3) as executor:
+        rets = list(executor.map(lambda i: queues[i].get(timeout=10), [2, 1, 0]))
+    assert [ret["a"].shape[0] for ret in rets] == [3, 2, 1]
+
+    # items which are produced but never received are released on closing
+    try:
+        queues[3].get(timeout=0.0)
+    except queue.Empty:
+        pass
+    queues.close()
+    assert _num_shared_blocks() == num_blocks
+
+
 def test_container_reduce(on_device):
     container_a = ivy.Container(
         {
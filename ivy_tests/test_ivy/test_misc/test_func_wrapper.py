@@ -20,6 +20,10 @@ def _fn4(x: Union[Sequence[ivy.Array], ivy.Array]):
     return x
 
 
+def _fn8(x: Union[ivy.Array, ivy.NativeArray], /, y: ivy.Array):
+    return x, y
+
+
 @pytest.mark.parametrize(
     ("fn", "x", "expected_type"),
     [
@@ -34,6 +38,27 @@ def test_handle_array_like_without_promotion(fn, x, expected_type):
     assert isinstance(handle_array_like_without_promotion(fn)(x), expected_type)
 
 
+@pytest.mark.parametrize(
+    ("fn", "expected_plan"),
+    [
+        (_fn1, ()),
+        (_fn2, ((0, "x"),)),
+        (_fn3, ()),
+        (_fn4, ()),
+        (_fn8, ((0, None), (1, "y"))),
+    ],
+)
+def test_array_like_plan(fn, expected_plan):
+    assert ivy.func_wrapper._array_like_plan(fn) == expected_plan
+
+
+def test_handle_array_like_without_promotion_keyword():
+    ret_x, ret_y = handle_array_like_without_promotion(_fn8)([1, 2], y=[3, 4])
+    assert isinstance(ret_x, ivy.Array)
+    assert isinstance(ret_y, ivy.Array)
+    assert isinstance(handle_array_like_without_promotion(_fn2)(x=[1, 2]), ivy.Array)
+
+
 def test_outputs_to_ivy_arrays():
     assert isinstance(
         ivy.outputs_to_ivy_arrays(_fn1)(ivy.to_native(ivy.array([2.0]))), ivy.Array
@@ -85,3 +110,52 @@ def test_to_native_arrays_and_back():
 def test_integer_arrays_to_float(x, expected):
     # Todo: Fix dtype issue
     assert ivy.array_equal(ivy.func_wrapper.integer_arrays_to_float(_fn1)(x), expected)
+
+
+@pytest.mark.parametrize(
+    ("fn_name", "args", "kwargs"),
+    [
+        ("add", (ivy.array([1.0, 2.0]), ivy.array([3.0, 4.0])), {}),
+        ("add", (ivy.Container(a=ivy.array([1.0])), 2.0), {}),
+        ("abs", (ivy.array([-1, 2]),), {"out": ivy.array([0, 0])}),
+        ("zeros_like", (ivy.array([1, 2]),), {}),
+        ("full", ((2,), 3.0), {"dtype": "float32"}),
+    ],
+)
+def test_fused_dispatcher(fn_name, args, kwargs):
+    original = ivy.backend_handler.ivy_original_dict[fn_name]
+    backend_fn = ivy.current_backend().__dict__[fn_name]
+    decorators = [
+        attr
+        for attr in ivy.func_wrapper.FN_DECORATORS
+        if hasattr(original, attr) and not hasattr(backend_fn, attr)
+    ]
+    stacked = ivy.func_wrapper._stack_decorators(backend_fn, decorators)
+    fused = ivy.func_wrapper._fused_dispatcher(backend_fn, decorators)
+    for attr in decorators:
+        assert getattr(fused, attr)
+    expected = stacked(*args, **kwargs)
+    ret = fused(*args, **kwargs)
+    assert type(ret) is type(expected)
+    if ivy.is_ivy_container(ret):
+        assert ivy.Container.cont_all_true(ret == expected)
+    else:
+        assert ivy.array_equal(ret, expected)
+        assert ret.dtype == expected.dtype
+
+
+@pytest.mark.parametrize(
+    "nest",
+    [
+        (ivy.array([1.0]), 2),
+        (ivy.Container(a=ivy.array([1.0])),),
+        ([1, (2, ivy.Container(b=3))],),
+        ({"x": [ivy.array([1.0])]},),
+        {"x": {"y": ivy.Container(a=1)}},
+        {"x": 1},
+    ],
+)
+def test_nest_has_container(nest):
+    assert ivy.func_wrapper._nest_has_container(nest) == ivy.nested_any(
+        nest, ivy.is_ivy_container, check_nests=True
+    )
@@ -0,0 +1,70 @@
+"""Collection of tests for Ivy data-parallel module execution."""
+
+# global
+from hypothesis import given, strategies as st
+import numpy as np
+
+# local
+import ivy
+import ivy_tests.test_ivy.helpers as helpers
+
+
+def _loss_fn(module, v, x, y):
+    return ivy.mean((module(x, v=v) - y) ** 2)
+
+
+# data-parallel call
+@given(
+    batch_size=st.integers(min_value=1, max_value=5),
+    num_workers=st.integers(min_value=1, max_value=3),
+)
+def test_data_parallel_call(batch_size, num_workers, on_device):
+    module = ivy.Linear(3, 2, device=on_device)
+    x = ivy.asarray(
+        np.random.uniform(size=(batch_size, 3)).astype("float32"), device=on_device
+    )
+    with ivy.DataParallel(module, num_workers=num_workers) as data_parallel:
+        assert data_parallel.devices == ["cpu:{}".format(i) for i in range(num_workers)]
+        helpers.assert_all_close(
+            ivy.to_numpy(data_parallel(x)), ivy.to_numpy(module(x)), rtol=1e-4
+        )
+        # updated variables are broadcast to the workers
+        module.v = module.v * 2
+        helpers.assert_all_close(
+            ivy.to_numpy(data_parallel(x)), ivy.to_numpy(module(x)), rtol=1e-4
+        )
+
+
+# data-parallel gradients
+@given(
+    batch_size=st.integers(min_value=1, max_value=5),
+    num_workers=st.integers(min_value=1, max_value=3),
+)
+def test_data_parallel_execute_with_gradients(batch_size, num_workers, on_device):
+    module = ivy.Linear(3, 2, device=on_device)
+    x = ivy.asarray(
+        np.random.uniform(size=(batch_size, 3)).astype("float32"), device=on_device
+    )
+    y = ivy.asarray(
+        np.random.uniform(size=(batch_size, 2)).astype("float32"), device=on_device
+    )
+    with ivy.DataParallel(
+        module, loss_fn=_loss_fn, num_workers=num_workers
+    ) as data_parallel:
+        loss, grads = data_parallel.execute_with_gradients(x, y)
+    loss_true, grads_true = ivy.execute_with_gradients(
+        lambda v: _loss_fn(module, v, x, y), module.v
+    )
+    helpers.assert_all_close(ivy.to_numpy(loss), ivy.to_numpy(loss_true), rtol=1e-4)
+    if ivy.current_backend_str() == "numpy":
+        # NumPy does not support gradients
+        assert grads is None
+        return
+    assert ivy.Container.cont_all_true(
+        ivy.Container.cont_multi_map(
+            lambda xs, _: np.allclose(
+                ivy.to_numpy(xs[0]), ivy.to_numpy(xs[1]), rtol=1e-4, atol=1e-6
+            ),
+            [grads, grads_true],
+        )
+    )
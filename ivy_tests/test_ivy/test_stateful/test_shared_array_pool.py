@@ -0,0 +1,67 @@
+"""Collection of tests for Ivy's shared-memory array pool."""
+
+# global
+import gc
+import numpy as np
+import pytest
+
+# local
+import ivy
+
+
+def _shared_array_pool_worker(pool, handles, out_queue):
+    handle = handles.get()
+    x = pool.view(handle)
+    pool.release(handle)
+    x[...] = x * 2
+    out_queue.put(pool.from_array(ivy.array([5, 6], dtype="int32")))
+
+
+def test_shared_array_pool():
+    pool = ivy.SharedArrayPool()
+    handle = pool.from_array(ivy.array([1.0, 2.0, 3.0]))
+    x = pool.view(handle)
+    assert pool.refcount(handle) == 2
+
+    # the worker writes through a view of the array, and allocates another one
+    handles = ivy.multiprocessing().Queue()
+    output_queue = ivy.multiprocessing().Queue()
+    worker = ivy.multiprocessing().Process(
+        target=_shared_array_pool_worker, args=(pool, handles, output_queue)
+    )
+    worker.start()
+    pool.incref(handle)
+    handles.put(handle)
+    worker_handle = output_queue.get(timeout=60)
+    worker.join()
+    assert worker.exitcode == 0
+    assert np.allclose(ivy.to_numpy(x), [2.0, 4.0, 6.0])
+    assert pool.refcount(handle) == 2
+    y = pool.view(worker_handle)
+    pool.release(worker_handle)
+    assert np.array_equal(ivy.to_numpy(y), [5, 6])
+    assert pool.refcount(worker_handle) == 1
+
+    # the segments are unlinked once the last views are released
+    pool.release(handle)
+    assert pool.refcount(handle) == 1
+    del x, y
+    gc.collect()
+    assert pool.refcount(handle) == 0
+    assert pool.refcount(worker_handle) == 0
+    with pytest.raises(ivy.exceptions.IvyException):
+        pool.view(handle)
+    pool.close()
+
+
+def test_shared_array_pool_without_backend():
+    ivy.clear_backend_stack()
+    with ivy.SharedArrayPool() as pool:
+        handle = pool.from_array(ivy.array([1.0, 2.0, 3.0]))
+        x = pool.view(handle)
+        # the views share the memory of the segment with the implicit backend
+        x[...] = x + 1
+        y = pool.view(handle)
+        pool.release(handle)
+        assert np.allclose(ivy.to_numpy(y), [2.0, 3.0, 4.0])
+        assert pool.refcount(handle) == 2